@@ -0,0 +1,88 @@
+"""Benchmark fused Cython fit statistic kernels against the Numpy expressions.
+
+Run with ``python dev/benchmarks/fit_statistics.py``.
+"""
+import timeit
+import numpy as np
+from gammapy.stats import (
+    cash,
+    cash_sum_cython,
+    cstat,
+    cstat_sum_cython,
+    wstat,
+    wstat_sum_cython,
+)
+
+SHAPES = [(10, 100, 100), (20, 400, 400), (50, 500, 500)]
+NUMBER = 5
+
+
+def make_data(shape, random_state=0):
+    rng = np.random.RandomState(random_state)
+    data = {
+        "n_on": rng.poisson(5, shape).astype(float),
+        "n_off": rng.poisson(20, shape).astype(float),
+        "alpha": rng.uniform(0.05, 0.5, shape),
+        "mu_sig": rng.uniform(0, 5, shape),
+        "mask": rng.uniform(size=shape) > 0.1,
+    }
+    return data
+
+
+def numpy_wstat(n_on, n_off, alpha, mu_sig, mask):
+    stat = wstat(n_on=n_on, n_off=n_off, alpha=alpha, mu_sig=mu_sig)
+    return np.nan_to_num(stat)[mask].sum()
+
+
+def cython_wstat(n_on, n_off, alpha, mu_sig, mask):
+    return wstat_sum_cython(
+        n_on.ravel(), n_off.ravel(), alpha.ravel(), mu_sig.ravel(), mask.ravel()
+    )
+
+
+def numpy_cstat(n_on, mu_sig, mask, **kwargs):
+    return cstat(n_on, mu_sig)[mask].sum()
+
+
+def cython_cstat(n_on, mu_sig, mask, **kwargs):
+    return cstat_sum_cython(n_on.ravel(), mu_sig.ravel(), mask.ravel())
+
+
+def numpy_cash(n_on, mu_sig, mask, **kwargs):
+    return cash(n_on, mu_sig)[mask].sum()
+
+
+def cython_cash(n_on, mu_sig, mask, **kwargs):
+    return cash_sum_cython(n_on.ravel(), mu_sig.ravel(), mask.ravel())
+
+
+def main():
+    pairs = {
+        "wstat": (numpy_wstat, cython_wstat),
+        "cstat": (numpy_cstat, cython_cstat),
+        "cash": (numpy_cash, cython_cash),
+    }
+
+    print(f"{'stat':<8}{'shape':<18}{'numpy [ms]':>12}{'cython [ms]':>14}{'speedup':>10}")
+
+    for shape in SHAPES:
+        data = make_data(shape)
+
+        for name, (func_numpy, func_cython) in pairs.items():
+            np.testing.assert_allclose(
+                func_numpy(**data), func_cython(**data), rtol=1e-6
+            )
+
+            t_numpy = timeit.timeit(lambda: func_numpy(**data), number=NUMBER)
+            t_cython = timeit.timeit(lambda: func_cython(**data), number=NUMBER)
+
+            t_numpy, t_cython = 1e3 * t_numpy / NUMBER, 1e3 * t_cython / NUMBER
+            print(
+                f"{name:<8}{str(shape):<18}{t_numpy:>12.1f}{t_cython:>14.1f}"
+                f"{t_numpy / t_cython:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    with np.errstate(all="ignore"):
+        main()
@@ -3,6 +3,7 @@
 import logging
 from astropy.coordinates import SkyCoord
 from astropy.table import Table
+from astropy.time import Time
 from regions import CircleSkyRegion
 from gammapy.analysis.config import AnalysisConfig
 from gammapy.data import DataStore
@@ -99,6 +100,9 @@ class Analysis:
             path = make_path(observations_settings.obs_file)
             ids = list(Table.read(path, format="ascii", data_start=0).columns[0])
 
+        obs_table = self.datastore.obs_table
+        selection = []
+
         if observations_settings.obs_cone.lon is not None:
             cone = dict(
                 type="sky_circle",
@@ -108,8 +112,27 @@ class Analysis:
                 radius=observations_settings.obs_cone.radius,
                 border="0 deg",
             )
-            selected_cone = self.datastore.obs_table.select_observations(cone)
-            ids = list(set(ids) & set(selected_cone["OBS_ID"].tolist()))
+            selection.append(cone)
+
+        # the time pre-selection requires the start and stop times of the
+        # observations and the time reference in the index table
+        has_times = {"TSTART", "TSTOP"}.issubset(obs_table.colnames)
+        has_times &= {"MJDREFI", "MJDREFF"}.issubset(obs_table.meta)
+
+        if observations_settings.obs_time.start is not None and has_times:
+            # pre-select overlapping observations from the index table
+            start = observations_settings.obs_time.start
+            stop = observations_settings.obs_time.stop
+            time_range = Time([start, stop])
+            selection.append(
+                dict(type="time_box", time_range=time_range, partial_overlap=True)
+            )
+
+        if selection:
+            selected = obs_table.select_observations(selection)
+            selected_ids = set(selected["OBS_ID"].tolist())
+            ids = [obs_id for obs_id in ids if obs_id in selected_ids]
+
         self.observations = self.datastore.get_observations(ids, skip_missing=True)
         if observations_settings.obs_time.start is not None:
             start = observations_settings.obs_time.start
@@ -4,9 +4,12 @@ import pytest
 from numpy.testing import assert_allclose
 import astropy.units as u
 from astropy.coordinates import SkyCoord
+from astropy.io import fits
+from astropy.table import Table
 from regions import CircleSkyRegion
 from pydantic.error_wrappers import ValidationError
 from gammapy.analysis import Analysis, AnalysisConfig
+from gammapy.data import DataStore
 from gammapy.datasets import MapDataset, SpectrumDatasetOnOff
 from gammapy.maps import Map, WcsNDMap
 from gammapy.modeling.models import Models
@@ -119,6 +122,79 @@ def test_get_observations_obs_time(tmp_path):
         analysis.get_observations()
 
 
+def make_events_datastore(path, time_columns=True):
+    """Data store with one event per observation, observations 1, 2 and 3
+    start 0, 1000 and 2000 s after the reference time 2000-01-01T12:00:00 TT.
+    """
+    filenames = []
+    for obs_id in [1, 2, 3]:
+        tstart = (obs_id - 1) * 1000.0
+        meta = dict(
+            OBS_ID=obs_id,
+            RA_PNT=83.6,
+            DEC_PNT=22.0,
+            ALT_PNT=70.0,
+            AZ_PNT=0.0,
+            ONTIME=100.0,
+            LIVETIME=100.0,
+            DEADC=1.0,
+            TSTART=tstart,
+            TSTOP=tstart + 100,
+            MJDREFI=51544,
+            MJDREFF=0.5,
+            TIMESYS="TT",
+            TIMEUNIT="s",
+        )
+        events = Table(meta=meta)
+        events["EVENT_ID"] = [1]
+        events["TIME"] = [tstart + 50]
+        events["RA"], events["DEC"], events["ENERGY"] = [83.6], [22.0], [1.0]
+
+        gti = Table(meta=meta)
+        gti["START"], gti["STOP"] = [tstart], [tstart + 100]
+
+        hdu_events = fits.table_to_hdu(events)
+        hdu_events.name = "EVENTS"
+        hdu_gti = fits.table_to_hdu(gti)
+        hdu_gti.name = "GTI"
+
+        filename = path / f"events_{obs_id}.fits"
+        fits.HDUList([fits.PrimaryHDU(), hdu_events, hdu_gti]).writeto(filename)
+        filenames.append(filename)
+
+    datastore = DataStore.from_events_files(filenames)
+
+    if not time_columns:
+        datastore.obs_table.remove_columns(["TSTART", "TSTOP"])
+
+    datastore.hdu_table.write(path / "hdu-index.fits.gz")
+    datastore.obs_table.write(path / "obs-index.fits.gz")
+
+
+@pytest.mark.parametrize("time_columns", [True, False])
+def test_get_observations_obs_time_index(tmp_path, time_columns):
+    make_events_datastore(tmp_path, time_columns=time_columns)
+
+    config = AnalysisConfig()
+    analysis = Analysis(config)
+    analysis.config.observations.datastore = tmp_path
+    analysis.config.observations.obs_ids = [3, 1, 2]
+    analysis.config.observations.obs_cone = {
+        "frame": "icrs",
+        "lon": "83.6d",
+        "lat": "22d",
+        "radius": "1d",
+    }
+    analysis.config.observations.obs_time = {
+        "start": "2000-01-01T12:10:00",
+        "stop": "2000-01-01T12:40:00",
+    }
+    analysis.get_observations()
+
+    # the order of the given observation ids is kept
+    assert [obs.obs_id for obs in analysis.observations] == [3, 2]
+
+
 @requires_data()
 def test_set_models():
     config = get_example_config("1d")
@@ -1,9 +1,14 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Source catalog and object base classes."""
 import abc
+import copy
 import numbers
+import numpy as np
 from astropy.coordinates import SkyCoord
+from astropy.units import Quantity
 from astropy.utils import lazyproperty
+from gammapy.modeling.models import Models
+from gammapy.utils.coordinates import SkyCoordIndex
 from gammapy.utils.table import table_from_row_data, table_row_to_dict
 
 __all__ = ["SourceCatalog", "SourceCatalogObject"]
@@ -16,6 +21,82 @@ class Bunch(dict):
         self.__dict__.update(kw)
 
 
+class _TableRowBunch(Bunch):
+    """Bunch for one table row, converting the column values on first access.
+
+    Parameters
+    ----------
+    columns : dict
+        Column values and units, indexed by column name.
+    index : int
+        Index of the row in the columns.
+    """
+
+    def __init__(self, columns, index):
+        dict.__init__(self)
+        self._columns = columns
+        self._index = index
+        self._converted = False
+
+    def __missing__(self, key):
+        values, unit = self._columns[key]
+        value = values[self._index]
+
+        if unit:
+            value = Quantity(value, unit=unit)
+
+        self[key] = value
+        return value
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self._columns
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def _convert_all(self):
+        if self._converted:
+            return
+
+        # keep the column order of the table
+        data = {key: self[key] for key in self._columns}
+        data.update(dict.items(self))
+        dict.clear(self)
+        dict.update(self, data)
+        self._converted = True
+
+    def keys(self):
+        self._convert_all()
+        return dict.keys(self)
+
+    def values(self):
+        self._convert_all()
+        return dict.values(self)
+
+    def items(self):
+        self._convert_all()
+        return dict.items(self)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        self._convert_all()
+        return dict.__len__(self)
+
+    def __repr__(self):
+        self._convert_all()
+        return dict.__repr__(self)
+
+
 class SourceCatalogObject:
     """Source catalog object.
 
@@ -35,7 +116,7 @@ class SourceCatalogObject:
     _row_index_key = "_row_index"
 
     def __init__(self, data, data_extended=None):
-        self.data = Bunch(**data)
+        self.data = data if isinstance(data, Bunch) else Bunch(**data)
         if data_extended:
             self.data_extended = Bunch(**data_extended)
 
@@ -188,7 +269,59 @@ class SourceCatalog(abc.ABC):
         """
         data = table_row_to_dict(self.table[index])
         data[SourceCatalogObject._row_index_key] = index
+        return self._source_object_from_data(data)
+
+    def _make_source_objects(self, indices):
+        """Make source objects for many rows.
+
+        The table columns are prepared once for all rows and the values
+        are only converted to quantities when they are accessed, instead
+        of converting every row completely.
+
+        Parameters
+        ----------
+        indices : `~numpy.ndarray`
+            Row indices
+
+        Returns
+        -------
+        sources : list of `SourceCatalogObject`
+            Source objects
+        """
+        table = self.table[indices]
+
+        columns = {}
+        for name, col in table.columns.items():
+            if col.unit:
+                # masked values become zero, as for the row by row conversion
+                columns[name] = np.ma.filled(col, 0), col.unit
+            else:
+                columns[name] = col, None
+
+        row_index = [int(_) for _ in indices]
+        columns[SourceCatalogObject._row_index_key] = row_index, None
+
+        return [
+            self._source_object_from_data(_TableRowBunch(columns, idx))
+            for idx in range(len(row_index))
+        ]
+
+    def _source_object_from_data(self, data):
+        """Make one source object from the row data.
+
+        Parameters
+        ----------
+        data : dict
+            Row data
+
+        Returns
+        -------
+        source : `SourceCatalogObject`
+            Source object
+        """
+        return self.source_object_class(data, self._get_data_extended(data))
 
+    def _get_data_extended(self, data):
         if "Extended_Source_Name" in data:
             name_extended = data["Extended_Source_Name"].strip()
         elif "Source_Name" in data:
@@ -201,8 +334,45 @@ class SourceCatalog(abc.ABC):
         except (KeyError, AttributeError):
             data_extended = None
 
-        source = self.source_object_class(data, data_extended)
-        return source
+        return data_extended
+
+    def to_models(self, mask=None, **kwargs):
+        """Create models for the catalog sources.
+
+        The table columns are prepared once for all sources and only the
+        values used by the models are converted. Spatial templates of
+        extended sources are only read on first use and shared between
+        models using the same file.
+
+        Parameters
+        ----------
+        mask : `~numpy.ndarray`
+            Boolean mask or row indices of the sources to convert.
+            By default all sources are converted.
+        **kwargs : dict
+            Keyword arguments passed to the ``sky_model()`` method
+            of the source objects.
+
+        Returns
+        -------
+        models : `~gammapy.modeling.models.Models`
+            Models of the selected sources.
+        """
+        indices = np.arange(len(self.table))
+
+        if mask is not None:
+            indices = indices[mask]
+
+        models = []
+        for source in self._make_source_objects(indices):
+            model = source.sky_model(**kwargs)
+
+            if isinstance(model, Models):
+                models.extend(model)
+            else:
+                models.append(model)
+
+        return Models(models)
 
     @lazyproperty
     def _lookup_extended_source_idx(self):
@@ -215,6 +385,68 @@ class SourceCatalog(abc.ABC):
         """Source positions (`~astropy.coordinates.SkyCoord`)."""
         return _skycoord_from_table(self.table)
 
+    @lazyproperty
+    def _spatial_index(self):
+        return SkyCoordIndex(self.positions)
+
+    def _select_rows(self, idx):
+        """Sub-catalog with the given rows.
+
+        Parameters
+        ----------
+        idx : `~numpy.ndarray`
+            Row indices or boolean row mask.
+
+        Returns
+        -------
+        catalog : `SourceCatalog`
+            Sub-catalog
+        """
+        catalog = copy.copy(self)
+        catalog.table = self.table[np.asarray(idx)]
+
+        for name in ["_name_to_index_cache", "_spatial_index"]:
+            catalog.__dict__.pop(name, None)
+
+        return catalog
+
+    def query_cone(self, position, radius):
+        """Select sources within a cone.
+
+        The query uses a spatial index, which is built once on first
+        use, so that repeated queries on the same catalog are fast.
+
+        Parameters
+        ----------
+        position : `~astropy.coordinates.SkyCoord`
+            Center position of the cone.
+        radius : `~astropy.coordinates.Angle`
+            Radius of the cone.
+
+        Returns
+        -------
+        catalog : `SourceCatalog`
+            Sub-catalog with the sources within the cone.
+        """
+        idx = self._spatial_index.query_cone(position, radius)
+        return self._select_rows(idx)
+
+    def query_region(self, region):
+        """Select sources with a position within a sky region.
+
+        Parameters
+        ----------
+        region : `~regions.SkyRegion`
+            Sky region.
+
+        Returns
+        -------
+        catalog : `SourceCatalog`
+            Sub-catalog with the sources within the region.
+        """
+        idx = self._spatial_index.query_region(region)
+        return self._select_rows(idx)
+
 
 def _skycoord_from_table(table):
     keys = table.colnames
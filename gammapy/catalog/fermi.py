@@ -6,7 +6,6 @@ import numpy as np
 import astropy.units as u
 from astropy.table import Column, Table
 from astropy.time import Time
-from astropy.wcs import FITSFixedWarning
 from gammapy.estimators import FluxPoints, LightCurve
 from gammapy.modeling.models import (
     DiskSpatialModel,
@@ -356,9 +355,7 @@ class SourceCatalogObject4FGL(SourceCatalogObjectFermiBase):
                 path = make_path(
                     "$GAMMAPY_DATA/catalogs/fermi/LAT_extended_sources_8years/Templates/"
                 )
-                with warnings.catch_warnings():  # ignore FITS units warnings
-                    warnings.simplefilter("ignore", FITSFixedWarning)
-                    model = TemplateSpatialModel.read(path / filename)
+                model = TemplateSpatialModel.read(path / filename, lazy=True)
             elif morph_type == "2D Gaussian":
                 model = GaussianSpatialModel(
                     lon_0=ra, lat_0=dec, sigma=sigma, e=e, phi=phi, frame="icrs"
@@ -716,7 +713,7 @@ class SourceCatalogObject3FGL(SourceCatalogObjectFermiBase):
                 path = make_path(
                     "$GAMMAPY_DATA/catalogs/fermi/Extended_archive_v15/Templates/"
                 )
-                model = TemplateSpatialModel.read(path / filename)
+                model = TemplateSpatialModel.read(path / filename, lazy=True)
             elif morph_type == "2D Gaussian":
                 model = GaussianSpatialModel(
                     lon_0=ra, lat_0=dec, sigma=sigma, e=e, phi=phi, frame="icrs"
@@ -890,7 +887,7 @@ class SourceCatalogObject2FHL(SourceCatalogObjectFermiBase):
                 path = make_path(
                     "$GAMMAPY_DATA/catalogs/fermi/Extended_archive_v15/Templates/"
                 )
-                return TemplateSpatialModel.read(path / filename)
+                return TemplateSpatialModel.read(path / filename, lazy=True)
             elif morph_type in ["2D Gaussian", "Elliptical 2D Gaussian"]:
                 model = GaussianSpatialModel(
                     lon_0=ra, lat_0=dec, sigma=sigma, e=e, phi=phi, frame="icrs"
@@ -1155,7 +1152,7 @@ class SourceCatalogObject3FHL(SourceCatalogObjectFermiBase):
                 path = make_path(
                     "$GAMMAPY_DATA/catalogs/fermi/Extended_archive_v18/Templates/"
                 )
-                model = TemplateSpatialModel.read(path / filename)
+                model = TemplateSpatialModel.read(path / filename, lazy=True)
             elif morph_type == "RadialGauss":
                 model = GaussianSpatialModel(
                     lon_0=ra, lat_0=dec, sigma=sigma, e=e, phi=phi, frame="icrs"
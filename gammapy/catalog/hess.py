@@ -658,9 +658,9 @@ class SourceCatalogHGPS(SourceCatalog):
         """Large scale component model (`~gammapy.catalog.SourceCatalogLargeScaleHGPS`)."""
         return SourceCatalogLargeScaleHGPS(self.table_large_scale_component)
 
-    def _make_source_object(self, index):
-        """Make `SourceCatalogObject` for given row index"""
-        source = super()._make_source_object(index)
+    def _source_object_from_data(self, data):
+        """Make `SourceCatalogObject` for given row data"""
+        source = super()._source_object_from_data(data)
 
         if source.data["Components"] != "":
             source.components = list(self._get_gaussian_components(source))
@@ -2,8 +2,11 @@
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
+from astropy import units as u
+from astropy.coordinates import SkyCoord
 from astropy.table import Column, Table
 from astropy.units import Quantity
+from regions import CircleSkyRegion
 from gammapy.catalog import SourceCatalog
 from gammapy.utils.testing import assert_quantity_allclose
 
@@ -73,6 +76,26 @@ class TestSourceCatalog:
         positions = self.cat.positions
         assert len(positions) == 3
 
+    def test_query_cone(self):
+        position = SkyCoord(43.3, 2, unit="deg")
+
+        cat = self.cat.query_cone(position, 1.5 * u.deg)
+        assert isinstance(cat, SomeSourceCatalog)
+        assert list(cat.table["Source_Name"]) == ["a", "bb", "ccc"]
+
+        cat = self.cat.query_cone(position, 1 * u.deg)
+        assert list(cat.table["Source_Name"]) == ["bb"]
+        assert cat["bb"].row_index == 0
+        assert len(self.cat.table) == 3
+
+        cat = self.cat.query_cone(position.galactic, 0.1 * u.deg)
+        assert list(cat.table["Source_Name"]) == ["bb"]
+
+    def test_query_region(self):
+        region = CircleSkyRegion(SkyCoord(44, 2.5, unit="deg"), 1 * u.deg)
+        cat = self.cat.query_region(region)
+        assert list(cat.table["Source_Name"]) == ["bb", "ccc"]
+
 
 class TestSourceCatalogObject:
     def setup(self):
@@ -595,3 +595,22 @@ class TestSourceCatalog3FHL:
     def test_extended_sources(self):
         table = self.cat.extended_sources_table
         assert len(table) == 55
+
+    def test_to_models(self):
+        models = self.cat.to_models(mask=[352])
+        ref = self.cat[352].sky_model()
+        assert models.names == [ref.name]
+        assert_allclose(
+            [_.value for _ in models.parameters], [_.value for _ in ref.parameters]
+        )
+
+        names = self.cat.table["Extended_Source_Name"]
+        mask = np.array([_.strip() != "" for _ in names])
+        models = self.cat.to_models(mask=mask)
+        assert len(models) == mask.sum()
+
+        templates = [_ for _ in models if "TemplateSpatialModel" in _.spatial_model.tag]
+        assert templates[0].spatial_model._map is None
+
+        other = self.cat[templates[0].name].sky_model()
+        assert other.spatial_model.map is templates[0].spatial_model.map
@@ -60,6 +60,15 @@ class TestSourceCatalogHGPS:
     def test_large_scale_component(cat):
         assert isinstance(cat.large_scale_component, SourceCatalogLargeScaleHGPS)
 
+    @staticmethod
+    def test_to_models(cat):
+        models = cat.to_models(mask=[54, 33])
+        assert len(models) == 4
+        assert models[3].name == "HESS J1713-397"
+        p = models[0].parameters
+        assert_allclose(p["amplitude"].value, 1.8952104218765842e-11)
+        assert_allclose(p["sigma"].value, 0.47650089859962463)
+
 
 @requires_data()
 class TestSourceCatalogObjectHGPS:
@@ -1,9 +1,12 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import numpy as np
 from astropy.coordinates import SkyCoord
 from astropy.io import fits
+from astropy.table import vstack
 from gammapy.utils.scripts import make_path
 from gammapy.utils.table import table_row_to_dict
 from gammapy.utils.testing import Checker
@@ -128,10 +131,11 @@ class DataStore:
         return cls(hdu_table=hdu_table, obs_table=obs_table)
 
     @classmethod
-    def from_events_files(cls, paths):
+    def from_events_files(cls, paths, n_jobs=None, data_store=None):
         """Create from a list of event filenames.
 
         HDU and observation index tables will be created from the EVENTS header.
+        Only the headers of the files are read.
 
         IRFs are found only if you have a ``CALDB`` environment variable set,
         and if the EVENTS files contain the following keys:
@@ -174,8 +178,28 @@ class DataStore:
 
             data_store.hdu_table.write("hdu-index.fits.gz")
             data_store.obs_table.write("obs-index.fits.gz")
+
+        To add new or modified events files to existing index files, pass the
+        existing data store. The index rows of the unmodified files are kept::
+
+            data_store = DataStore.from_dir("path/to/index")
+            data_store = DataStore.from_events_files(paths, data_store=data_store)
+
+        Parameters
+        ----------
+        paths : list of str or `~pathlib.Path`
+            Events filenames.
+        n_jobs : int
+            Number of threads used to read the events headers.
+        data_store : `DataStore`
+            Existing data store to update.
+
+        Returns
+        -------
+        data_store : `DataStore`
+            Data store
         """
-        return DataStoreMaker(paths).run()
+        return DataStoreMaker(paths, n_jobs=n_jobs).run(data_store=data_store)
 
     def info(self, show=True):
         """Print some info."""
@@ -396,22 +420,112 @@ class DataStoreMaker:
 
     This is a multi-step process coded as a class.
     Users will usually call this via `DataStore.from_events_files`.
+
+    Only the EVENTS header of the files is read. The time range is read
+    from the TIME column only if it is missing in the header.
+
+    Parameters
+    ----------
+    paths : list of str or `~pathlib.Path`
+        Events filenames.
+    n_jobs : int
+        Number of threads used to read the events headers.
     """
 
-    def __init__(self, paths):
+    def __init__(self, paths, n_jobs=None):
         if isinstance(paths, (str, Path)):
             raise TypeError("Need list of paths, not a single string or Path object.")
 
         self.paths = [make_path(path) for path in paths]
+        self.n_jobs = n_jobs
 
         # Cache for EVENTS file header information, to avoid multiple reads
         self._events_info = {}
 
-    def run(self):
-        hdu_table = self.make_hdu_table()
-        obs_table = self.make_obs_table()
+    def run(self, data_store=None):
+        """Create the data store.
+
+        Parameters
+        ----------
+        data_store : `DataStore`
+            Existing data store. If given, only the files not yet in its
+            index tables, or modified since, are read and their rows added
+            or replaced. All other rows are kept.
+
+        Returns
+        -------
+        data_store : `DataStore`
+            Data store
+        """
+        if data_store is None:
+            self.read_all_events_info(self.paths)
+            hdu_table = self.make_hdu_table()
+            obs_table = self.make_obs_table()
+            return DataStore(hdu_table=hdu_table, obs_table=obs_table)
+
+        return self._update(data_store)
+
+    def _update(self, data_store):
+        """Add new or modified files to an existing data store"""
+        obs_table, hdu_table = data_store.obs_table, data_store.hdu_table
+        indexed = {}
+
+        if {"EVENTS_FILENAME", "EVENTS_MTIME"}.issubset(obs_table.colnames):
+            for filename, mtime in obs_table["EVENTS_FILENAME", "EVENTS_MTIME"]:
+                indexed[filename.strip()] = mtime
+
+        paths = [
+            path
+            for path in self.paths
+            if indexed.get(str(path)) != self.get_events_mtime(path)
+        ]
+
+        if len(paths) == 0:
+            return data_store
+
+        self.read_all_events_info(paths)
+        new_obs_table = self.make_obs_table(paths)
+        new_hdu_table = self.make_hdu_table(paths)
+
+        # drop the rows of the modified files, and of re-used observation ids
+        obs_ids = set(new_obs_table["OBS_ID"])
+
+        if "EVENTS_FILENAME" in obs_table.colnames:
+            filenames = {str(path) for path in paths}
+            for row in obs_table:
+                if row["EVENTS_FILENAME"].strip() in filenames:
+                    obs_ids.add(row["OBS_ID"])
+
+        obs_ids = list(obs_ids)
+        obs_table = obs_table[~np.isin(obs_table["OBS_ID"], obs_ids)]
+        hdu_table = hdu_table[~np.isin(hdu_table["OBS_ID"], obs_ids)]
+
+        obs_table = vstack([obs_table, new_obs_table], metadata_conflicts="silent")
+        hdu_table = vstack([hdu_table, new_hdu_table], metadata_conflicts="silent")
+
+        # keep the meta data of the existing tables, e.g. the base directory
+        obs_table.meta = data_store.obs_table.meta.copy()
+        hdu_table.meta = data_store.hdu_table.meta.copy()
         return DataStore(hdu_table=hdu_table, obs_table=obs_table)
 
+    def read_all_events_info(self, paths):
+        """Read the events info of several files, in parallel if ``n_jobs`` is set.
+
+        Parameters
+        ----------
+        paths : list of `~pathlib.Path`
+            Events filenames.
+        """
+        paths = [path for path in paths if path not in self._events_info]
+
+        if self.n_jobs is None:
+            infos = map(self.read_events_info, paths)
+        else:
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                infos = list(executor.map(self.read_events_info, paths))
+
+        self._events_info.update(zip(paths, infos))
+
     def get_events_info(self, path):
         if path not in self._events_info:
             self._events_info[path] = self.read_events_info(path)
@@ -423,10 +537,38 @@ class DataStoreMaker:
         return self.get_events_info(path)
 
     @staticmethod
-    def read_events_info(path):
+    def get_events_mtime(path):
+        """Modification time of the events file, used to detect modified files"""
+        return Path(path).stat().st_mtime
+
+    @staticmethod
+    def read_column_range(path, column, hdu="EVENTS"):
+        """Read the minimum and maximum value of a column.
+
+        The file is memory mapped, so only the column is read.
+
+        Parameters
+        ----------
+        path : `~pathlib.Path`
+            Filename.
+        column : str
+            Column name.
+        hdu : str
+            HDU name.
+
+        Returns
+        -------
+        min, max : float
+            Minimum and maximum value.
+        """
+        with fits.open(path, memmap=True) as hdu_list:
+            data = hdu_list[hdu].data[column]
+            return float(np.min(data)), float(np.max(data))
+
+    @classmethod
+    def read_events_info(cls, path):
         log.debug(f"Reading {path}")
-        with fits.open(path, memmap=False) as hdu_list:
-            header = hdu_list["EVENTS"].header
+        header = fits.getheader(path, extname="EVENTS", memmap=False)
 
         na_int, na_str = -1, "NOT AVAILABLE"
 
@@ -444,8 +586,13 @@ class DataStoreMaker:
         info["ONTIME"] = header["ONTIME"]
         info["LIVETIME"] = header["LIVETIME"]
         info["DEADC"] = header["DEADC"]
-        info["TSTART"] = header["TSTART"]
-        info["TSTOP"] = header["TSTOP"]
+
+        if "TSTART" in header and "TSTOP" in header:
+            info["TSTART"] = header["TSTART"]
+            info["TSTOP"] = header["TSTOP"]
+        else:
+            info["TSTART"], info["TSTOP"] = cls.read_column_range(path, "TIME")
+
         info["DATE-OBS"] = header.get("DATE_OBS", na_str)
         info["TIME-OBS"] = header.get("TIME_OBS", na_str)
         info["DATE-END"] = header.get("DATE_END", na_str)
@@ -461,6 +608,7 @@ class DataStoreMaker:
         # Not part of the spec, but good to know from which file the info comes
         info["EVENTS_FILENAME"] = str(path)
         info["EVENT_COUNT"] = header["NAXIS2"]
+        info["EVENTS_MTIME"] = cls.get_events_mtime(path)
 
         # gti = Table.read(filename, hdu='GTI')
         # info['GTI_START'] = gti['START'][0]
@@ -468,9 +616,12 @@ class DataStoreMaker:
 
         return info
 
-    def make_obs_table(self):
+    def make_obs_table(self, paths=None):
+        if paths is None:
+            paths = self.paths
+
         rows = []
-        for path in self.paths:
+        for path in paths:
             row = self.get_obs_info(path)
             rows.append(row)
 
@@ -508,9 +659,12 @@ class DataStoreMaker:
 
         return table
 
-    def make_hdu_table(self):
+    def make_hdu_table(self, paths=None):
+        if paths is None:
+            paths = self.paths
+
         rows = []
-        for path in self.paths:
+        for path in paths:
             rows.extend(self.get_hdu_table_rows(path))
 
         names = list(rows[0].keys())
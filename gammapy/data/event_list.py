@@ -1,8 +1,9 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import collections
 import logging
+from functools import lru_cache
 import numpy as np
-from astropy.coordinates import AltAz, Angle, SkyCoord
+from astropy.coordinates import AltAz, Angle, CartesianRepresentation, SkyCoord
 from astropy.coordinates.angle_utilities import angular_separation
 from astropy.table import Table
 from astropy.table import vstack as vstack_tables
@@ -18,6 +19,40 @@ __all__ = ["EventList"]
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_frame_rotation_matrix(frame, frame_out):
+    """Rotation matrix between two sky frames, computed from the unit vectors."""
+    unit_vectors = SkyCoord(CartesianRepresentation(np.eye(3)), frame=frame)
+    return unit_vectors.transform_to(frame_out).cartesian.xyz.value
+
+
+def _lonlat_to_frame(lon, lat, frame, frame_out):
+    """Transform lon / lat arrays in deg between two non-rotating sky frames.
+
+    Parameters
+    ----------
+    lon, lat : `~numpy.ndarray`
+        Longitude and latitude in deg.
+    frame, frame_out : {"icrs", "galactic"}
+        Input and output frame.
+
+    Returns
+    -------
+    lon, lat : `~numpy.ndarray`
+        Longitude and latitude in deg, in the output frame.
+    """
+    if frame_out is None or frame_out == frame:
+        return lon, lat
+
+    lon, lat = np.deg2rad(lon), np.deg2rad(lat)
+    xyz = np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+    x, y, z = _get_frame_rotation_matrix(frame, frame_out) @ xyz
+
+    lon = np.rad2deg(np.arctan2(y, x)) % 360
+    lat = np.rad2deg(np.arctan2(z, np.hypot(x, y)))
+    return lon, lat
+
+
 class EventList:
     """Event list.
 
@@ -495,6 +530,42 @@ class EventList:
 
         return MapCoord.create(coord)
 
+    def _map_coord_arrays(self, geom, start=None, stop=None):
+        """Event map coordinates for a given geometry, as raw arrays.
+
+        Unlike `~EventList.map_coord`, no `~astropy.coordinates.SkyCoord`
+        or `~gammapy.maps.MapCoord` objects are created. The sky coordinates
+        are rotated to the frame of the geometry and the other columns are
+        converted to the axis units on plain arrays.
+
+        Parameters
+        ----------
+        geom : `~gammapy.maps.Geom`
+            Geometry
+        start, stop : int
+            Range of events to use.
+
+        Returns
+        -------
+        coord : tuple of `~numpy.ndarray`
+            Coordinates, ordered as (lon, lat, x_0, ..., x_n), with longitude
+            and latitude in deg.
+        """
+        cols = {k.upper(): v for k, v in self.table.columns.items()}
+
+        lon = cols["RA"].quantity[start:stop].to_value("deg")
+        lat = cols["DEC"].quantity[start:stop].to_value("deg")
+        coord = _lonlat_to_frame(lon, lat, frame="icrs", frame_out=geom.frame)
+
+        for axis in geom.axes:
+            try:
+                col = cols[axis.name.upper()][start:stop]
+                coord += (Quantity(col).to_value(axis.unit),)
+            except KeyError:
+                raise KeyError(f"Column not found in event list: {axis.name!r}")
+
+        return coord
+
     def select_map_mask(self, mask):
         """Select events inside a mask (`EventList`).
 
@@ -1,8 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import copy
-from operator import le, lt
 import numpy as np
-from astropy.table import Table, vstack
+from astropy.table import Table
 from astropy.time import Time
 from astropy.io import fits
 from astropy.units import Quantity
@@ -151,6 +150,16 @@ class GTI:
         met = Quantity(self.table["STOP"].astype("float64"), "second")
         return self.time_ref + met
 
+    @property
+    def met_start(self):
+        """GTI start times in seconds w.r.t. the reference time (`~numpy.ndarray`)."""
+        return np.asarray(self.table["START"], dtype="float64")
+
+    @property
+    def met_stop(self):
+        """GTI end times in seconds w.r.t. the reference time (`~numpy.ndarray`)."""
+        return np.asarray(self.table["STOP"], dtype="float64")
+
     @property
     def time_intervals(self):
         """List of time intervals"""
@@ -195,24 +204,16 @@ class GTI:
         gti : `GTI`
             Copy of the GTI table with selection applied.
         """
+        start_met = time_relative_to_ref(time_interval[0], self.table.meta).value
+        stop_met = time_relative_to_ref(time_interval[1], self.table.meta).value
+
         # get GTIs that fall within the time_interval
-        mask = self.time_start < time_interval[1]
-        mask &= self.time_stop > time_interval[0]
+        mask = (self.met_start < stop_met) & (self.met_stop > start_met)
         gti_within = self.table[mask]
 
         # crop the GTIs
-        start_met = time_relative_to_ref(time_interval[0], self.table.meta)
-        stop_met = time_relative_to_ref(time_interval[1], self.table.meta)
-        np.clip(
-            gti_within["START"],
-            start_met.value,
-            stop_met.value,
-            out=gti_within["START"],
-        )
-        np.clip(
-            gti_within["STOP"], start_met.value, stop_met.value, out=gti_within["STOP"]
-        )
-
+        np.clip(gti_within["START"], start_met, stop_met, out=gti_within["START"])
+        np.clip(gti_within["STOP"], start_met, stop_met, out=gti_within["STOP"])
         return self.__class__(gti_within)
 
     def stack(self, other):
@@ -227,10 +228,13 @@ class GTI:
             GTI to stack to self
 
         """
-        start = (other.time_start - self.time_ref).sec
-        end = (other.time_stop - self.time_ref).sec
-        table = Table({"START": start, "STOP": end}, names=["START", "STOP"])
-        self.table = vstack([self.table, table])
+        offset = (other.time_ref - self.time_ref).to_value("s")
+        start = np.concatenate([self.met_start, other.met_start + offset])
+        stop = np.concatenate([self.met_stop, other.met_stop + offset])
+        self.table = Table(
+            {"START": Quantity(start, "s"), "STOP": Quantity(stop, "s")},
+            meta=self.table.meta,
+        )
 
     def union(self, overlap_ok=True, merge_equal=True):
         """Union of overlapping time intervals.
@@ -245,30 +249,69 @@ class GTI:
             Whether to merge touching time bins e.g. ``(1, 2)`` and ``(2, 3)``
             will result in ``(1, 3)``.
         """
-        # Algorithm to merge overlapping intervals is well-known,
-        # see e.g. https://stackoverflow.com/a/43600953/498873
+        table = self.table[["START", "STOP"]]
+
+        if len(table) == 0:
+            return self.__class__(table)
 
-        table = self.table.copy()
         table.sort("START")
+        start, stop = np.asarray(table["START"]), np.asarray(table["STOP"])
 
-        compare = lt if merge_equal else le
+        # an interval starts a new group if it starts after all previous
+        # intervals have stopped
+        stop_max = np.maximum.accumulate(stop)[:-1]
+        compare = np.less if merge_equal else np.less_equal
+        is_new = np.concatenate([[True], compare(stop_max, start[1:])])
 
-        # We use Python dict instead of astropy.table.Row objects,
-        # because on some versions modifying Row entries doesn't behave as expected
-        merged = [{"START": table[0]["START"], "STOP": table[0]["STOP"]}]
-        for row in table[1:]:
-            interval = {"START": row["START"], "STOP": row["STOP"]}
-            if compare(merged[-1]["STOP"], interval["START"]):
-                merged.append(interval)
-            else:
-                if not overlap_ok:
-                    raise ValueError("Overlapping time bins")
+        if not overlap_ok and not is_new.all():
+            raise ValueError("Overlapping time bins")
 
-                merged[-1]["STOP"] = max(interval["STOP"], merged[-1]["STOP"])
-
-        merged = Table(rows=merged, names=["START", "STOP"], meta=self.table.meta)
+        idx = np.nonzero(is_new)[0]
+        merged = table[idx]
+        merged["STOP"] = np.maximum.reduceat(stop, idx)
         return self.__class__(merged)
 
+    def intersection(self, other):
+        """Intersection with another GTI.
+
+        Returns a new `~gammapy.data.GTI` object, with the time reference of self.
+
+        Parameters
+        ----------
+        other : `~gammapy.data.GTI`
+            GTI to intersect with.
+
+        Returns
+        -------
+        gti : `~gammapy.data.GTI`
+            Time intervals contained in both GTIs.
+        """
+        gti, other = self.union(), other.union()
+
+        start, stop = gti.met_start, gti.met_stop
+        offset = (other.time_ref - gti.time_ref).to_value("s")
+        other_start, other_stop = other.met_start + offset, other.met_stop + offset
+
+        # both sets of intervals are sorted and disjoint, so the intervals
+        # of other overlapping each interval form a contiguous range
+        idx_min = np.searchsorted(other_stop, start, side="right")
+        idx_max = np.searchsorted(other_start, stop, side="left")
+        counts = np.clip(idx_max - idx_min, 0, None)
+
+        idx = np.repeat(np.arange(len(start)), counts)
+        offsets = np.repeat(np.cumsum(counts) - counts, counts)
+        idx_other = np.arange(counts.sum()) - offsets + np.repeat(idx_min, counts)
+
+        start = np.maximum(start[idx], other_start[idx_other])
+        stop = np.minimum(stop[idx], other_stop[idx_other])
+        valid = stop > start
+
+        table = Table(
+            {"START": Quantity(start[valid], "s"), "STOP": Quantity(stop[valid], "s")},
+            meta=gti.table.meta,
+        )
+        return self.__class__(table)
+
     def group_table(self, time_intervals, atol="1e-6 s"):
         """Compute the table with the info on the group to which belong each time interval.
 
@@ -1,11 +1,11 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 import numpy as np
 from astropy.coordinates import Angle, SkyCoord
 from astropy.table import Table
 from astropy.units import Quantity, Unit
 from astropy.utils import lazyproperty
-from gammapy.utils.regions import SphericalCircleSkyRegion
+from gammapy.utils.coordinates import SkyCoordIndex
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import Checker
 from gammapy.utils.time import time_ref_from_dict
@@ -17,8 +17,16 @@ class ObservationTable(Table):
     """Observation table.
 
     Data format specification: :ref:`gadf:obs-index`
+
+    Selections are evaluated on cached columnar data: a spatial index of the
+    pointing positions and sorted copies of the selected columns, so that
+    repeated queries on large tables only need binary searches. The masks of
+    the last ``ObservationTable.query_cache_size`` selections are cached as
+    well. The cached data are not updated when the table is modified in place.
     """
 
+    query_cache_size = 128
+
     @classmethod
     def read(cls, filename, **kwargs):
         """Read an observation table from file.
@@ -133,20 +141,13 @@ class ObservationTable(Table):
         obs_table : `~gammapy.data.ObservationTable`
             Observation table after selection.
         """
-        value_range = Quantity(value_range)
-
-        # read values into a quantity in case units have to be taken into account
-        value = Quantity(self[selection_variable])
-
-        mask = (value_range[0] <= value) & (value < value_range[1])
-
-        if np.allclose(value_range[0].value, value_range[1].value):
-            mask = value_range[0] == value
-
-        if inverted:
-            mask = np.invert(mask)
-
-        return self[mask]
+        selection = dict(
+            type="par_box",
+            variable=selection_variable,
+            value_range=value_range,
+            inverted=inverted,
+        )
+        return self.select_observations(selection)
 
     def select_time_range(self, time_range, partial_overlap=False, inverted=False):
         """Make an observation table, applying a time selection.
@@ -172,22 +173,136 @@ class ObservationTable(Table):
         obs_table : `~gammapy.data.ObservationTable`
             Observation table after selection.
         """
-        tstart = self.time_start
-        tstop = self.time_stop
+        selection = dict(
+            type="time_box",
+            time_range=time_range,
+            partial_overlap=partial_overlap,
+            inverted=inverted,
+        )
+        return self.select_observations(selection)
 
-        if partial_overlap is False:
-            mask1 = time_range[0] <= tstart
-            mask2 = time_range[1] >= tstop
-        else:
-            mask1 = time_range[0] <= tstop
-            mask2 = time_range[1] >= tstart
+    @lazyproperty
+    def _pointing_index(self):
+        """Spatial index of the pointing positions."""
+        return SkyCoordIndex(self.pointing_radec)
+
+    @lazyproperty
+    def _sorted_columns(self):
+        """Dict containing the sorting index and sorted values per column."""
+        return {}
+
+    @lazyproperty
+    def _query_cache(self):
+        """Cache of the selection masks, with the normalised selections as keys."""
+        return OrderedDict()
+
+    def _get_sorted_column(self, name):
+        """Sorting index and sorted values (`~astropy.units.Quantity`) of a column."""
+        if name not in self._sorted_columns:
+            if name in ["TSTART", "TSTOP"]:
+                # round trip through `Time`, as the queried time ranges
+                time = self.time_start if name == "TSTART" else self.time_stop
+                values = (time - self.time_ref).to("s")
+            else:
+                values = Quantity(self[name])
+
+            idx = np.argsort(values.value, kind="stable")
+            self._sorted_columns[name] = idx, values[idx]
 
-        mask = mask1 & mask2
+        return self._sorted_columns[name]
+
+    def _get_range_mask(self, name, lo=-np.inf, hi=np.inf, include_hi=False):
+        """Mask of the rows with ``lo <= value < hi`` from a binary search.
+
+        With ``include_hi=True`` the upper bound is included.
+        """
+        idx, values = self._get_sorted_column(name)
+        side = "right" if include_hi else "left"
+        start = np.searchsorted(values.value, lo, side="left")
+        stop = np.searchsorted(values.value, hi, side=side)
+
+        mask = np.zeros(len(self), dtype=bool)
+        mask[idx[start:stop]] = True
+        return mask
+
+    def _get_selection_key(self, selection):
+        """Hashable key of a selection, with values converted to the table units."""
+        kind = selection["type"]
+        inverted = bool(selection.get("inverted", False))
+
+        if kind == "sky_circle":
+            lon = Angle(selection["lon"], "deg")
+            lat = Angle(selection["lat"], "deg")
+            center = SkyCoord(lon, lat, frame=selection["frame"]).icrs
+            border = Angle(selection.get("border", 0), "deg")
+            radius = Angle(selection["radius"]) + border
+            values = (center.ra.deg, center.dec.deg, radius.deg)
+        elif kind == "time_box":
+            partial_overlap = bool(selection.get("partial_overlap", False))
+            time_range = selection["time_range"] - self.time_ref
+            values = (partial_overlap, *time_range.to_value("s"))
+        elif kind == "par_box":
+            name = selection["variable"]
+            _, column = self._get_sorted_column(name)
+            value_range = Quantity(selection["value_range"]).to_value(column.unit)
+            values = (name, *value_range)
+        else:
+            raise ValueError(f"Invalid selection type: {kind}")
+
+        values = tuple(_ if isinstance(_, (str, bool)) else float(_) for _ in values)
+        return (kind, inverted) + values
+
+    def _compute_selection_mask(self, key):
+        """Compute the mask of the rows passing a selection, given its key."""
+        kind, inverted, *values = key
+
+        if kind == "sky_circle":
+            ra, dec, radius = values
+            center = SkyCoord(ra, dec, unit="deg", frame="icrs")
+            radius = Angle(radius, "deg")
+            idx = self._pointing_index.query_cone(center, radius)
+
+            # the region boundary is excluded, as for `SphericalCircleSkyRegion`
+            if len(idx):
+                separation = self._pointing_index.skycoord[idx].separation(center)
+                idx = idx[separation < radius]
+
+            mask = np.zeros(len(self), dtype=bool)
+            mask[idx] = True
+        elif kind == "time_box":
+            partial_overlap, t_min, t_max = values
+            if partial_overlap:
+                mask = self._get_range_mask("TSTOP", lo=t_min)
+                mask &= self._get_range_mask("TSTART", hi=t_max, include_hi=True)
+            else:
+                mask = self._get_range_mask("TSTART", lo=t_min)
+                mask &= self._get_range_mask("TSTOP", hi=t_max, include_hi=True)
+        else:
+            name, lo, hi = values
+            if np.allclose(lo, hi):
+                mask = self._get_range_mask(name, lo=lo, hi=lo, include_hi=True)
+            else:
+                mask = self._get_range_mask(name, lo=lo, hi=hi)
 
         if inverted:
             mask = np.invert(mask)
 
-        return self[mask]
+        mask.flags.writeable = False
+        return mask
+
+    def _get_selection_mask(self, selection):
+        """Mask of the rows passing a selection, cached per selection."""
+        key = self._get_selection_key(selection)
+
+        if key in self._query_cache:
+            self._query_cache.move_to_end(key)
+        else:
+            self._query_cache[key] = self._compute_selection_mask(key)
+
+            while len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+
+        return self._query_cache[key]
 
     def select_observations(self, selection=None):
         """Select subset of observations.
@@ -209,8 +324,9 @@ class ObservationTable(Table):
         keywords in the **selection** dictionary under the **type** key.
 
         - ``sky_circle`` is a circular region centered in the coordinate
-           marked by the **lon** and **lat** keywords, and radius **radius**;
-           uses `~gammapy.catalog.select_sky_circle`
+           marked by the **lon** and **lat** keywords, and radius **radius**
+           (plus an optional **border**); the pointing positions are looked
+           up in a spatial index
 
         - ``time_box`` is a 1D selection criterion acting on the observation
           start time (**TSTART**); the interval is set via the
@@ -229,12 +345,20 @@ class ObservationTable(Table):
         **inverted** flag, in which case, the selection is applied to keep all
         elements outside the selected range.
 
+        A list of selection dictionaries can be given to apply several
+        criteria at once, e.g. a cone, a time range and a zenith angle
+        range; only the observations passing all of them are kept. The
+        result of each criterion is cached, so that repeated or refined
+        queries on the same table are fast.
+
         A few examples of selection criteria are given below.
 
         Parameters
         ----------
-        selection : dict
-            Dictionary with a few keywords for applying selection cuts.
+        selection : dict or list of dict
+            Dictionary with a few keywords for applying selection cuts, or
+            list of dictionaries combined with a logical AND. By default
+            all observations are selected.
 
         Returns
         -------
@@ -265,40 +389,24 @@ class ObservationTable(Table):
         >>> selection = dict(type='par_box', variable='N_TELS',
         ...                  value_range=[4, 4])
         >>> selected_obs_table = obs_table.select_observations(selection) # doctest: +SKIP
+
+        >>> selection = [dict(type='par_box', variable='ZEN_PNT',
+        ...                   value_range=Angle([0., 40.], 'deg')),
+        ...              dict(type='par_box', variable='MUONEFF',
+        ...                   value_range=[0.7, 1.])]
+        >>> selected_obs_table = obs_table.select_observations(selection) # doctest: +SKIP
         """
-        if "inverted" not in selection:
-            selection["inverted"] = False
-        if "partial_overlap" not in selection:
-            selection["partial_overlap"] = False
+        if selection is None:
+            selection = []
+        elif isinstance(selection, dict):
+            selection = [selection]
 
-        if selection["type"] == "sky_circle":
-            lon = Angle(selection["lon"], "deg")
-            lat = Angle(selection["lat"], "deg")
-            radius = Angle(selection["radius"])
-            if "border" in selection:
-                border = Angle(selection["border"])
-            else:
-                border = Angle(0, "deg")
-            region = SphericalCircleSkyRegion(
-                center=SkyCoord(lon, lat, frame=selection["frame"]),
-                radius=radius + border,
-            )
-            mask = region.contains(self.pointing_radec)
-            if selection["inverted"]:
-                mask = np.invert(mask)
-            return self[mask]
-        elif selection["type"] == "time_box":
-            return self.select_time_range(
-                selection["time_range"],
-                selection["partial_overlap"],
-                selection["inverted"],
-            )
-        elif selection["type"] == "par_box":
-            return self.select_range(
-                selection["variable"], selection["value_range"], selection["inverted"]
-            )
-        else:
-            raise ValueError(f"Invalid selection type: {selection['type']}")
+        mask = np.ones(len(self), dtype=bool)
+
+        for _ in selection:
+            mask &= self._get_selection_mask(_)
+
+        return self[mask]
 
 
 class ObservationTableChecker(Checker):
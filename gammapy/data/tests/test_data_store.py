@@ -2,7 +2,9 @@
 import os
 from pathlib import Path
 import pytest
+import numpy as np
 from astropy.io import fits
+from astropy.table import Table
 from gammapy.data import DataStore
 from gammapy.utils.testing import requires_data
 from gammapy.utils.scripts import make_path
@@ -72,6 +74,56 @@ def test_datastore_from_events():
     assert len(data_store.hdu_table) == 6
 
 
+def make_events_file(path, obs_id, n_events=10, time_keys=True):
+    time = np.linspace(100, 200, n_events)
+    table = Table({"TIME": time, "ENERGY": np.ones(n_events)})
+    hdu = fits.BinTableHDU(table, name="EVENTS")
+    header = dict(
+        OBS_ID=obs_id,
+        RA_PNT=83.6,
+        DEC_PNT=22.0,
+        ALT_PNT=70.0,
+        AZ_PNT=0.0,
+        ONTIME=100.0,
+        LIVETIME=90.0,
+        DEADC=0.9,
+        TSTART=90.0,
+        TSTOP=210.0,
+    )
+    if not time_keys:
+        del header["TSTART"], header["TSTOP"]
+
+    hdu.header.update(header)
+    fits.HDUList([fits.PrimaryHDU(), hdu]).writeto(path, overwrite=True)
+    return path
+
+
+def test_datastore_from_events_update(tmp_path):
+    paths = [
+        make_events_file(tmp_path / "events_1.fits", obs_id=1),
+        make_events_file(tmp_path / "events_2.fits", obs_id=2, time_keys=False),
+    ]
+    data_store = DataStore.from_events_files(paths, n_jobs=2)
+
+    assert list(data_store.obs_table["OBS_ID"]) == [1, 2]
+    assert len(data_store.hdu_table) == 12
+    assert list(data_store.obs_table["TSTART"]) == [90, 100]
+    assert list(data_store.obs_table["TSTOP"]) == [210, 200]
+
+    # modify one file and add a new one
+    make_events_file(paths[1], obs_id=2, n_events=20)
+    os.utime(paths[1], (0, 0))
+    paths.append(make_events_file(tmp_path / "events_3.fits", obs_id=3))
+
+    updated = DataStore.from_events_files(paths, data_store=data_store)
+    assert list(updated.obs_table["OBS_ID"]) == [1, 2, 3]
+    assert list(updated.obs_table["EVENT_COUNT"]) == [10, 20, 10]
+    assert len(updated.hdu_table) == 18
+
+    # nothing to update
+    assert DataStore.from_events_files(paths, data_store=updated) is updated
+
+
 @requires_data()
 def test_datastore_get_observations(data_store):
     """Test loading data and IRF files via the DataStore"""
@@ -140,7 +192,7 @@ class TestDataStoreMaker:
         table = self.data_store.obs_table
         assert table.__class__.__name__ == "ObservationTable"
         assert len(table) == 4
-        assert len(table.colnames) == 24
+        assert len(table.colnames) == 25
 
         # TODO: implement https://github.com/gammapy/gammapy/issues/1218 and add tests here
         # assert table.time_start[0].iso == "spam"
@@ -115,6 +115,33 @@ def test_gti_union():
     assert_allclose(gti.table["STOP"], [4, 8])
 
 
+def test_gti_union_touching():
+    gti = make_gti({"START": [3, 1, 5], "STOP": [5, 3, 6]})
+
+    merged = gti.union(merge_equal=False)
+    assert_allclose(merged.table["START"], [1, 3, 5])
+    assert_allclose(merged.table["STOP"], [3, 5, 6])
+
+    merged = gti.union()
+    assert_allclose(merged.table["START"], [1])
+    assert_allclose(merged.table["STOP"], [6])
+
+    with pytest.raises(ValueError):
+        gti.union(overlap_ok=False)
+
+
+def test_gti_intersection():
+    time_ref = Time("2010-01-01")
+    gti1 = make_gti({"START": [0, 10, 20], "STOP": [5, 15, 25]}, time_ref=time_ref)
+    gti2 = make_gti({"START": [-8, 0], "STOP": [-2, 20]}, time_ref=time_ref + 10 * u.s)
+
+    gti = gti1.intersection(gti2)
+
+    assert_allclose(gti.met_start, [2, 10, 20], atol=1e-6)
+    assert_allclose(gti.met_stop, [5, 15, 25])
+    assert_time_allclose(gti.time_ref, gti1.time_ref)
+
+
 def test_gti_create():
     start = u.Quantity([1, 2], "min")
     stop = u.Quantity([1.5, 2.5], "min")
@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
+from numpy.testing import assert_equal
 from astropy.coordinates import AltAz, Angle, SkyCoord
 from astropy.time import Time, TimeDelta
 from astropy.units import Quantity
@@ -301,6 +302,40 @@ def test_select_sky_regions():
     assert len(obs_table) == 30
 
 
+def test_select_compound():
+    random_state = np.random.RandomState(seed=0)
+    obs_table = make_test_observation_table(n_obs=100, random_state=random_state)
+
+    cone = dict(
+        type="sky_circle", frame="galactic", lon="0 deg", lat="0 deg", radius="50 deg"
+    )
+    time_box = dict(
+        type="time_box",
+        time_range=Time(["2011-01-01", "2014-01-01"]),
+        partial_overlap=True,
+    )
+    alt_box = dict(type="par_box", variable="ALT", value_range=Angle([60, 90], "deg"))
+    muon_box = dict(type="par_box", variable="MUONEFF", value_range=[0.7, 1.0])
+    selection = [cone, time_box, alt_box, muon_box]
+
+    selected = obs_table.select_observations(selection)
+
+    expected = obs_table
+    for _ in selection:
+        expected = expected.select_observations(_)
+
+    assert len(selected) == 5
+    assert_equal(selected["OBS_ID"], expected["OBS_ID"])
+    assert len(obs_table._query_cache) == 4
+
+    selected = obs_table.select_observations(selection)
+    assert len(selected) == 5
+    assert len(obs_table._query_cache) == 4
+
+    selected = obs_table.select_observations()
+    assert len(selected) == 100
+
+
 @requires_data()
 def test_observation_table_checker():
     path = "$GAMMAPY_DATA/cta-1dc/index/gps/obs-index.fits.gz"
@@ -13,6 +13,7 @@ __all__ = [
     "Dataset",
     "Datasets",
     "MapDatasetOnOff",
+    "MapDatasetStacker",
     "SpectrumDataset",
     "MapDatasetEventSampler",
 ]
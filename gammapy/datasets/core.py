@@ -137,6 +137,7 @@ class Datasets(collections.abc.MutableSequence):
             unique_names.append(dataset.name)
 
         self._datasets = datasets
+        self._gti_index_cache = None
 
     @property
     def parameters(self):
@@ -222,18 +223,71 @@ class Datasets(collections.abc.MutableSequence):
             Datasets in the given time interval.
 
         """
-        atol = u.Quantity(atol)
+        atol = u.Quantity(atol).to_value("s")
 
-        datasets = []
+        time_ref, idx, t_start, t_stop = self._gti_index
 
-        for dataset in self:
-            t_start = dataset.gti.time_start[0]
-            t_stop = dataset.gti.time_stop[-1]
+        if len(idx) == 0:
+            return self.__class__([])
+
+        t_min = (t_min - time_ref).to_value("s") - atol
+        t_max = (t_max - time_ref).to_value("s") + atol
+
+        # the datasets are sorted by start time, the start time of the
+        # selected datasets lies within the time interval
+        idx_min = np.searchsorted(t_start, t_min, side="left")
+        idx_max = np.searchsorted(t_start, t_max, side="right")
+        selected = np.arange(idx_min, idx_max)
+        selected = np.sort(idx[selected[t_stop[selected] <= t_max]])
+
+        return self.__class__([self._datasets[_] for _ in selected])
+
+    @property
+    def _gti_index(self):
+        """Sorted index of the dataset time intervals.
+
+        The index is cached and only rebuilt when the datasets or their
+        GTI tables change.
+
+        Returns
+        -------
+        time_ref : `~astropy.time.Time`
+            Reference time of the index.
+        idx : `~numpy.ndarray`
+            Indices of the datasets with a GTI, sorted by start time.
+        t_start, t_stop : `~numpy.ndarray`
+            Start time of the first and stop time of the last GTI of
+            these datasets, in seconds w.r.t. the reference time.
+        """
+        gtis = [getattr(d, "gti", None) for d in self._datasets]
+        tables = [getattr(gti, "table", None) for gti in gtis]
+        cache = self._gti_index_cache
+
+        if cache is not None and len(cache[0]) == len(tables):
+            if all(a is b for a, b in zip(cache[0], tables)):
+                return cache[1]
+
+        idx, t_start, t_stop, time_ref = [], [], [], None
+
+        for k, gti in enumerate(gtis):
+            if gti is None or len(gti.table) == 0:
+                continue
+
+            if time_ref is None:
+                time_ref = gti.time_ref
 
-            if t_start >= (t_min - atol) and t_stop <= (t_max + atol):
-                datasets.append(dataset)
+            offset = (gti.time_ref - time_ref).to_value("s")
+            idx.append(k)
+            t_start.append(gti.met_start[0] + offset)
+            t_stop.append(gti.met_stop[-1] + offset)
 
-        return self.__class__(datasets)
+        idx = np.array(idx, dtype=int)
+        t_start, t_stop = np.array(t_start), np.array(t_stop)
+        order = np.argsort(t_start, kind="stable")
+        index = time_ref, idx[order], t_start[order], t_stop[order]
+
+        self._gti_index_cache = tables, index
+        return index
 
     def slice_by_energy(self, energy_min, energy_max):
         """Select and slice datasets in energy range
@@ -416,6 +470,16 @@ class Datasets(collections.abc.MutableSequence):
                 "Stacking impossible: all Datasets contained are not of a unique type."
             )
 
+        from .map import MapDataset, MapDatasetStacker
+
+        if type(self[0]).stack is MapDataset.stack:
+            stacker = MapDatasetStacker(
+                self[0].geoms, name=name, dataset_cls=type(self[0])
+            )
+            for dataset in self:
+                stacker.add(dataset)
+            return stacker.to_dataset()
+
         stacked = self[0].to_masked(name=name)
 
         for dataset in self[1:]:
@@ -458,14 +522,15 @@ class Datasets(collections.abc.MutableSequence):
     @property
     def gti(self):
         """GTI table"""
-        time_intervals = []
+        time_ref, idx, t_start, t_stop = self._gti_index
 
-        for dataset in self:
-            if dataset.gti is not None:
-                interval = (dataset.gti.time_start[0], dataset.gti.time_stop[-1])
-                time_intervals.append(interval)
+        if len(idx) == 0:
+            return GTI.from_time_intervals([])
 
-        return GTI.from_time_intervals(time_intervals)
+        # restore the order of the datasets
+        order = np.argsort(idx)
+        start, stop = u.Quantity(t_start[order], "s"), u.Quantity(t_stop[order], "s")
+        return GTI.create(start, stop, reference_time=time_ref)
 
     @property
     def meta_table(self):
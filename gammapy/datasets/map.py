@@ -7,7 +7,6 @@ from astropy.io import fits
 from astropy.nddata.utils import NoOverlapError
 from astropy.coordinates import SkyCoord
 from astropy.table import Table
-from astropy.utils import lazyproperty
 from regions import CircleSkyRegion
 from gammapy.data import GTI
 from gammapy.irf import EDispKernelMap, EDispMap, PSFKernel, PSFMap
@@ -25,6 +24,7 @@ from gammapy.stats import (
     cash_sum_cython,
     get_wstat_mu_bkg,
     wstat,
+    wstat_sum_cython,
 )
 from gammapy.utils.fits import HDULocation, LazyFitsData
 from gammapy.utils.random import get_random_state
@@ -33,7 +33,12 @@ from gammapy.utils.table import hstack_columns
 from .core import Dataset
 from .utils import get_axes
 
-__all__ = ["MapDataset", "MapDatasetOnOff", "create_map_dataset_geoms"]
+__all__ = [
+    "MapDataset",
+    "MapDatasetOnOff",
+    "MapDatasetStacker",
+    "create_map_dataset_geoms",
+]
 
 log = logging.getLogger(__name__)
 
@@ -50,6 +55,7 @@ BINSZ_IRF_DEFAULT = 0.2
 
 EVALUATION_MODE = "local"
 USE_NPRED_CACHE = True
+USE_IRF_KERNEL_CACHE = False
 
 
 def get_cutout_width(model, psf=None, margin=CUTOUT_MARGIN):
@@ -310,6 +316,7 @@ class MapDataset(Dataset):
                         evaluation_mode=EVALUATION_MODE,
                         gti=self.gti,
                         use_cache=USE_NPRED_CACHE,
+                        use_kernel_cache=USE_IRF_KERNEL_CACHE,
                     )
                     self._evaluators[model.name] = evaluator
 
@@ -647,7 +654,9 @@ class MapDataset(Dataset):
             # TODO: check whether this can be improved e.g. handling this in GTI
             if "livetime" in other.exposure.meta:
                 if "livetime" in self.exposure.meta:
-                    self.exposure.meta["livetime"] += other.exposure.meta["livetime"]
+                    livetime = self.exposure.meta["livetime"]
+                    livetime = livetime + other.exposure.meta["livetime"]
+                    self.exposure.meta["livetime"] = livetime
                 else:
                     self.exposure.meta["livetime"] = other.exposure.meta["livetime"]
 
@@ -883,18 +892,29 @@ class MapDataset(Dataset):
 
         return ax_spatial, ax_spectral
 
-    @lazyproperty
+    @property
     def _counts_data(self):
-        return self.counts.data.astype(float)
+        # the float copy of the counts is cached and recomputed whenever a new
+        # counts map or data array is assigned to the dataset
+        data = self.counts.data
+        cached = self.__dict__.get("_counts_data_cache")
+
+        if cached is None or cached[0] is not data:
+            cached = (data, data.astype(float))
+            self._counts_data_cache = cached
+
+        return cached[1]
 
     def stat_sum(self):
         """Total likelihood given the current model parameters."""
         counts, npred = self._counts_data, self.npred().data
 
         if self.mask is not None:
-            return cash_sum_cython(counts[self.mask.data], npred[self.mask.data])
+            mask = self.mask.data.ravel()
         else:
-            return cash_sum_cython(counts.ravel(), npred.ravel())
+            mask = None
+
+        return cash_sum_cython(counts.ravel(), npred.ravel(), mask)
 
     def fake(self, random_state="random-seed"):
         """Simulate fake counts for the current model and reduced IRFs.
@@ -912,6 +932,30 @@ class MapDataset(Dataset):
         npred.data = random_state.poisson(npred.data)
         self.counts = npred
 
+    def sample_counts(self, n_samples, random_state="random-seed"):
+        """Sample Poisson realisations of the counts for the current model and reduced IRFs.
+
+        The predicted counts are evaluated only once and all realisations
+        are drawn in a single call. The counts defined on the dataset object
+        are not modified.
+
+        Parameters
+        ----------
+        n_samples : int
+            Number of realisations.
+        random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
+                Defines random number generator initialisation.
+                Passed to `~gammapy.utils.random.get_random_state`.
+
+        Returns
+        -------
+        counts : `~numpy.ndarray`
+            Counts realisations, with shape ``(n_samples,) + counts.data.shape``.
+        """
+        random_state = get_random_state(random_state)
+        npred = self.npred().data
+        return random_state.poisson(npred, size=(n_samples,) + npred.shape)
+
     def to_hdulist(self):
         """Convert map dataset to list of HDUs.
 
@@ -1616,6 +1660,167 @@ class MapDataset(Dataset):
         return self.resample_energy_axis(energy_axis=energy_axis, name=name)
 
 
+class MapDatasetStacker:
+    """Accumulator to stack many map datasets.
+
+    The counts, background, exposure and safe mask of the added datasets are
+    summed into preallocated maps. For the PSF and energy dispersion, the
+    exposure weighted IRF values and the IRF exposures are summed
+    separately, so that the weighted average of the IRFs is computed only
+    once, in `~MapDatasetStacker.to_dataset`. The GTIs and meta tables are
+    collected and combined at the end as well.
+
+    The result is the same as stacking the datasets one after the other
+    with `MapDataset.stack`. Accumulators filled by parallel workers can be
+    combined with `~MapDatasetStacker.merge`.
+
+    Parameters
+    ----------
+    geoms : dict
+        Geometries of the stacked dataset, as returned by `MapDataset.geoms`.
+    name : str
+        Name of the stacked dataset.
+    dataset_cls : class
+        Class of the stacked dataset, `MapDataset` or `SpectrumDataset`.
+    """
+
+    def __init__(self, geoms, name=None, dataset_cls=MapDataset):
+        self.name = name
+        self._stacked = dataset_cls.from_geoms(**geoms, name=name)
+        self._gtis = []
+        self._meta_tables = []
+
+        for irf in [self._stacked.psf, self._stacked.edisp]:
+            if irf is not None:
+                irf._irf_map.data *= irf.exposure_map.data
+
+    @staticmethod
+    def _add_irf(irf, other, weights=None):
+        """Add exposure weighted IRF values, see `~gammapy.irf.IRFMap.stack`"""
+        if other.exposure_map is None:
+            raise ValueError(f"Missing exposure map for {other.__class__.__name__}")
+
+        irf._irf_map.stack(other._irf_map * other.exposure_map.data, weights=weights)
+
+        if weights and "energy" in weights.geom.axes.names:
+            weights = weights.reduce(
+                axis_name="energy", func=np.logical_or, keepdims=True
+            )
+        irf.exposure_map.stack(other.exposure_map, weights=weights)
+
+    @staticmethod
+    def _add_livetime(exposure, livetime):
+        if "livetime" in exposure.meta:
+            exposure.meta["livetime"] = exposure.meta["livetime"] + livetime
+        else:
+            exposure.meta["livetime"] = livetime
+
+    def add(self, dataset):
+        """Add a dataset to the accumulator.
+
+        Parameters
+        ----------
+        dataset : `MapDataset`
+            Map dataset to be stacked.
+        """
+        stacked = self._stacked
+
+        if stacked.counts and dataset.counts:
+            stacked.counts.stack(dataset.counts, weights=dataset.mask_safe)
+
+        if stacked.exposure and dataset.exposure:
+            stacked.exposure.stack(dataset.exposure, weights=dataset.mask_safe_image)
+            if "livetime" in dataset.exposure.meta:
+                livetime = dataset.exposure.meta["livetime"]
+                self._add_livetime(stacked.exposure, livetime)
+
+        if stacked.stat_type == "cash":
+            if stacked.background and dataset.background:
+                background = dataset.npred_background()
+                stacked.background.stack(background, weights=dataset.mask_safe)
+
+        if stacked.psf and dataset.psf:
+            self._add_irf(stacked.psf, dataset.psf, weights=dataset.mask_safe_psf)
+
+        if stacked.edisp and dataset.edisp:
+            self._add_irf(stacked.edisp, dataset.edisp, weights=dataset.mask_safe_edisp)
+
+        if stacked.mask_safe and dataset.mask_safe:
+            stacked.mask_safe.stack(dataset.mask_safe)
+
+        if stacked.gti and dataset.gti:
+            self._gtis.append(dataset.gti)
+
+        if dataset.meta_table:
+            self._meta_tables.append(dataset.meta_table)
+
+    def merge(self, other):
+        """Merge another accumulator into this one in place.
+
+        Parameters
+        ----------
+        other : `MapDatasetStacker`
+            Accumulator with the same geometries.
+        """
+        stacked, stacked_other = self._stacked, other._stacked
+
+        for name in ["counts", "exposure", "background", "mask_safe"]:
+            m, m_other = getattr(stacked, name), getattr(stacked_other, name)
+            if m and m_other:
+                m.stack(m_other)
+
+        has_exposure = stacked.exposure and stacked_other.exposure
+
+        if has_exposure and "livetime" in stacked_other.exposure.meta:
+            livetime = stacked_other.exposure.meta["livetime"]
+            self._add_livetime(stacked.exposure, livetime)
+
+        for name in ["psf", "edisp"]:
+            irf, irf_other = getattr(stacked, name), getattr(stacked_other, name)
+            if irf and irf_other:
+                irf._irf_map.stack(irf_other._irf_map)
+                irf.exposure_map.stack(irf_other.exposure_map)
+
+        self._gtis.extend(other._gtis)
+        self._meta_tables.extend(other._meta_tables)
+
+    def to_dataset(self):
+        """Compute the stacked dataset.
+
+        Returns
+        -------
+        dataset : `MapDataset`
+            Stacked dataset.
+        """
+        dataset = self._stacked.copy(name=self.name)
+
+        for irf in [dataset.psf, dataset.edisp]:
+            if irf is not None:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    data = irf._irf_map.data / irf.exposure_map.data
+                irf._irf_map.data = np.nan_to_num(data)
+
+        if self._gtis:
+            gti = dataset.gti
+            start = [(_.time_start - gti.time_ref).to("s") for _ in self._gtis]
+            stop = [(_.time_stop - gti.time_ref).to("s") for _ in self._gtis]
+            gti.stack(
+                GTI.create(np.concatenate(start), np.concatenate(stop), gti.time_ref)
+            )
+            dataset.gti = gti.union()
+
+        if len(self._meta_tables) == 1:
+            dataset.meta_table = self._meta_tables[0].copy()
+        elif self._meta_tables:
+            meta_table = Table()
+            for column in self._meta_tables[0].colnames:
+                data = [table[column].data[0] for table in self._meta_tables]
+                meta_table[column] = np.hstack(data)[np.newaxis, :]
+            dataset.meta_table = meta_table
+
+        return dataset
+
+
 class MapDatasetOnOff(MapDataset):
     """Map dataset for on-off likelihood fitting.
 
@@ -2009,7 +2214,18 @@ class MapDatasetOnOff(MapDataset):
 
     def stat_sum(self):
         """Total likelihood given the current model parameters."""
-        return Dataset.stat_sum(self)
+        if self.mask is not None:
+            mask = self.mask.data.ravel()
+        else:
+            mask = None
+
+        return wstat_sum_cython(
+            n_on=self.counts.data.astype(float, copy=False).ravel(),
+            n_off=self.counts_off.data.astype(float, copy=False).ravel(),
+            alpha=self.alpha.data.astype(float, copy=False).ravel(),
+            mu_sig=self.npred_signal().data.astype(float, copy=False).ravel(),
+            mask=mask,
+        )
 
     def fake(self, npred_background, random_state="random-seed"):
         """Simulate fake counts (on and off) for the current model and reduced IRFs.
@@ -2034,6 +2250,46 @@ class MapDatasetOnOff(MapDataset):
         npred_off.data = random_state.poisson(npred_off.data)
         self.counts_off = npred_off
 
+    def sample_counts(
+        self, n_samples, random_state="random-seed", npred_background=None
+    ):
+        """Sample Poisson realisations of the on and off counts.
+
+        The predicted counts are evaluated only once and all realisations
+        are drawn in a single call. The counts defined on the dataset object
+        are not modified.
+
+        Parameters
+        ----------
+        n_samples : int
+            Number of realisations.
+        random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
+                Defines random number generator initialisation.
+                Passed to `~gammapy.utils.random.get_random_state`.
+        npred_background : `~gammapy.maps.Map`
+            Expected number of background counts in the on region. By default
+            the background estimated from the off counts is used.
+
+        Returns
+        -------
+        counts, counts_off : `~numpy.ndarray`
+            On and off counts realisations, with shape ``(n_samples,) + counts.data.shape``.
+        """
+        random_state = get_random_state(random_state)
+
+        if npred_background is None:
+            npred_background = self.background
+
+        npred = self.npred_signal().data
+        shape = (n_samples,) + npred.shape
+
+        counts = random_state.poisson(npred, size=shape)
+        counts += random_state.poisson(npred_background.data, size=shape)
+
+        npred_off = (npred_background / self.alpha).data
+        counts_off = random_state.poisson(npred_off, size=shape)
+        return counts, counts_off
+
     def to_hdulist(self):
         """Convert map dataset to list of HDUs.
 
@@ -2405,9 +2661,10 @@ class MapEvaluator:
     and returns a map of the predicted counts.
     Note that background counts are not added.
 
-    For now, we only make it work for 3D WCS maps with an energy axis.
-    No HPX, no other axes, those can be added later here or via new
-    separate model evaluator classes.
+    It works for 3D WCS and HEALPix maps with an energy axis. For HEALPix maps
+    the model components are evaluated on partial-sky disk cutouts in "local"
+    evaluation mode, and the PSF convolution is done in pixel space,
+    see `~gammapy.maps.HpxNDMap.convolve`.
 
     Parameters
     ----------
@@ -2431,6 +2688,10 @@ class MapEvaluator:
         This mode is recommended for global optimization algorithms.
     use_cache : bool
         Use npred caching.
+    use_kernel_cache : bool
+        Cache the PSF and energy dispersion kernels per IRF pixel. The kernels
+        are then computed at the center of the IRF pixel containing the model
+        position, instead of at the exact position. Default is False.
     """
 
     def __init__(
@@ -2443,6 +2704,7 @@ class MapEvaluator:
         mask=None,
         evaluation_mode="local",
         use_cache=True,
+        use_kernel_cache=False,
     ):
 
         self.model = model
@@ -2453,6 +2715,7 @@ class MapEvaluator:
         self.gti = gti
         self.contributes = True
         self.use_cache = use_cache
+        self.use_kernel_cache = use_kernel_cache
         self.irf_position = None
 
         if evaluation_mode not in {"local", "global"}:
@@ -2529,7 +2792,7 @@ class MapEvaluator:
             PSF map.
         edisp : `gammapy.irf.EDispMap`
             Edisp map.
-        geom : `WcsGeom`
+        geom : `WcsGeom` or `HpxGeom`
             Counts geom
         mask_fit : `~gammapy.maps.Map`
             Mask to apply to the likelihood for fitting.
@@ -2560,8 +2823,14 @@ class MapEvaluator:
         # lookup edisp
         if edisp:
             energy_axis = geom.axes["energy"]
+
+            if isinstance(edisp, EDispMap):
+                kwargs = {"use_cache": self.use_kernel_cache}
+            else:
+                kwargs = {}
+
             self.edisp = edisp.get_edisp_kernel(
-                self.irf_position, energy_axis=energy_axis
+                self.irf_position, energy_axis=energy_axis, **kwargs
             )
 
         if mask_fit is None:
@@ -2577,7 +2846,9 @@ class MapEvaluator:
             if geom.is_region:
                 geom = geom.to_wcs_geom()
 
-            self.psf = psf.get_psf_kernel(self.irf_position, geom=geom)
+            self.psf = psf.get_psf_kernel(
+                self.irf_position, geom=geom, use_cache=self.use_kernel_cache
+            )
 
         if self.evaluation_mode == "local" and self.model.evaluation_radius is not None:
             self._init_position = self.model.position
@@ -2663,7 +2934,8 @@ class MapEvaluator:
         """Compute spectral flux"""
         energy = self.geom.axes["energy_true"].edges
         value = self.model.spectral_model.integral(energy[:-1], energy[1:],)
-        return value.reshape((-1, 1, 1))
+        shape = (-1, 1) if self.geom.is_hpx else (-1, 1, 1)
+        return value.reshape(shape)
 
     def compute_temporal_norm(self):
         """Compute temporal norm """
@@ -1,5 +1,10 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Simulate observations"""
+import contextlib
+import copy
+import functools
+import logging
+from multiprocessing import Pool
 import numpy as np
 import astropy.units as u
 from astropy.coordinates import SkyCoord, SkyOffsetFrame
@@ -7,10 +12,14 @@ from astropy.table import Table
 import gammapy
 from gammapy.data import EventList
 from gammapy.maps import MapCoord
+from gammapy.modeling import Fit
 from gammapy.modeling.models import ConstantTemporalModel
 from gammapy.utils.random import get_random_state
+from gammapy.utils.table import table_from_row_data
 
-__all__ = ["MapDatasetEventSampler"]
+__all__ = ["MapDatasetEventSampler", "MapDatasetToyMC"]
+
+log = logging.getLogger(__name__)
 
 
 class MapDatasetEventSampler:
@@ -373,3 +382,189 @@ class MapDatasetEventSampler:
         geom = dataset._geom
         selection = geom.contains(events.map_coord(geom))
         return events.select_row_subset(selection)
+
+
+# Per process copy of the dataset used by the toy MC workers
+_TOY_MC_DATASET = None
+
+
+def _init_toy_mc_worker(dataset):
+    global _TOY_MC_DATASET
+    _TOY_MC_DATASET = dataset
+
+
+def _fit_toy_mc_realization(
+    realization, null_hypothesis, backend, optimize_opts, dataset=None
+):
+    """Fit a single toy MC realization.
+
+    By default the per process dataset copy of the pool workers is used.
+    """
+    idx, samples = realization
+
+    if dataset is None:
+        dataset = _TOY_MC_DATASET
+
+    for name, data in zip(["counts", "counts_off"], samples):
+        getattr(dataset, name).data = data
+
+    parameters = dataset.models.parameters
+    names = dataset.models.parameters_unique_names
+
+    with parameters.restore_status():
+        fit = Fit([dataset])
+        result = fit.optimize(backend=backend, **optimize_opts)
+
+        row = {"realization": idx, "success": result.success, "stat": result.total_stat}
+        for name, par in zip(names, parameters):
+            if not par.frozen:
+                row[name] = par.value
+
+        if null_hypothesis:
+            for name, value in null_hypothesis.items():
+                par = parameters[names.index(name)]
+                par.value, par.frozen = value, True
+
+            result_null = fit.optimize(backend=backend, **optimize_opts)
+            row["stat_null"] = result_null.total_stat
+            row["ts"] = result_null.total_stat - result.total_stat
+
+    return row
+
+
+class MapDatasetToyMC:
+    """Toy Monte Carlo study of a map dataset.
+
+    The predicted counts are evaluated once for the current model parameters
+    and ``n_realizations`` Poisson realizations are drawn as a stacked array.
+    The model is then fitted to each realization, optionally in parallel, and
+    the results are aggregated into a table. Fits start from the current
+    model parameters, which are restored afterwards.
+
+    Parameters
+    ----------
+    n_realizations : int
+        Number of realizations.
+    null_hypothesis : dict
+        Values of the parameters defining the null hypothesis, keyed by the
+        unique parameter names (see
+        `~gammapy.modeling.models.DatasetModels.parameters_unique_names`).
+        If given, each realization is fitted a second time with these
+        parameters frozen and the TS is computed.
+    backend : str
+        Backend used for fitting, default : minuit
+    optimize_opts : dict
+        Options passed to `Fit.optimize`.
+    n_jobs : int
+        Number of processes used to fit the realizations.
+    random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
+        Defines random number generator initialisation.
+        Passed to `~gammapy.utils.random.get_random_state`.
+
+    Examples
+    --------
+    ::
+
+        from gammapy.datasets import MapDatasetToyMC
+
+        toy_mc = MapDatasetToyMC(
+            n_realizations=1000,
+            null_hypothesis={"source.spectral.amplitude": 0},
+            n_jobs=4,
+            random_state=0,
+        )
+        table = toy_mc.run(dataset)
+    """
+
+    def __init__(
+        self,
+        n_realizations=100,
+        null_hypothesis=None,
+        backend="minuit",
+        optimize_opts=None,
+        n_jobs=None,
+        random_state="random-seed",
+    ):
+        self.n_realizations = n_realizations
+        self.null_hypothesis = null_hypothesis or {}
+        self.backend = backend
+        self.optimize_opts = optimize_opts or {}
+        self.n_jobs = n_jobs
+        self.random_state = get_random_state(random_state)
+
+    def sample_counts(self, dataset, npred_background=None):
+        """Sample counts realizations for a dataset.
+
+        Parameters
+        ----------
+        dataset : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
+            Map dataset
+        npred_background : `~gammapy.maps.Map`
+            Expected number of background counts in the on region, only
+            used for `~gammapy.datasets.MapDatasetOnOff`. By default the
+            background estimated from the off counts is used.
+
+        Returns
+        -------
+        counts : `~numpy.ndarray` or tuple of `~numpy.ndarray`
+            Stacked counts realizations, as returned by the ``sample_counts``
+            method of the dataset.
+        """
+        kwargs = {}
+
+        if npred_background is not None:
+            kwargs["npred_background"] = npred_background
+
+        return dataset.sample_counts(
+            self.n_realizations, random_state=self.random_state, **kwargs
+        )
+
+    def run(self, dataset, npred_background=None):
+        """Run the toy MC study.
+
+        Parameters
+        ----------
+        dataset : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
+            Map dataset, including the models used to simulate and fit the realizations.
+        npred_background : `~gammapy.maps.Map`
+            Expected number of background counts in the on region, only
+            used for `~gammapy.datasets.MapDatasetOnOff`.
+
+        Returns
+        -------
+        table : `~astropy.table.Table`
+            Table with one row per realization, containing the fit success,
+            total statistic, fitted values of the free parameters and, if a
+            null hypothesis is defined, the TS.
+        """
+        samples = self.sample_counts(dataset, npred_background)
+
+        if not isinstance(samples, tuple):
+            samples = (samples,)
+
+        realizations = enumerate(zip(*samples))
+
+        wrap = functools.partial(
+            _fit_toy_mc_realization,
+            null_hypothesis=self.null_hypothesis,
+            backend=self.backend,
+            optimize_opts=self.optimize_opts,
+        )
+
+        if self.n_jobs is None:
+            wrap = functools.partial(wrap, dataset=copy.deepcopy(dataset))
+            rows = list(map(wrap, realizations))
+        else:
+            with contextlib.closing(
+                Pool(
+                    processes=self.n_jobs,
+                    initializer=_init_toy_mc_worker,
+                    initargs=(dataset,),
+                )
+            ) as pool:
+                log.info(f"Using {self.n_jobs} jobs to fit toy MC realizations.")
+                rows = pool.map(wrap, realizations)
+
+            pool.join()
+
+        return table_from_row_data(rows)
@@ -1,6 +1,9 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
 from numpy.testing import assert_allclose
+import astropy.units as u
+from astropy.time import Time
+from gammapy.data import GTI
 from gammapy.datasets import Datasets
 from gammapy.modeling.tests.test_fit import MyDataset
 
@@ -65,3 +68,31 @@ def test_Datasets_mutation():
         dats.insert(0, dat)
     with pytest.raises(ValueError, match="Dataset names must be unique"):
         dats.extend(dats2)
+
+
+def test_datasets_select_time():
+    time_ref = Time("2010-01-01")
+    datasets = Datasets()
+
+    for idx, (start, stop) in enumerate([(20, 30), (0, 10), (10, 20), (5, 25)]):
+        dataset = MyDataset(name=f"test-{idx}")
+        dataset.gti = GTI.create(
+            start * u.s, stop * u.s, reference_time=time_ref + idx * u.s
+        )
+        datasets.append(dataset)
+
+    selected = datasets.select_time(time_ref, time_ref + 22 * u.s)
+    assert selected.names == ["test-1", "test-2"]
+
+    selected = datasets.select_time(time_ref + 10 * u.s, time_ref + 40 * u.s)
+    assert selected.names == ["test-0", "test-2"]
+
+    selected = datasets.select_time(time_ref + 40 * u.s, time_ref + 50 * u.s)
+    assert len(selected) == 0
+
+    assert_allclose(datasets.gti.time_start.mjd, (time_ref + [20, 1, 12, 8] * u.s).mjd)
+
+    # the index is updated when a GTI changes
+    datasets[0].gti = GTI.create(0 * u.s, 1 * u.s, reference_time=time_ref)
+    selected = datasets.select_time(time_ref, time_ref + 22 * u.s)
+    assert selected.names == ["test-0", "test-1", "test-2"]
@@ -7,7 +7,8 @@ from astropy.coordinates import SkyCoord
 from astropy.table import Table
 from regions import CircleSkyRegion
 from gammapy.data import GTI
-from gammapy.datasets import Datasets, MapDataset, MapDatasetOnOff
+from gammapy.datasets import Datasets, MapDataset, MapDatasetOnOff, MapDatasetStacker
+import gammapy.datasets.map as map_module
 from gammapy.datasets.map import MapEvaluator
 from gammapy.irf import (
     EDispKernelMap,
@@ -197,6 +198,19 @@ def test_fake(sky_model, geom, geom_etrue):
     assert_allclose(dataset.counts.data.sum(), 9711)
 
 
+@requires_data()
+def test_sample_counts(sky_model, geom, geom_etrue):
+    dataset = get_map_dataset(geom, geom_etrue)
+
+    bkg_model = FoVBackgroundModel(dataset_name=dataset.name)
+    dataset.models = [sky_model, bkg_model]
+
+    counts = dataset.sample_counts(n_samples=5, random_state=314)
+
+    assert counts.shape == (5,) + dataset.counts.data.shape
+    assert_allclose(counts.sum(axis=(1, 2, 3)).mean(), 9525.299054, rtol=1e-2)
+
+
 @requires_data()
 def test_different_exposure_unit(sky_model, geom):
     energy_range_true = np.logspace(2, 4, 3)
@@ -739,6 +753,89 @@ def test_stack(sky_model):
     assert_allclose(stacked.meta_table["OBS_ID"][0], [0, 1])
 
 
+def get_stacker_datasets():
+    axis = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=3)
+    axis_etrue = MapAxis.from_energy_bounds(
+        "0.1 TeV", "10 TeV", nbin=5, name="energy_true"
+    )
+    geom = WcsGeom.create(
+        skydir=(266.4, -28.9), binsz=0.1, width=(2, 2), frame="icrs", axes=[axis]
+    )
+
+    datasets = Datasets()
+    t_ref = "2010-01-01T00:00:00"
+
+    for idx in range(3):
+        dataset = MapDataset.create(
+            geom=geom,
+            energy_axis_true=axis_etrue,
+            name=f"dataset-{idx}",
+            reference_time=t_ref,
+        )
+        dataset.counts.data += idx + 1
+        dataset.background.data += 0.1 * (idx + 1)
+        dataset.exposure.quantity = (idx + 1) * 1e10 * u.m ** 2 * u.s
+        dataset.exposure.meta["livetime"] = (idx + 1) * u.h
+        dataset.mask_safe.data[...] = True
+        dataset.mask_safe.data[idx, :, : 5 * idx] = False
+        dataset.psf.exposure_map.data += idx + 1
+        dataset.edisp.exposure_map.data += idx + 1
+        dataset.edisp.edisp_map.data *= idx + 1
+        dataset.gti = GTI.create(
+            [10 * idx] * u.h, [10 * idx + 1] * u.h, reference_time=t_ref
+        )
+        dataset.meta_table = Table({"OBS_ID": [idx]})
+        datasets.append(dataset)
+
+    return datasets
+
+
+def test_map_dataset_stacker():
+    datasets = get_stacker_datasets()
+
+    reference = get_stacker_datasets()
+    expected = reference[0].to_masked(name="stacked")
+    for dataset in reference[1:]:
+        expected.stack(dataset)
+
+    stacker = MapDatasetStacker(datasets[0].geoms, name="stacked")
+    for dataset in datasets:
+        stacker.add(dataset)
+
+    stacked = stacker.to_dataset()
+
+    assert stacked.name == "stacked"
+    assert_allclose(stacked.counts.data, expected.counts.data)
+    assert_allclose(stacked.background.data, expected.background.data)
+    assert_allclose(stacked.exposure.data, expected.exposure.data)
+    assert_allclose(stacked.mask_safe.data, expected.mask_safe.data)
+    assert_allclose(stacked.psf.psf_map.data, expected.psf.psf_map.data)
+    assert_allclose(stacked.edisp.edisp_map.data, expected.edisp.edisp_map.data)
+    assert_allclose(stacked.edisp.exposure_map.data, expected.edisp.exposure_map.data)
+    assert_allclose(stacked.exposure.meta["livetime"], 6 * u.h)
+    assert_allclose(stacked.gti.time_sum, expected.gti.time_sum)
+    assert_allclose(stacked.meta_table["OBS_ID"][0], [0, 1, 2])
+
+    stacker = MapDatasetStacker(datasets[0].geoms, name="stacked")
+    stacker.add(datasets[0])
+    other = MapDatasetStacker(datasets[0].geoms)
+    for dataset in datasets[1:]:
+        other.add(dataset)
+    stacker.merge(other)
+
+    merged = stacker.to_dataset()
+    assert_allclose(merged.counts.data, stacked.counts.data)
+    assert_allclose(
+        merged.edisp.edisp_map.data, stacked.edisp.edisp_map.data, rtol=1e-6
+    )
+    assert_allclose(merged.exposure.meta["livetime"], 6 * u.h)
+    assert_allclose(merged.meta_table["OBS_ID"][0], [0, 1, 2])
+
+    stacked_reduce = datasets.stack_reduce(name="stacked")
+    assert_allclose(stacked_reduce.counts.data, expected.counts.data)
+    assert_allclose(stacked_reduce.psf.psf_map.data, expected.psf.psf_map.data)
+
+
 @requires_data()
 def test_npred_sig(sky_model, geom, geom_etrue):
     dataset = get_map_dataset(geom, geom_etrue)
@@ -868,6 +965,63 @@ def test_npred_psf_after_edisp():
     assert_allclose(npred.data.sum(), 129553.858658)
 
 
+def get_npred_hpx_wcs(geom, use_psf):
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "1 TeV", "10 TeV", nbin=2, name="energy_true"
+    )
+    exposure = Map.from_geom(geom.to_image().to_cube([energy_axis_true]), unit="m2 s")
+    exposure.data += 1e12
+
+    dataset = MapDataset(counts=Map.from_geom(geom), exposure=exposure)
+
+    if use_psf:
+        dataset.psf = PSFMap.from_gauss(
+            energy_axis_true=energy_axis_true, sigma=0.2 * u.deg
+        )
+
+    spatial_model = GaussianSpatialModel(
+        lon_0="0 deg", lat_0="0 deg", sigma="0.3 deg", frame="galactic"
+    )
+    model = SkyModel(
+        spectral_model=PowerLawSpectralModel(),
+        spatial_model=spatial_model,
+        name="test-model",
+    )
+    dataset.models = [model]
+    npred = dataset.npred()
+
+    # surface brightness, to compare maps with different pixel sizes
+    return npred / geom.solid_angle()
+
+
+@requires_dependency("healpy")
+@pytest.mark.parametrize("use_psf", [False, True])
+def test_npred_hpx(use_psf):
+    from gammapy.maps import HpxGeom
+
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+    geom_hpx = HpxGeom.create(
+        nside=1024, frame="galactic", region="DISK(0., 0., 3.)", axes=[energy_axis]
+    )
+    geom_wcs = WcsGeom.create(
+        skydir=(0, 0), binsz=0.05, width=6, frame="galactic", axes=[energy_axis]
+    )
+
+    npred_hpx = get_npred_hpx_wcs(geom_hpx, use_psf)
+    npred_wcs = get_npred_hpx_wcs(geom_wcs, use_psf)
+
+    total_hpx = (npred_hpx * geom_hpx.solid_angle()).data.sum(axis=1)
+    total_wcs = (npred_wcs * geom_wcs.solid_angle()).data.sum(axis=(1, 2))
+    assert_allclose(total_hpx, total_wcs, rtol=1e-5)
+    assert_allclose(total_hpx, [6837.72, 2162.277], rtol=1e-5)
+
+    position = SkyCoord([0, 0.2], [0, 0.1], unit="deg", frame="galactic")
+    coords = {"skycoord": position, "energy": [[1.5], [5]] * u.TeV}
+    value_hpx = npred_hpx.get_by_coord(coords)
+    value_wcs = npred_wcs.get_by_coord(coords)
+    assert_allclose(value_hpx, value_wcs, rtol=2e-2)
+
+
 def get_map_dataset_onoff(images, **kwargs):
     """Returns a MapDatasetOnOff"""
     mask_geom = images["counts"].geom
@@ -1150,6 +1304,37 @@ def test_map_dataset_on_off_fake(geom):
     assert_allclose(empty_dataset.counts_off.data.mean(), 10.00055, rtol=1e-3)
 
 
+def test_map_dataset_stat_sum_counts_update(geom):
+    dataset = MapDataset.create(geom)
+    dataset.background.data += 1
+    stat = dataset.stat_sum()
+
+    dataset.counts.data = np.ones(geom.data_shape)
+    assert_allclose(dataset.stat_sum(), 0)
+
+    dataset.counts = Map.from_geom(geom)
+    assert_allclose(dataset.stat_sum(), stat)
+
+
+def test_map_dataset_on_off_sample_counts(geom):
+    energy_true_axis = geom.axes["energy"].copy(name="energy_true")
+
+    empty_dataset = MapDataset.create(geom, energy_true_axis)
+    empty_dataset = MapDatasetOnOff.from_map_dataset(
+        empty_dataset, acceptance=1, acceptance_off=10.0
+    )
+
+    background_map = Map.from_geom(geom, data=1)
+    counts, counts_off = empty_dataset.sample_counts(
+        n_samples=3, npred_background=background_map, random_state=42
+    )
+
+    assert counts.shape == (3, 2, 100, 100)
+    assert counts_off.shape == (3, 2, 100, 100)
+    assert_allclose(counts.mean(), 1, rtol=1e-2)
+    assert_allclose(counts_off.mean(), 10, rtol=1e-2)
+
+
 @requires_data()
 def test_map_dataset_on_off_to_image():
     axis = MapAxis.from_energy_bounds(1, 10, 2, unit="TeV")
@@ -1415,6 +1600,30 @@ def test_compute_flux_spatial():
     assert_allclose(flux.value, reference, rtol=0.003)
 
 
+def test_map_dataset_irf_kernel_cache(monkeypatch):
+    axis = MapAxis.from_energy_bounds(1, 10, nbin=2, unit="TeV")
+    geom = WcsGeom.create(npix=20, binsz=0.1, axes=[axis])
+    dataset = MapDataset.create(geom, name="test")
+
+    model = SkyModel(
+        spatial_model=PointSpatialModel(lon_0="0.05 deg", lat_0="0.05 deg"),
+        spectral_model=PowerLawSpectralModel(),
+        name="source",
+    )
+
+    # kernels are computed at the exact model position by default
+    dataset.models = [model]
+    assert not dataset.evaluators["source"].use_kernel_cache
+    dataset.npred()
+    assert len(dataset.psf._kernel_cache) == 0
+
+    monkeypatch.setattr(map_module, "USE_IRF_KERNEL_CACHE", True)
+    dataset.models = [model]
+    assert dataset.evaluators["source"].use_kernel_cache
+    dataset.npred()
+    assert len(dataset.psf._kernel_cache) == 1
+
+
 @requires_data()
 def test_source_outside_geom(sky_model, geom, geom_etrue):
     dataset = get_map_dataset(geom, geom_etrue)
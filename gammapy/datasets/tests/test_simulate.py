@@ -8,7 +8,13 @@ from astropy.io import fits
 from astropy.table import Table
 from astropy.time import Time
 from gammapy.data import GTI, DataStore, Observation
-from gammapy.datasets import MapDatasetEventSampler
+from gammapy.datasets import (
+    MapDataset,
+    MapDatasetEventSampler,
+    MapDatasetOnOff,
+    MapDatasetToyMC,
+)
+from gammapy.datasets import simulate
 from gammapy.datasets.tests.test_map import get_map_dataset
 from gammapy.irf import load_cta_irfs
 from gammapy.maps import MapAxis, WcsGeom
@@ -16,6 +22,7 @@ from gammapy.modeling.models import (
     FoVBackgroundModel,
     GaussianSpatialModel,
     LightCurveTemplateTemporalModel,
+    PointSpatialModel,
     PowerLawSpectralModel,
     SkyModel,
 )
@@ -358,3 +365,64 @@ def test_events_datastore(tmp_path, dataset, models):
     hdu_all.writeto(str(tmp_path / "events.fits"))
 
     DataStore.from_events_files([str(tmp_path / "events.fits")])
+
+
+def test_map_dataset_toy_mc():
+    axis = MapAxis.from_energy_bounds(1, 10, nbin=2, unit="TeV")
+    geom = WcsGeom.create(npix=10, binsz=0.1, axes=[axis])
+
+    dataset = MapDataset.create(geom, name="test")
+    dataset.background.data += 10
+    dataset.mask_safe.data[...] = True
+    dataset.models = [FoVBackgroundModel(dataset_name="test")]
+
+    name = dataset.models.parameters_unique_names[0]
+    toy_mc = MapDatasetToyMC(
+        n_realizations=3, null_hypothesis={name: 1}, random_state=0
+    )
+    table = toy_mc.run(dataset)
+
+    assert len(table) == 3
+    assert_allclose(table["realization"], [0, 1, 2])
+    assert np.all(table["success"])
+    assert_allclose(table[name], 1, rtol=0.1)
+    assert np.all(table["ts"] > -1e-3)
+    assert_allclose(table["ts"], [0.018018, 0.007995, 0.112776], rtol=1e-2)
+    assert_allclose(table["ts"], table["stat_null"] - table["stat"])
+
+    # parameters of the input dataset are not modified
+    assert_allclose(dataset.models.parameters[name.split(".")[-1]].value, 1)
+
+    # the serial path does not keep a dataset copy in the worker global
+    assert simulate._TOY_MC_DATASET is None
+
+
+def test_map_dataset_on_off_toy_mc():
+    axis = MapAxis.from_energy_bounds(1, 10, nbin=2, unit="TeV")
+    geom = WcsGeom.create(npix=10, binsz=0.1, axes=[axis])
+
+    dataset = MapDataset.create(geom, name="test")
+    dataset.exposure.data += 1e11
+    dataset.background.data += 10
+    dataset.mask_safe.data[...] = True
+    dataset = MapDatasetOnOff.from_map_dataset(
+        dataset, acceptance=1, acceptance_off=10
+    )
+
+    model = SkyModel(
+        spatial_model=PointSpatialModel(frame="icrs"),
+        spectral_model=PowerLawSpectralModel(),
+        name="source",
+    )
+    model.spatial_model.parameters.freeze_all()
+    model.spectral_model.index.frozen = True
+    dataset.models = [model]
+    counts_off = dataset.counts_off.data.copy()
+
+    toy_mc = MapDatasetToyMC(n_realizations=2, random_state=0)
+    table = toy_mc.run(dataset)
+
+    assert len(table) == 2
+    assert np.all(table["success"])
+    assert_allclose(table["source.spectral.amplitude"], 1e-12, rtol=0.3)
+    assert_allclose(dataset.counts_off.data, counts_off)
@@ -18,6 +18,7 @@ ESTIMATOR_REGISTRY = Registry(
         ASmoothMapEstimator,
         FluxPointsEstimator,
         LightCurveEstimator,
+        LightCurveTemplateEstimator,
         SensitivityEstimator,
         ImageProfileEstimator,
         ExcessProfileEstimator,
@@ -8,7 +8,7 @@ from gammapy.datasets import Datasets, MapDatasetOnOff
 from gammapy.maps import Map, WcsNDMap
 from gammapy.modeling.models import PowerLawSpectralModel
 from gammapy.stats import CashCountsStatistic
-from gammapy.utils.array import scale_cube
+from gammapy.utils.array import iter_scale_space
 from .core import Estimator
 from .utils import estimate_exposure_reco_energy
 
@@ -211,17 +211,14 @@ class ASmoothMapEstimator(Estimator):
         pixel_scale = dataset_image.counts.geom.pixel_scales.mean()
         kernels = self.get_kernels(pixel_scale)
 
-        cubes = {}
-        cubes["counts"] = scale_cube(counts, kernels)
-        cubes["background"] = scale_cube(background, kernels)
+        data = {"counts": counts, "background": background}
 
         if exposure is not None:
             flux = (dataset_image.counts - background) / exposure
-            cubes["flux"] = scale_cube(flux.data[0], kernels)
+            data["flux"] = flux.data[0]
 
-        cubes["sqrt_ts"] = self._sqrt_ts_cube(cubes, method=self.method)
-
-        smoothed = self._reduce_cubes(cubes, kernels)
+        images = iter_scale_space(data, kernels)
+        smoothed = self._reduce_images(images, kernels, shape=counts.shape)
 
         result = {}
 
@@ -245,41 +242,45 @@ class ASmoothMapEstimator(Estimator):
 
         return result
 
-    def _reduce_cubes(self, cubes, kernels):
+    def _reduce_images(self, images, kernels, shape):
         """
-        Combine scale cube to image.
+        Combine scale space images to image.
+
+        The images are consumed one scale after the other, the value of the
+        first scale with sqrt_ts > threshold is taken.
 
         Parameters
         ----------
-        cubes : dict
-            Data cubes
+        images : iterable of dict
+            Data images per scale, as returned by
+            `~gammapy.utils.array.iter_scale_space`.
+        kernels : list of `~astropy.convolution.Kernel`
+            List of kernels.
+        shape : tuple
+            Image shape.
         """
-        shape = cubes["counts"].shape[:2]
         smoothed = {}
 
         # Init smoothed data arrays
         for key in ["counts", "background", "scale", "sqrt_ts"]:
             smoothed[key] = np.tile(np.nan, shape)
 
-        if "flux" in cubes:
-            smoothed["flux"] = np.tile(np.nan, shape)
-
-        for idx, scale in enumerate(self.scales):
-            # slice out 2D image at index idx out of cube
-            slice_ = np.s_[:, :, idx]
+        for idx, (scale, image) in enumerate(zip(self.scales, images)):
+            sqrt_ts = self._sqrt_ts_cube(image, method=self.method)
 
             mask = np.isnan(smoothed["counts"])
-            mask = (cubes["sqrt_ts"][slice_] > self.threshold) & mask
+            mask = (sqrt_ts > self.threshold) & mask
 
             smoothed["scale"][mask] = scale
-            smoothed["sqrt_ts"][mask] = cubes["sqrt_ts"][slice_][mask]
+            smoothed["sqrt_ts"][mask] = sqrt_ts[mask]
 
             # renormalize smoothed data arrays
             norm = kernels[idx].array.sum()
             for key in ["counts", "background"]:
-                smoothed[key][mask] = cubes[key][slice_][mask] / norm
+                smoothed[key][mask] = image[key][mask] / norm
 
-            if "flux" in cubes:
-                smoothed["flux"][mask] = cubes["flux"][slice_][mask] / norm
+            if "flux" in image:
+                smoothed.setdefault("flux", np.tile(np.nan, shape))
+                smoothed["flux"][mask] = image["flux"][mask] / norm
 
         return smoothed
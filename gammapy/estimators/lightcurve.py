@@ -5,13 +5,17 @@ import astropy.units as u
 from astropy.table import Table
 from astropy.time import Time
 from gammapy.data import GTI
-from gammapy.datasets import Datasets
+from gammapy.datasets import Datasets, MapDataset, MapDatasetOnOff
+from gammapy.maps import Map
+from gammapy.stats import cash
+from gammapy.stats.counts_statistic import _root_bracketed
 from gammapy.utils.scripts import make_path
 from gammapy.utils.table import table_from_row_data
 from .core import Estimator
+from .flux import FluxEstimator
 from .flux_point import FluxPoints, FluxPointsEstimator
 
-__all__ = ["LightCurve", "LightCurveEstimator"]
+__all__ = ["LightCurve", "LightCurveEstimator", "LightCurveTemplateEstimator"]
 
 log = logging.getLogger(__name__)
 
@@ -470,3 +474,469 @@ class LightCurveEstimator(Estimator):
 
         # return fp.to_sed_type("flux")#
         return result
+
+
+class _TemplateNormFit:
+    """Joint Cash fit of one norm per group of data points for fixed templates.
+
+    The predicted counts are ``background + norm[group] * template``. As every
+    data point depends on a single norm, the gradient and the Hessian of the
+    total statistic are diagonal and all norms are fitted at once with a
+    vectorised Newton iteration.
+
+    Parameters
+    ----------
+    counts, background, template : `~numpy.ndarray`
+        Counts, fixed predicted counts and predicted counts of the template for
+        norm 1, per data point.
+    group : `~numpy.ndarray`
+        Group index of the data points.
+    n_groups : int
+        Number of groups.
+    """
+
+    def __init__(self, counts, background, template, group, n_groups):
+        self.n_groups = n_groups
+        self.counts_sum = np.bincount(group, counts, minlength=n_groups)
+
+        # data points without template contribution only add a constant
+        is_const = template == 0
+        self.stat_const = np.bincount(
+            group[is_const],
+            cash(counts[is_const], background[is_const]),
+            minlength=n_groups,
+        )
+
+        keep = ~is_const
+        self.counts = counts[keep]
+        self.background = background[keep]
+        self.template = template[keep]
+        self.group = group[keep]
+
+        # lowest norm keeping the predicted counts positive
+        self.norm_min = np.full(n_groups, -np.inf)
+        is_pos = self.template > 0
+        np.maximum.at(
+            self.norm_min,
+            self.group[is_pos],
+            -self.background[is_pos] / self.template[is_pos],
+        )
+
+    @property
+    def is_valid(self):
+        """Whether the template contributes to the group"""
+        return np.isfinite(self.norm_min)
+
+    def _sum(self, values):
+        return np.bincount(self.group, values, minlength=self.n_groups)
+
+    def _npred(self, norm):
+        return self.background + norm[self.group] * self.template
+
+    def stat(self, norm):
+        """Fit statistic per group.
+
+        Parameters
+        ----------
+        norm : `~numpy.ndarray`
+            Norm per group.
+
+        Returns
+        -------
+        stat : `~numpy.ndarray`
+            Fit statistic per group.
+        """
+        norm = np.broadcast_to(norm, (self.n_groups,))
+        return self._sum(cash(self.counts, self._npred(norm))) + self.stat_const
+
+    def _stat_fcn(self, norm_ref, stat_ref):
+        """Stat difference for a subset of groups, see `_root_bracketed`"""
+
+        def fcn(x, index):
+            norm = norm_ref.copy()
+            norm[index] = x
+            return self.stat(norm)[index] - stat_ref[index]
+
+        return fcn
+
+    def _derivatives(self, norm):
+        npred = self._npred(norm)
+        grad = 2 * self._sum(self.template * (1 - self.counts / npred))
+        hess = 2 * self._sum(self.counts * (self.template / npred) ** 2)
+        return grad, hess
+
+    def fit(self, tol=1e-8, maxiter=100):
+        """Fit the norms.
+
+        The statistic is convex in the norm and the gradient concave, so the
+        Newton iteration converges monotonically from below. Steps crossing
+        the lower bound are replaced by a bisection towards it.
+
+        Parameters
+        ----------
+        tol : float
+            Relative tolerance on the norm.
+        maxiter : int
+            Maximum number of iterations.
+
+        Returns
+        -------
+        norm, norm_err : `~numpy.ndarray`
+            Best fit norms and their symmetric errors.
+        success : `~numpy.ndarray`
+            Whether the fit converged.
+        """
+        template_sum = self._sum(self.template)
+        excess = self._sum(self.counts - self.background)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            norm = np.where(template_sum > 0, excess / template_sum, 1.0)
+
+        norm = np.where(norm > self.norm_min, norm, self.norm_min + 1)
+        active = self.is_valid.copy()
+        success = np.zeros(self.n_groups, dtype=bool)
+
+        for _ in range(maxiter):
+            if not active.any():
+                break
+
+            grad, hess = self._derivatives(norm)
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                step = np.where(hess > 0, -grad / hess, -np.inf)
+
+            norm_new = norm + step
+            below = ~(norm_new > self.norm_min)
+            norm_new[below] = 0.5 * (norm[below] + self.norm_min[below])
+
+            converged = np.abs(norm_new - norm) <= tol * (1 + np.abs(norm))
+            norm = np.where(active, norm_new, norm)
+            success |= active & converged
+            active &= ~converged
+
+        _, hess = self._derivatives(norm)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            norm_err = np.sqrt(2 / hess)
+
+        norm[~self.is_valid] = np.nan
+        norm_err[~self.is_valid] = np.nan
+        return norm, norm_err, success
+
+    def confidence(self, norm, norm_err, n_sigma, upper=True):
+        """Distance to the norm where the statistic increases by ``n_sigma ** 2``.
+
+        Parameters
+        ----------
+        norm, norm_err : `~numpy.ndarray`
+            Best fit norms and their symmetric errors.
+        n_sigma : float
+            Number of sigma.
+        upper : bool
+            Whether to search above or below the best fit norm.
+
+        Returns
+        -------
+        err : `~numpy.ndarray`
+            Positive distance to the best fit norm, NaN if not found.
+        """
+        is_valid = np.isfinite(norm)
+        norm_ref = np.where(is_valid, norm, 0)
+        stat_ref = self.stat(norm_ref) + n_sigma ** 2
+        fcn = self._stat_fcn(norm_ref, stat_ref)
+        index = np.arange(self.n_groups)
+
+        width = 2 * n_sigma * np.where(np.isfinite(norm_err), norm_err, 1) + 1e-3
+        width = np.where(is_valid, width, 0)
+
+        # the bound is kept just above the lower bound of the norm
+        norm_min = np.where(is_valid, self.norm_min, 0)
+        limit = norm_min + 1e-6 * (norm_ref - norm_min)
+
+        # expand the bracket until it contains the root
+        for _ in range(50):
+            if upper:
+                bound = norm_ref + width
+                expand = fcn(bound, index) <= 0
+            else:
+                bound = np.maximum(norm_ref - width, limit)
+                expand = (fcn(bound, index) <= 0) & (bound > limit)
+
+            expand &= is_valid
+            if not expand.any():
+                break
+            width[expand] *= 2
+
+        bounds = (norm_ref, bound) if upper else (bound, norm_ref)
+        roots = _root_bracketed(fcn, *bounds)
+        return np.where(is_valid, np.abs(roots - norm_ref), np.nan)
+
+
+class LightCurveTemplateEstimator(Estimator):
+    """Estimate light curve with a fixed source template.
+
+    In contrast to `LightCurveEstimator`, which runs an independent fit per
+    time interval, the predicted counts of the source and of all other model
+    components are computed only once per dataset, with the current model
+    parameters. Only the norm of the source per time interval and energy bin
+    varies, and all norms are fitted jointly with analytic derivatives of the
+    Cash statistic. This is equivalent to `LightCurveEstimator` with
+    ``reoptimize=False``, but scales to light curves with many time intervals.
+
+    Only datasets using the Cash statistic, i.e. `~gammapy.datasets.MapDataset`
+    and `~gammapy.datasets.SpectrumDataset`, are supported.
+
+    Parameters
+    ----------
+    time_intervals : list of `astropy.time.Time`
+        Start and stop time for each interval to compute the LC
+    source : str
+        For which source in the model to compute the flux points. Default is 0
+    energy_edges : `~astropy.units.Quantity`
+        Energy edges of the light curve.
+    atol : `~astropy.units.Quantity`
+        Tolerance value for time comparison with different scale. Default 1e-6 sec.
+    norm_min : float
+        Minimum value for the norm used for the fit statistic profile evaluation.
+    norm_max : float
+        Maximum value for the norm used for the fit statistic profile evaluation.
+    norm_n_values : int
+        Number of norm values used for the fit statistic profile.
+    norm_values : `numpy.ndarray`
+        Array of norm values to be used for the fit statistic profile.
+    n_sigma : int
+        Number of sigma to use for asymmetric error computation. Default is 1.
+    n_sigma_ul : int
+        Number of sigma to use for upper limit computation. Default is 2.
+    selection_optional : list of str
+        Which steps to execute. Available options are:
+
+            * "errn-errp": estimate asymmetric errors.
+            * "ul": estimate upper limits.
+            * "scan": estimate fit statistic profiles.
+
+        By default all steps are executed.
+    """
+
+    tag = "LightCurveTemplateEstimator"
+    _available_selection_optional = ["errn-errp", "ul", "scan"]
+
+    def __init__(
+        self,
+        time_intervals=None,
+        source=0,
+        energy_edges=None,
+        atol="1e-6 s",
+        norm_min=0.2,
+        norm_max=5,
+        norm_n_values=11,
+        norm_values=None,
+        n_sigma=1,
+        n_sigma_ul=2,
+        selection_optional="all",
+    ):
+        self.source = source
+        self.time_intervals = time_intervals
+
+        self.atol = u.Quantity(atol)
+
+        self.energy_edges = energy_edges
+
+        self.norm_min = norm_min
+        self.norm_max = norm_max
+        self.norm_n_values = norm_n_values
+        self.norm_values = norm_values
+        self.n_sigma = n_sigma
+        self.n_sigma_ul = n_sigma_ul
+        self.selection_optional = selection_optional
+
+    def _get_norm_values(self):
+        if self.norm_values is None:
+            return np.logspace(
+                np.log10(self.norm_min), np.log10(self.norm_max), self.norm_n_values
+            )
+        return np.asarray(self.norm_values)
+
+    @staticmethod
+    def _get_energy_groups(energy_axis, energy_edges):
+        """Energy bin group index per energy bin of the dataset, -1 if outside.
+
+        The energy edges are rounded to the dataset energy bins, the same
+        way as in `~gammapy.datasets.MapDataset.slice_by_energy`.
+        """
+        edges_pix = energy_axis.coord_to_pix(energy_edges)
+        edges_pix = np.clip(edges_pix, -0.5, energy_axis.nbin - 0.5)
+        edges_idx = np.round(edges_pix + 0.5).astype(int)
+
+        idx = np.arange(energy_axis.nbin)
+        groups = np.searchsorted(edges_idx, idx, side="right") - 1
+        groups[groups >= len(energy_edges) - 1] = -1
+
+        edges = energy_axis.edges[edges_idx]
+        return groups, edges
+
+    def _make_norm_fit(self, datasets, time_idx, energy_edges):
+        """Collect the data points of all datasets for the joint norm fit"""
+        model = datasets.models[self.source]
+        n_energy = len(energy_edges) - 1
+
+        columns, edges_ref = [], None
+
+        for dataset, idx in zip(datasets, time_idx):
+            if isinstance(dataset, MapDatasetOnOff) or not isinstance(
+                dataset, MapDataset
+            ):
+                raise TypeError(
+                    f"{self.tag} does not support datasets of type {dataset.tag}"
+                )
+
+            if model.name not in dataset.evaluators:
+                log.debug(f"Source not defined for dataset {dataset.name}")
+                continue
+
+            # the total npred updates the evaluators, the source npred is
+            # then taken from the cache and stacked onto the dataset geometry,
+            # as it is evaluated on a cutout in local evaluation mode
+            npred = dataset.npred().data
+
+            template = Map.from_geom(dataset._geom, dtype=float)
+            if dataset.evaluators[model.name].contributes:
+                template.stack(dataset.npred_signal(model=model))
+            template = template.data
+
+            energy_axis = dataset.counts.geom.axes["energy"]
+            groups, edges = self._get_energy_groups(energy_axis, energy_edges)
+
+            if edges_ref is None:
+                edges_ref = edges
+
+            group = groups.reshape((-1,) + (1,) * (npred.ndim - 1))
+            group = np.broadcast_to(group, npred.shape)
+            mask = group >= 0
+
+            if dataset.mask is not None:
+                mask &= dataset.mask.data
+
+            columns.append(
+                (
+                    dataset.counts.data[mask].astype(float),
+                    (npred - template)[mask],
+                    template[mask],
+                    idx * n_energy + group[mask],
+                )
+            )
+
+        if len(columns) == 0:
+            raise ValueError(f"{self.tag}: No datasets contain the source model")
+
+        counts, background, template, group = [np.concatenate(_) for _ in zip(*columns)]
+        n_groups = (np.max(time_idx) + 1) * n_energy
+        norm_fit = _TemplateNormFit(counts, background, template, group, n_groups)
+        return norm_fit, model.spectral_model, edges_ref
+
+    def run(self, datasets):
+        """Run light curve extraction.
+
+        Parameters
+        ----------
+        datasets : list of `~gammapy.datasets.SpectrumDataset` or `~gammapy.datasets.MapDataset`
+            Spectrum or Map datasets.
+
+        Returns
+        -------
+        lightcurve : `~gammapy.estimators.LightCurve`
+            the Light Curve object
+        """
+        datasets = Datasets(datasets)
+
+        if self.time_intervals is None:
+            gti = datasets.gti
+        else:
+            gti = GTI.from_time_intervals(self.time_intervals)
+
+        gti = gti.union(overlap_ok=False, merge_equal=False)
+
+        if self.energy_edges is None:
+            energy_min, energy_max = datasets.energy_ranges
+            energy_edges = u.Quantity([energy_min.min(), energy_max.max()])
+        else:
+            energy_edges = u.Quantity(self.energy_edges)
+
+        datasets_to_fit, time_idx, time_min, time_max = [], [], [], []
+
+        for t_min, t_max in gti.time_intervals:
+            selected = datasets.select_time(t_min=t_min, t_max=t_max, atol=self.atol)
+
+            if len(selected) == 0:
+                log.debug(f"No Dataset for the time interval {t_min} to {t_max}")
+                continue
+
+            datasets_to_fit.extend(selected)
+            time_idx.extend([len(time_min)] * len(selected))
+            time_min.append(t_min.mjd)
+            time_max.append(t_max.mjd)
+
+        if len(time_min) == 0:
+            raise ValueError(f"{self.tag}: No datasets in time intervals")
+
+        norm_fit, model, edges = self._make_norm_fit(
+            Datasets(datasets_to_fit), time_idx, energy_edges
+        )
+
+        table = Table()
+        table["time_min"] = time_min
+        table["time_max"] = time_max
+
+        shape = (len(time_min), len(energy_edges) - 1)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = FluxEstimator.get_reference_flux_values(
+                model, edges[:-1], edges[1:]
+            )
+
+        for name, value in values.items():
+            table[name] = value * np.ones(shape)
+
+        for name, value in self._estimate_norms(norm_fit, shape).items():
+            table[name] = value
+
+        table.meta["SED_TYPE"] = "likelihood"
+
+        table = FluxPoints(table).to_sed_type("flux").table
+        return LightCurve(table)
+
+    def _estimate_norms(self, norm_fit, shape):
+        """Fit the norms and estimate the optional quantities"""
+        norm, norm_err, success = norm_fit.fit()
+        stat = norm_fit.stat(np.where(np.isfinite(norm), norm, 0))
+        ts = norm_fit.stat(0) - stat
+
+        result = {
+            "norm": norm,
+            "stat": stat,
+            "success": success,
+            "norm_err": self.n_sigma * norm_err,
+            "ts": ts,
+            "sqrt_ts": self.get_sqrt_ts(ts, norm),
+            "counts": norm_fit.counts_sum,
+        }
+
+        if "errn-errp" in self.selection_optional:
+            for key, upper in [("norm_errp", True), ("norm_errn", False)]:
+                result[key] = norm_fit.confidence(
+                    norm, norm_err, n_sigma=self.n_sigma, upper=upper
+                )
+
+        if "ul" in self.selection_optional:
+            errp = norm_fit.confidence(norm, norm_err, n_sigma=self.n_sigma_ul)
+            result["norm_ul"] = norm + errp
+
+        result = {key: value.reshape(shape) for key, value in result.items()}
+
+        if "scan" in self.selection_optional:
+            norm_values = self._get_norm_values()
+            stat_scan = np.stack([norm_fit.stat(value) for value in norm_values], -1)
+            result["norm_scan"] = norm_values * np.ones(shape + (1,))
+            result["stat_scan"] = stat_scan.reshape(shape + norm_values.shape)
+
+        return result
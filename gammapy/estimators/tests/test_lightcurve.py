@@ -6,14 +6,23 @@ import astropy.units as u
 from astropy.table import Column, Table
 from astropy.time import Time
 from gammapy.data import GTI
-from gammapy.datasets import Datasets
-from gammapy.estimators import LightCurve, LightCurveEstimator
+from gammapy.datasets import Datasets, MapDataset
+from gammapy.estimators import (
+    LightCurve,
+    LightCurveEstimator,
+    LightCurveTemplateEstimator,
+)
 from gammapy.estimators.tests.test_flux_point_estimator import (
     simulate_map_dataset,
     simulate_spectrum_dataset,
 )
-from gammapy.maps import RegionNDMap
-from gammapy.modeling.models import FoVBackgroundModel, PowerLawSpectralModel, SkyModel
+from gammapy.maps import MapAxis, RegionNDMap, WcsGeom
+from gammapy.modeling.models import (
+    FoVBackgroundModel,
+    PointSpatialModel,
+    PowerLawSpectralModel,
+    SkyModel,
+)
 from gammapy.utils.testing import mpl_plot_check, requires_data, requires_dependency
 
 
@@ -534,3 +543,82 @@ def test_lightcurve_estimator_map_datasets():
     assert_allclose(lightcurve2.table["norm_err"][0], [0.031508], rtol=1e-2)
     assert_allclose(lightcurve.table["counts"][0], [2205])
     assert_allclose(lightcurve2.table["ts"][0], [2557.346464], rtol=1e-2)
+
+
+@requires_data()
+def test_lightcurve_template_estimator_map_datasets():
+    datasets = get_map_datasets()
+
+    time_intervals = [
+        Time(["2010-01-01T00:00:00", "2010-01-01T01:00:00"]),
+        Time(["2010-01-01T01:00:00", "2010-01-01T02:00:00"]),
+    ]
+    estimator = LightCurveTemplateEstimator(
+        energy_edges=[1, 100] * u.TeV,
+        source="test_source",
+        time_intervals=time_intervals,
+        norm_n_values=3,
+    )
+    lightcurve = estimator.run(datasets)
+    table = lightcurve.table
+
+    # same results as the LightCurveEstimator without re-optimization
+    assert_allclose(table["time_min"], [55197.0, 55197.041667])
+    assert_allclose(table["time_max"], [55197.041667, 55197.083333])
+    assert_allclose(table["e_min"], [[1.178769], [1.178769]], rtol=1e-5)
+    assert_allclose(table["e_max"], [[100], [100]])
+    assert_allclose(table["ref_flux"], [[8.383429e-12], [8.383429e-12]], rtol=1e-5)
+    assert_allclose(table["stat"], [[9402.778975], [9517.750207]], rtol=1e-2)
+    assert_allclose(table["norm"], [[0.971592], [0.963286]], rtol=1e-2)
+    assert_allclose(table["norm_err"], [[0.044643], [0.044475]], rtol=1e-2)
+    assert_allclose(table["ts"], [[1287.4003], [1269.963491]], rtol=1e-2)
+    assert_allclose(table["counts"][0], [2205])
+    assert np.all(table["success"])
+
+    assert np.all(table["norm_errp"] > 0)
+    assert np.all(table["norm_errn"] > 0)
+    assert np.all(table["norm_ul"] > table["norm"])
+    assert table["stat_scan"].shape == (2, 1, 3)
+    assert_allclose(table["flux"], table["norm"] * table["ref_flux"])
+
+
+def test_lightcurve_template_estimator_point_source_cutout():
+    axis = MapAxis.from_energy_bounds(1, 10, nbin=2, unit="TeV")
+    geom = WcsGeom.create(npix=40, binsz=0.1, axes=[axis])
+
+    model = SkyModel(
+        spatial_model=PointSpatialModel(lon_0="0.2 deg", lat_0="0.1 deg", frame="icrs"),
+        spectral_model=PowerLawSpectralModel(amplitude="1e-11 cm-2 s-1 TeV-1"),
+        name="source",
+    )
+
+    datasets = []
+    for idx in range(2):
+        dataset = MapDataset.create(geom, name=f"dataset_{idx}")
+        dataset.psf, dataset.edisp = None, None
+        dataset.exposure.data += 1e9
+        dataset.background.data += 0.1
+        dataset.mask_safe.data[...] = True
+        dataset.gti = GTI.create(f"{idx}h", f"{idx + 1}h", "2010-01-01T00:00:00")
+        dataset.models = [model, FoVBackgroundModel(dataset_name=dataset.name)]
+        dataset.fake(random_state=idx)
+        datasets.append(dataset)
+
+    # the source is evaluated on a cutout smaller than the dataset geometry
+    npred_source = datasets[0].npred_signal(model=datasets[0].models["source"])
+    assert npred_source.data.shape != geom.data_shape
+
+    estimator = LightCurveTemplateEstimator(source="source", norm_n_values=3)
+    table = estimator.run(datasets).table
+
+    # same results as the LightCurveEstimator without re-optimization
+    estimator = LightCurveEstimator(
+        source="source", reoptimize=False, selection_optional=[]
+    )
+    table_ref = estimator.run(datasets).table
+
+    assert len(table) == 2
+    assert np.all(table["success"])
+    assert_allclose(table["norm"], table_ref["norm"], rtol=1e-4)
+    assert_allclose(table["norm_err"], table_ref["norm_err"], rtol=1e-4)
+    assert_allclose(table["ts"], table_ref["ts"], rtol=1e-4)
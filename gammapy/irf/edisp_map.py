@@ -1,5 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+from collections import OrderedDict
 import numpy as np
+from astropy.coordinates import SkyCoord
 from scipy.interpolate import interp1d
 from gammapy.maps import Map, MapAxis, MapCoord, RegionGeom, WcsGeom
 from gammapy.utils.random import InverseCDFSampler, get_random_state
@@ -77,9 +79,11 @@ class EDispMap(IRFMap):
     """
     tag = "edisp_map"
     required_axes = ["migra", "energy_true"]
+    kernel_cache_size = 128
 
     def __init__(self, edisp_map, exposure_map=None):
         super().__init__(irf_map=edisp_map, exposure_map=exposure_map)
+        self._kernel_cache = OrderedDict()
 
     @property
     def edisp_map(self):
@@ -88,8 +92,22 @@ class EDispMap(IRFMap):
     @edisp_map.setter
     def edisp_map(self, value):
         self._irf_map = value
+        self._kernel_cache = OrderedDict()
 
-    def get_edisp_kernel(self, position, energy_axis):
+    def stack(self, other, weights=None):
+        """Stack EDisp map with another one in place.
+
+        Parameters
+        ----------
+        other : `~gammapy.irf.EDispMap`
+            EDisp map to be stacked with this one.
+        weights : `~gammapy.maps.Map`
+            Map with stacking weights.
+        """
+        super().stack(other=other, weights=weights)
+        self._kernel_cache = OrderedDict()
+
+    def get_edisp_kernel(self, position, energy_axis, use_cache=False):
         """Get energy dispersion at a given position.
 
         Parameters
@@ -98,6 +116,13 @@ class EDispMap(IRFMap):
             the target position. Should be a single coordinates
         energy_axis : `MapAxis`
             Reconstructed energy axis
+        use_cache : bool
+            Whether to use the kernel cache. If True the energy dispersion is
+            evaluated at the center of the nearest IRF pixel, and the kernel
+            is stored and re-used for all positions falling into the same
+            pixel with the same reconstructed energy axis. The least recently
+            used kernels are evicted once more than
+            ``EDispMap.kernel_cache_size`` kernels are stored.
 
         Returns
         -------
@@ -112,6 +137,33 @@ class EDispMap(IRFMap):
                 "EnergyDispersion can be extracted at one single position only."
             )
 
+        if not use_cache:
+            return self._get_edisp_kernel(position, energy_axis)
+
+        geom = self.edisp_map.geom.to_image()
+
+        if not isinstance(geom, WcsGeom):
+            return self._get_edisp_kernel(position, energy_axis)
+
+        idx_x, idx_y = [int(_) for _ in np.ravel(geom.coord_to_idx(position))]
+
+        if idx_x < 0 or idx_y < 0:
+            return self._get_edisp_kernel(position, energy_axis)
+
+        key = (idx_x, idx_y, tuple(energy_axis.edges.to_value("TeV")))
+
+        if key in self._kernel_cache:
+            self._kernel_cache.move_to_end(key)
+        else:
+            position = SkyCoord.from_pixel(idx_x, idx_y, geom.wcs)
+            self._kernel_cache[key] = self._get_edisp_kernel(position, energy_axis)
+
+            while len(self._kernel_cache) > self.kernel_cache_size:
+                self._kernel_cache.popitem(last=False)
+
+        return self._kernel_cache[key]
+
+    def _get_edisp_kernel(self, position, energy_axis):
         energy_axis_true = self.edisp_map.geom.axes["energy_true"]
         migra_axis = self.edisp_map.geom.axes["migra"]
 
@@ -122,35 +174,35 @@ class EDispMap(IRFMap):
         }
 
         # Interpolate in the EDisp map. Squeeze to remove dimensions of length 1
-        values = self.edisp_map.interp_by_coord(coords) * self.edisp_map.unit
-        edisp_values = values[:, :, 0, 0]
+        values = self.edisp_map.interp_by_coord(coords)
+        edisp_values = values[:, :, 0, 0].T
 
-        data = []
+        cumsum = np.insert(edisp_values, 0, 0, axis=1).cumsum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cumsum = np.nan_to_num(cumsum / cumsum[:, [-1]])
 
-        for idx, energy_true in enumerate(energy_axis_true.center):
-            # migration value of energy bounds
-            migra = energy_axis.edges / energy_true
+        # migration value of energy bounds, for all true energies at once
+        migra = energy_axis.edges / energy_axis_true.center[:, np.newaxis]
+        migra = migra.to_value("")
 
-            cumsum = np.insert(edisp_values[:, idx], 0, 0).cumsum()
-            with np.errstate(invalid="ignore", divide="ignore"):
-                cumsum = np.nan_to_num(cumsum / cumsum[-1])
+        # linear interpolation of the cumulative migra distribution
+        edges = migra_axis.edges.value
+        idx = np.searchsorted(edges, migra, side="right") - 1
+        idx = np.clip(idx, 0, len(edges) - 2)
+        weights = (migra - edges[idx]) / np.diff(edges)[idx]
 
-            f = interp1d(
-                migra_axis.edges.value,
-                cumsum,
-                kind="linear",
-                bounds_error=False,
-                fill_value=(0, 1),
-            )
+        lo = np.take_along_axis(cumsum, idx, axis=1)
+        hi = np.take_along_axis(cumsum, idx + 1, axis=1)
+        values = lo + weights * (hi - lo)
 
-            # We compute the difference between 2 successive bounds in energy
-            # to get integral over reco energy bin
-            integral = np.diff(np.clip(f(migra), a_min=0, a_max=1))
-            data.append(integral)
+        values = np.where(migra < edges[0], 0, values)
+        values = np.where(migra > edges[-1], 1, values)
 
-        return EDispKernel(
-            axes=[energy_axis_true, energy_axis], data=np.array(data)
-        )
+        # We compute the difference between 2 successive bounds in energy
+        # to get integral over reco energy bin
+        data = np.diff(np.clip(values, a_min=0, a_max=1), axis=1)
+
+        return EDispKernel(axes=[energy_axis_true, energy_axis], data=data)
 
     @classmethod
     def from_geom(cls, geom):
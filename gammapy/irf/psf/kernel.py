@@ -3,6 +3,7 @@ import numpy as np
 import astropy.units as u
 from gammapy.maps import Map
 from gammapy.modeling.models import PowerLawSpectralModel
+from gammapy.utils.interpolation import interpolation_scale
 
 __all__ = ["PSFKernel"]
 
@@ -116,9 +117,24 @@ class PSFKernel:
         geom_upsampled = geom.upsample(factor=factor)
         rad = geom_upsampled.separation(geom.center_skydir)
 
-        energy_axis = geom.axes["energy_true"]
-        energy = energy_axis.center[:, np.newaxis, np.newaxis]
-        data = table_psf.evaluate(energy_true=energy, rad=rad).value
+        # The PSF is radially symmetric, so it is evaluated once per energy on
+        # the rad nodes of the table and then interpolated linearly in radius,
+        # which is equivalent to the bilinear interpolation of the table.
+        rad_axis = table_psf.axes["rad"]
+        scale = interpolation_scale(rad_axis.interp)
+        rad_nodes = scale(rad_axis.center)
+        rad_pix = scale(rad.to(rad_axis.unit))
+
+        energy = geom.axes["energy_true"].center[:, np.newaxis]
+        values = table_psf._interpolate((energy, rad_axis.center), clip=False)
+        values = u.Quantity(values, copy=False).value
+
+        idx = np.searchsorted(rad_nodes, rad_pix) - 1
+        idx = np.clip(idx, 0, len(rad_nodes) - 2)
+        weights = (rad_pix - rad_nodes[idx]) / np.diff(rad_nodes)[idx]
+
+        lo, hi = values[:, idx], values[:, idx + 1]
+        data = np.clip(lo + weights * (hi - lo), 0, np.inf)
 
         kernel_map = Map.from_geom(geom=geom_upsampled, data=data)
         kernel_map = kernel_map.downsample(factor, preserve_counts=True)
@@ -1,6 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+from collections import OrderedDict
 import numpy as np
 import astropy.units as u
+from astropy.coordinates import SkyCoord
 from gammapy.maps import Map, MapCoord, WcsGeom, MapAxes
 from gammapy.modeling.models import PowerLawSpectralModel
 from gammapy.utils.random import InverseCDFSampler, get_random_state
@@ -68,9 +70,11 @@ class PSFMap(IRFMap):
     """
     tag = "psf_map"
     required_axes = ["rad", "energy_true"]
+    kernel_cache_size = 128
 
     def __init__(self, psf_map, exposure_map=None):
         super().__init__(irf_map=psf_map, exposure_map=exposure_map)
+        self._kernel_cache = OrderedDict()
 
     @property
     def psf_map(self):
@@ -79,6 +83,20 @@ class PSFMap(IRFMap):
     @psf_map.setter
     def psf_map(self, value):
         self._irf_map = value
+        self._kernel_cache = OrderedDict()
+
+    def stack(self, other, weights=None):
+        """Stack PSF map with another one in place.
+
+        Parameters
+        ----------
+        other : `~gammapy.irf.PSFMap`
+            PSF map to be stacked with this one.
+        weights : `~gammapy.maps.Map`
+            Map with stacking weights.
+        """
+        super().stack(other=other, weights=weights)
+        self._kernel_cache = OrderedDict()
 
     def get_energy_dependent_table_psf(self, position=None):
         """Get energy-dependent PSF at a given position.
@@ -134,10 +152,14 @@ class PSFMap(IRFMap):
             exposure=exposure,
         )
 
-    def get_psf_kernel(self, position, geom, max_radius=None, factor=4):
+    def get_psf_kernel(
+        self, position, geom, max_radius=None, factor=4, use_cache=False
+    ):
         """Returns a PSF kernel at the given position.
 
         The PSF is returned in the form a WcsNDMap defined by the input Geom.
+        For a `~gammapy.maps.HpxGeom`, a local WCS geometry with half the
+        HEALPix pixel size is used.
 
         Parameters
         ----------
@@ -149,6 +171,13 @@ class PSFMap(IRFMap):
             maximum angular size of the kernel map
         factor : int
             oversampling factor to compute the PSF
+        use_cache : bool
+            Whether to use the kernel cache. If True the PSF is evaluated at
+            the center of the nearest PSF map pixel, and the kernel is stored
+            and re-used for all positions falling into the same pixel with an
+            equivalent target geometry, ``max_radius`` and ``factor``. The
+            least recently used kernels are evicted once more than
+            ``PSFMap.kernel_cache_size`` kernels are stored.
 
         Returns
         -------
@@ -158,6 +187,74 @@ class PSFMap(IRFMap):
         if position is None:
             position = self.psf_map.geom.center_skydir
 
+        if geom.is_hpx:
+            geom = self._get_kernel_geom_hpx(geom, max_radius)
+
+        geom_image = self.psf_map.geom.to_image()
+
+        if not use_cache or not isinstance(geom_image, WcsGeom):
+            return self._get_psf_kernel(position, geom, max_radius, factor)
+
+        idx_x, idx_y = [int(_) for _ in np.ravel(geom_image.coord_to_idx(position))]
+
+        if idx_x < 0 or idx_y < 0:
+            return self._get_psf_kernel(position, geom, max_radius, factor)
+
+        if max_radius is not None:
+            max_radius = u.Quantity(max_radius, "deg")
+            max_radius_key = max_radius.value
+        else:
+            max_radius_key = None
+
+        key = (idx_x, idx_y, self._get_geom_key(geom), max_radius_key, factor)
+
+        if key in self._kernel_cache:
+            self._kernel_cache.move_to_end(key)
+        else:
+            position = SkyCoord.from_pixel(idx_x, idx_y, geom_image.wcs)
+            self._kernel_cache[key] = self._get_psf_kernel(
+                position, geom, max_radius, factor
+            )
+
+            while len(self._kernel_cache) > self.kernel_cache_size:
+                self._kernel_cache.popitem(last=False)
+
+        return self._kernel_cache[key]
+
+    def _get_kernel_geom_hpx(self, geom, max_radius=None):
+        """WCS kernel geometry for a HEALPix geometry.
+
+        The kernel is computed on a local CAR grid at the origin of the frame,
+        with half the HEALPix pixel size, so that it does not depend on the
+        position and can be converted to a radial profile.
+        """
+        if max_radius is None:
+            max_radius = np.max(self.psf_map.geom.axes["rad"].center)
+
+        binsz = 0.5 * np.sqrt(np.min(geom.solid_angle())).to_value("deg")
+        return WcsGeom.create(
+            skydir=(0, 0),
+            binsz=binsz,
+            width=2 * u.Quantity(max_radius, "deg") + binsz * u.deg,
+            frame=geom.frame,
+            axes=geom.axes,
+        )
+
+    @staticmethod
+    def _get_geom_key(geom):
+        """Hashable key of the geom properties the PSF kernel depends on"""
+        center = geom.center_skydir
+        return (
+            geom.projection,
+            geom.frame,
+            round(center.data.lon.deg, 6),
+            round(center.data.lat.deg, 6),
+            tuple(np.round(geom.pixel_scales.deg, 9)),
+            tuple(np.round(np.ravel(geom.width.to_value("deg")), 9)),
+            tuple(geom.axes["energy_true"].edges.to_value("TeV")),
+        )
+
+    def _get_psf_kernel(self, position, geom, max_radius, factor):
         table_psf = self.get_energy_dependent_table_psf(position)
 
         if max_radius is None:
@@ -138,6 +138,74 @@ def test_psfmap_to_psf_kernel():
     assert_allclose(psfkernel.psf_kernel_map.data.sum(axis=(1, 2)), 1.0, atol=1e-7)
 
 
+def test_psfmap_psf_kernel_cache():
+    psfmap = make_test_psfmap(0.15 * u.deg)
+    energy_axis = psfmap.psf_map.geom.axes[1]
+    kern_geom = WcsGeom.create(binsz=0.02, width=5.0, axes=[energy_axis])
+
+    kernel = psfmap.get_psf_kernel(
+        SkyCoord(1, 1, unit="deg"), kern_geom, max_radius=1 * u.deg, use_cache=True
+    )
+    kernel_nearby = psfmap.get_psf_kernel(
+        SkyCoord(1.05, 1, unit="deg"),
+        kern_geom.copy(),
+        max_radius=1 * u.deg,
+        use_cache=True,
+    )
+
+    assert kernel is kernel_nearby
+    assert len(psfmap._kernel_cache) == 1
+
+    kernel_no_cache = psfmap.get_psf_kernel(
+        SkyCoord(1, 1, unit="deg"), kern_geom, max_radius=1 * u.deg
+    )
+    assert_allclose(kernel.data, kernel_no_cache.data, rtol=1e-5)
+
+    psfmap.kernel_cache_size = 2
+
+    for lon in [0, 2, -2]:
+        psfmap.get_psf_kernel(
+            SkyCoord(lon, 0, unit="deg"),
+            kern_geom,
+            max_radius=1 * u.deg,
+            use_cache=True,
+        )
+
+    assert len(psfmap._kernel_cache) == 2
+
+
+def test_psfmap_psf_kernel_cache_off_center():
+    # PSF map with a width increasing from 0.15 deg to 0.3 deg along longitude
+    psfmap = make_test_psfmap(0.15 * u.deg)
+    psfmap_wide = make_test_psfmap(0.3 * u.deg)
+    lon = psfmap.psf_map.geom.get_coord().lon.to_value("deg")
+    weight = (np.where(lon > 180, lon - 360, lon) + 2.5) / 5
+    psfmap.psf_map.data = (1 - weight) * psfmap.psf_map.data + weight * (
+        psfmap_wide.psf_map.data
+    )
+
+    energy_axis = psfmap.psf_map.geom.axes[1]
+    kern_geom = WcsGeom.create(binsz=0.02, width=2.0, axes=[energy_axis])
+
+    # the PSF map pixel containing the position is centered at (1, 1) deg
+    position = SkyCoord(1.09, 1, unit="deg")
+    kernel = psfmap.get_psf_kernel(
+        position, kern_geom, max_radius=1 * u.deg, use_cache=True
+    )
+
+    # the cached kernel is evaluated at the pixel center
+    kernel_center = psfmap.get_psf_kernel(
+        SkyCoord(1, 1, unit="deg"), kern_geom, max_radius=1 * u.deg
+    )
+    assert_allclose(kernel.data, kernel_center.data, rtol=1e-5)
+
+    # and agrees with the kernel at the exact position within 5% of the peak
+    kernel_exact = psfmap.get_psf_kernel(position, kern_geom, max_radius=1 * u.deg)
+    diff = np.abs(kernel.data - kernel_exact.data).max(axis=(1, 2))
+    assert np.all(diff < 0.05 * kernel_exact.data.max(axis=(1, 2)))
+    assert np.all(diff > 0)
+
+
 def test_psfmap_to_from_hdulist():
     psfmap = make_test_psfmap(0.15 * u.deg)
     hdulist = psfmap.to_hdulist()
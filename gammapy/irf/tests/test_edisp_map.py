@@ -173,6 +173,40 @@ def test_edisp_from_diagonal_response(position):
     assert_allclose(sum_kernel[1:-1], 1)
 
 
+def test_edisp_map_kernel_cache():
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.3 TeV", "10 TeV", nbin=31, name="energy_true"
+    )
+    energy_axis = MapAxis.from_energy_bounds(
+        "0.3 TeV", "10 TeV", nbin=31, name="energy"
+    )
+
+    edisp_map = EDispMap.from_diagonal_response(energy_axis_true)
+
+    position = SkyCoord("10d 10d")
+    kernel = edisp_map.get_edisp_kernel(position, energy_axis, use_cache=True)
+    kernel_nearby = edisp_map.get_edisp_kernel(
+        SkyCoord("11d 10d"), energy_axis.copy(), use_cache=True
+    )
+
+    assert kernel is kernel_nearby
+    assert len(edisp_map._kernel_cache) == 1
+
+    kernel_no_cache = edisp_map.get_edisp_kernel(position, energy_axis)
+    assert_allclose(kernel.data, kernel_no_cache.data)
+
+    edisp_map.kernel_cache_size = 2
+
+    for nbin in [5, 10, 15]:
+        axis = MapAxis.from_energy_bounds("0.3 TeV", "10 TeV", nbin=nbin)
+        edisp_map.get_edisp_kernel(position, axis, use_cache=True)
+
+    assert len(edisp_map._kernel_cache) == 2
+
+    edisp_map.edisp_map = edisp_map.edisp_map.copy()
+    assert len(edisp_map._kernel_cache) == 0
+
+
 def test_edisp_map_to_edisp_kernel_map():
     energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=5)
 
@@ -198,6 +198,20 @@ class ReflectedRegionsFinder:
         mask = self.reference_map.data == 0
         self.excluded_pixcoords = PixCoord(X[mask], Y[mask])
 
+        # Only excluded pixels in the annulus covered by the region can be
+        # contained in a rotated region, sort them by polar angle
+        r_min, r_max, _, _, _ = self._polar_extent(self._pix_region)
+        dx = self.excluded_pixcoords.x - self._pix_center.x
+        dy = self.excluded_pixcoords.y - self._pix_center.y
+        radius = np.hypot(dx, dy)
+        in_annulus = (radius >= r_min) & (radius <= r_max)
+
+        angles = np.arctan2(dy[in_annulus], dx[in_annulus])
+        idx = np.argsort(angles)
+        self._excluded_angles = angles[idx]
+        self._excluded_x = self.excluded_pixcoords.x[in_annulus][idx]
+        self._excluded_y = self.excluded_pixcoords.y[in_annulus][idx]
+
         # Minimum angle a region has to be moved to not overlap with previous one
         min_ang = self._region_angular_size(ONpixels, self._pix_center)
 
@@ -207,6 +221,71 @@ class ReflectedRegionsFinder:
         # Maximum possible angle before regions is reached again
         self._max_angle = Angle("360deg") - self._min_ang - self.min_distance_input
 
+    def _polar_extent(self, region):
+        """Compute the polar extent of the bounding box of a pixel region.
+
+        Parameters
+        ----------
+        region : `~regions.PixelRegion`
+            Pixel region
+
+        Returns
+        -------
+        r_min, r_max : float
+            Minimum and maximum distance of the bounding box to the center.
+        phi_min, phi_max : float
+            Minimum and maximum polar angle of the bounding box, seen from the center.
+        contains_center : bool
+            Whether the bounding box contains the center.
+        """
+        bbox = region.bounding_box
+
+        # the bounding box covers [ixmin - 0.5, ixmax - 0.5], add a margin
+        # of one pixel to be safe against rounding
+        dx = np.array([bbox.ixmin - 1.5, bbox.ixmax + 0.5]) - self._pix_center.x
+        dy = np.array([bbox.iymin - 1.5, bbox.iymax + 0.5]) - self._pix_center.y
+
+        contains_center = (dx[0] <= 0 <= dx[1]) & (dy[0] <= 0 <= dy[1])
+
+        r_min = np.hypot(max(dx[0], 0, -dx[1]), max(dy[0], 0, -dy[1]))
+        dx, dy = np.meshgrid(dx, dy)
+        r_max = np.hypot(dx, dy).max()
+
+        phi_center = np.arctan2(dy.mean(), dx.mean())
+        dphi = np.arctan2(dy, dx) - phi_center
+        dphi = (dphi + np.pi) % (2 * np.pi) - np.pi
+        phi_min, phi_max = phi_center + dphi.min(), phi_center + dphi.max()
+        return r_min, r_max, phi_min, phi_max, contains_center
+
+    def _contains_excluded(self, region):
+        """Check whether a rotated pixel region contains excluded pixels.
+
+        Only the excluded pixels within the polar angle range of the region
+        are tested, the angular window is found by binary search on the
+        excluded pixels sorted by polar angle.
+        """
+        _, _, phi_min, phi_max, contains_center = self._polar_extent(region)
+        angles = self._excluded_angles
+
+        if contains_center:
+            idx = np.arange(len(angles))
+        else:
+            # wrap the window to start in [-pi, pi)
+            width = phi_max - phi_min
+            phi_min = (phi_min + np.pi) % (2 * np.pi) - np.pi
+            phi_max = phi_min + width
+
+            idx_min = np.searchsorted(angles, phi_min, side="left")
+            idx_max = np.searchsorted(angles, phi_max, side="right")
+            idx_wrap = np.searchsorted(angles, phi_max - 2 * np.pi, side="right")
+            idx = np.append(np.arange(idx_min, idx_max), np.arange(idx_wrap))
+
+        if len(idx) == 0:
+            return False
+
+        pixels = PixCoord(self._excluded_x[idx], self._excluded_y[idx])
+        return np.any(region.contains(pixels))
+
     def find_regions(self):
         """Find reflected regions."""
         curr_angle = self._min_ang + self.min_distance_input
@@ -214,7 +293,7 @@ class ReflectedRegionsFinder:
 
         while curr_angle < self._max_angle:
             test_reg = self._pix_region.rotate(self._pix_center, curr_angle)
-            if not np.any(test_reg.contains(self.excluded_pixcoords)):
+            if not self._contains_excluded(test_reg):
                 region = test_reg.to_sky(self.reference_map.geom.wcs)
                 reflected_regions.append(region)
 
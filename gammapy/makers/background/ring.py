@@ -5,7 +5,7 @@ import numpy as np
 from astropy.convolution import Ring2DKernel, Tophat2DKernel
 from astropy.coordinates import Angle
 from gammapy.maps import Map
-from gammapy.utils.array import scale_cube
+from gammapy.utils.array import iter_scale_space, scale_cube
 from ..core import Maker
 
 __all__ = ["AdaptiveRingBackgroundMaker", "RingBackgroundMaker"]
@@ -114,38 +114,54 @@ class AdaptiveRingBackgroundMaker(Maker):
 
         return alpha_approx
 
-    def _reduce_cubes(self, cubes, dataset):
-        """Compute off and off acceptance map.
+    def _reduce_images(self, images, acceptance, dataset):
+        """Compute off and off acceptance map from the ring convolved images.
 
-        Calulated by reducing the cubes. The data is
-        iterated along the third axis (i.e. increasing ring sizes), the value
-        with the first approximate alpha < threshold is taken.
+        The images are consumed one ring after the other (i.e. increasing
+        ring sizes), the value with the first approximate alpha < threshold
+        is taken.
         """
-        threshold = self.threshold_alpha
-
-        alpha_approx_cube = self._alpha_approx_cube(cubes)
-        counts_off_cube = cubes["counts_off"]
-        acceptance_off_cube = cubes["acceptance_off"]
-        acceptance_cube = cubes["acceptance"]
-
-        shape = alpha_approx_cube.shape[:2]
+        shape = acceptance.shape
         counts_off = np.tile(np.nan, shape)
         acceptance_off = np.tile(np.nan, shape)
-        acceptance = np.tile(np.nan, shape)
+        acceptance_selected = np.tile(np.nan, shape)
 
-        for idx in np.arange(alpha_approx_cube.shape[-1]):
-            mask = (alpha_approx_cube[:, :, idx] <= threshold) & np.isnan(counts_off)
-            counts_off[mask] = counts_off_cube[:, :, idx][mask]
-            acceptance_off[mask] = acceptance_off_cube[:, :, idx][mask]
-            acceptance[mask] = acceptance_cube[:, :, idx][mask]
+        for image in images:
+            image["acceptance"] = acceptance
+            alpha_approx = self._alpha_approx_cube(image)
+            mask = (alpha_approx <= self.threshold_alpha) & np.isnan(counts_off)
+            counts_off[mask] = image["counts_off"][mask]
+            acceptance_off[mask] = image["acceptance_off"][mask]
+            acceptance_selected[mask] = acceptance[mask]
 
         counts = dataset.counts
-        acceptance = counts.copy(data=acceptance[np.newaxis, Ellipsis])
+        acceptance = counts.copy(data=acceptance_selected[np.newaxis, Ellipsis])
         acceptance_off = counts.copy(data=acceptance_off[np.newaxis, Ellipsis])
         counts_off = counts.copy(data=counts_off[np.newaxis, Ellipsis])
 
         return acceptance, acceptance_off, counts_off
 
+    def _get_off_data(self, dataset):
+        """Get the exclusion masked counts and background and the acceptance."""
+        counts = dataset.counts
+        background = dataset.npred_background()
+
+        if self.exclusion_mask:
+            exclusion = self.exclusion_mask.interp_to_geom(geom=counts.geom)
+        else:
+            exclusion = Map.from_geom(geom=counts.geom, data=True, dtype=bool)
+
+        data = {}
+        data["counts_off"] = (counts.data * exclusion.data)[0, Ellipsis]
+        data["acceptance_off"] = (background.data * exclusion.data)[0, Ellipsis]
+
+        scale = background.geom.pixel_scales[0].to("deg")
+        theta = self.theta * scale
+        tophat = Tophat2DKernel(theta.value)
+        tophat.normalize("peak")
+        acceptance = background.convolve(tophat.array)
+        return data, acceptance.data[0, Ellipsis]
+
     def make_cubes(self, dataset):
         """Make acceptance, off acceptance, off counts cubes
 
@@ -159,31 +175,14 @@ class AdaptiveRingBackgroundMaker(Maker):
         cubes : dict of `~gammapy.maps.WcsNDMap`
             Dictionary containing ``counts_off``, ``acceptance`` and ``acceptance_off`` cubes.
         """
-        counts = dataset.counts
-        background = dataset.npred_background()
-        kernels = self.kernels(counts)
-
-        if self.exclusion_mask:
-            exclusion = self.exclusion_mask.interp_to_geom(geom=counts.geom)
-        else:
-            exclusion = Map.from_geom(geom=counts.geom, data=True, dtype=bool)
+        kernels = self.kernels(dataset.counts)
+        data, acceptance = self._get_off_data(dataset)
 
         cubes = {}
-        cubes["counts_off"] = scale_cube(
-            (counts.data * exclusion.data)[0, Ellipsis], kernels
-        )
-        cubes["acceptance_off"] = scale_cube(
-            (background.data * exclusion.data)[0, Ellipsis], kernels
-        )
-
-        scale = background.geom.pixel_scales[0].to("deg")
-        theta = self.theta * scale
-        tophat = Tophat2DKernel(theta.value)
-        tophat.normalize("peak")
-        acceptance = background.convolve(tophat.array)
-        acceptance_data = acceptance.data[0, Ellipsis]
+        cubes["counts_off"] = scale_cube(data["counts_off"], kernels)
+        cubes["acceptance_off"] = scale_cube(data["acceptance_off"], kernels)
         cubes["acceptance"] = np.repeat(
-            acceptance_data[Ellipsis, np.newaxis], len(kernels), axis=2
+            acceptance[Ellipsis, np.newaxis], len(kernels), axis=2
         )
 
         return cubes
@@ -203,8 +202,11 @@ class AdaptiveRingBackgroundMaker(Maker):
         """
         from gammapy.datasets import MapDatasetOnOff
 
-        cubes = self.make_cubes(dataset)
-        acceptance, acceptance_off, counts_off = self._reduce_cubes(cubes, dataset)
+        data, acceptance = self._get_off_data(dataset)
+        images = iter_scale_space(data, self.kernels(dataset.counts))
+        acceptance, acceptance_off, counts_off = self._reduce_images(
+            images, acceptance, dataset
+        )
 
         mask_safe = dataset.mask_safe.copy()
         not_has_off_acceptance = acceptance_off.data <= 0
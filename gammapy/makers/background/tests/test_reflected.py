@@ -119,6 +119,27 @@ def test_find_reflected_regions(
     assert len(regions) == 5
 
 
+def test_reflected_regions_finder_contains_excluded(exclusion_mask):
+    pointing = SkyCoord(83.2, 22.5, unit="deg")
+    region = EllipseSkyRegion(
+        SkyCoord(83.3, 22.0, unit="deg"), 0.1 * u.deg, 0.3 * u.deg, angle=30 * u.deg
+    )
+
+    finder = ReflectedRegionsFinder(
+        center=pointing, region=region, exclusion_mask=exclusion_mask
+    )
+    finder.run()
+
+    n_excluded = 0
+    for angle in Angle(np.linspace(0, 360, 73), "deg"):
+        test_reg = finder._pix_region.rotate(finder._pix_center, angle)
+        expected = np.any(test_reg.contains(finder.excluded_pixcoords))
+        assert finder._contains_excluded(test_reg) == expected
+        n_excluded += expected
+
+    assert 0 < n_excluded < 73
+
+
 center = SkyCoord(0.5, 0.0, unit="deg")
 other_region_finder_param = [
     (RectangleSkyRegion(center, 0.5 * u.deg, 0.5 * u.deg, angle=0 * u.deg), 3),
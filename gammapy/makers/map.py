@@ -30,13 +30,21 @@ class MapDatasetMaker(Maker):
         By default, all maps are made.
     background_oversampling : int
         Background evaluation oversampling factor in energy.
+    background_time_slices : int
+        Number of equal time intervals the observation is split into for the
+        evaluation of background models given in FOV coordinates aligned with
+        the ALTAZ system. This takes the rotation of the FOV during the
+        observation into account. By default a single interval is used.
     """
 
     tag = "MapDatasetMaker"
     available_selection = ["counts", "exposure", "background", "psf", "edisp"]
 
-    def __init__(self, selection=None, background_oversampling=None):
+    def __init__(
+        self, selection=None, background_oversampling=None, background_time_slices=None
+    ):
         self.background_oversampling = background_oversampling
+        self.background_time_slices = background_time_slices
 
         if selection is None:
             selection = self.available_selection
@@ -157,6 +165,7 @@ class MapDatasetMaker(Maker):
             geom=geom,
             oversampling=self.background_oversampling,
             use_region_center=use_region_center,
+            n_time_slices=self.background_time_slices,
         )
 
     def make_edisp(self, geom, observation):
@@ -3,20 +3,27 @@ import pytest
 import numpy as np
 from numpy.testing import assert_allclose
 from astropy import units as u
-from astropy.coordinates import EarthLocation, SkyCoord
+from astropy.coordinates import AltAz, EarthLocation, SkyCoord
 from astropy.table import Table
 from astropy.time import Time
 from gammapy.data import GTI, EventList, FixedPointingInfo, Observation
 from gammapy.irf import Background3D, EffectiveAreaTable2D, EnergyDispersion2D, Background2D
+from gammapy.irf.psf.tests.test_psf_map import fake_psf3d
 from gammapy.makers.utils import (
     _map_spectrum_weight,
     make_edisp_kernel_map,
+    make_edisp_kernel_map_stacked,
+    make_edisp_map,
+    make_edisp_map_stacked,
     make_map_background_irf,
     make_map_exposure_true_energy,
+    make_psf_map,
+    make_psf_map_stacked,
     make_theta_squared_table,
 )
 from gammapy.maps import HpxGeom, MapAxis, WcsGeom, WcsNDMap
 from gammapy.modeling.models import ConstantSpectralModel
+from gammapy.utils.coordinates import sky_to_fov
 from gammapy.utils.testing import requires_data
 from gammapy.utils.time import time_ref_to_dict
 
@@ -305,6 +312,147 @@ def test_make_edisp_kernel_map():
     assert_allclose(kernel.pdf_matrix[:, 2], (0.0, 0.0, 0.0, 0.0, 1.0, 1.0))
 
 
+def test_make_edisp_kernel_map_stacked():
+    migra = MapAxis.from_edges(np.linspace(0.5, 1.5, 50), unit="", name="migra")
+    etrue = MapAxis.from_energy_bounds(0.5, 2, 6, unit="TeV", name="energy_true")
+    offset = MapAxis.from_edges(np.linspace(0.0, 4.0, 5), unit="deg", name="offset")
+    ereco = MapAxis.from_energy_bounds(0.5, 2, 3, unit="TeV", name="energy")
+
+    aeff = EffectiveAreaTable2D(
+        axes=[etrue, offset], data=np.linspace(4, 1, 4) * np.ones((6, 1)), unit="m2"
+    )
+
+    observations = []
+    for lon, sigma in zip([0, 1.5], [0.05, 0.2]):
+        edisp = EnergyDispersion2D.from_gauss(
+            energy_axis_true=etrue,
+            migra_axis=migra,
+            bias=0,
+            sigma=sigma,
+            offset_axis=offset,
+        )
+        obs = Observation.create(
+            pointing=SkyCoord(lon, 0, unit="deg"),
+            livetime="1 h",
+            irfs={"aeff": aeff, "edisp": edisp},
+        )
+        observations.append(obs)
+
+    geom = WcsGeom.create(npix=(8, 5), binsz=0.5, axes=[ereco, etrue])
+    stacked = make_edisp_kernel_map_stacked(observations, geom)
+
+    for idx, obs in enumerate(observations):
+        exposure = make_map_exposure_true_energy(
+            pointing=obs.pointing_radec,
+            livetime=obs.observation_live_time_duration,
+            aeff=obs.aeff,
+            geom=geom.squash(axis_name="energy"),
+        )
+        edisp_map = make_edisp_kernel_map(
+            obs.edisp, obs.pointing_radec, geom, exposure_map=exposure
+        )
+        if idx == 0:
+            expected = edisp_map
+        else:
+            expected.stack(edisp_map)
+
+    assert_allclose(
+        stacked.edisp_map.data, expected.edisp_map.data, rtol=1e-6, atol=1e-6
+    )
+    assert_allclose(stacked.exposure_map.data, expected.exposure_map.data, rtol=1e-6)
+    assert stacked.exposure_map.unit == "m2 s"
+
+
+def test_make_psf_map_stacked():
+    rad = MapAxis.from_edges(np.linspace(0, 1, 51), unit="deg", name="rad")
+    etrue = MapAxis.from_energy_bounds(0.2, 5, 3, unit="TeV", name="energy_true")
+    offset = MapAxis.from_edges(np.linspace(0.0, 4.0, 5), unit="deg", name="offset")
+
+    aeff = EffectiveAreaTable2D(
+        axes=[etrue, offset], data=np.linspace(4, 1, 4) * np.ones((3, 1)), unit="m2"
+    )
+
+    observations = []
+    for lon, sigma in zip([0, 1.5], [0.05, 0.2]):
+        obs = Observation.create(
+            pointing=SkyCoord(lon, 0, unit="deg"),
+            livetime="1 h",
+            irfs={"aeff": aeff, "psf": fake_psf3d(sigma * u.deg)},
+        )
+        observations.append(obs)
+
+    geom = WcsGeom.create(npix=(8, 5), binsz=0.5, axes=[rad, etrue])
+    stacked = make_psf_map_stacked(observations, geom)
+
+    for idx, obs in enumerate(observations):
+        exposure = make_map_exposure_true_energy(
+            pointing=obs.pointing_radec,
+            livetime=obs.observation_live_time_duration,
+            aeff=obs.aeff,
+            geom=geom.squash(axis_name="rad"),
+        )
+        psf_map = make_psf_map(obs.psf, obs.pointing_radec, geom, exposure_map=exposure)
+        if idx == 0:
+            expected = psf_map
+        else:
+            expected.stack(psf_map)
+
+    assert_allclose(stacked.psf_map.data, expected.psf_map.data, rtol=1e-6)
+    assert stacked.psf_map.unit == expected.psf_map.unit
+    assert_allclose(stacked.exposure_map.data, expected.exposure_map.data, rtol=1e-6)
+    assert stacked.exposure_map.unit == "m2 s"
+
+
+def test_make_edisp_map_stacked():
+    migra = MapAxis.from_edges(np.linspace(0.5, 1.5, 50), unit="", name="migra")
+    etrue = MapAxis.from_energy_bounds(0.5, 2, 6, unit="TeV", name="energy_true")
+    offset = MapAxis.from_edges(np.linspace(0.0, 4.0, 5), unit="deg", name="offset")
+
+    aeff = EffectiveAreaTable2D(
+        axes=[etrue, offset], data=np.linspace(4, 1, 4) * np.ones((6, 1)), unit="m2"
+    )
+
+    observations = []
+    for lon, sigma in zip([0, 1.5], [0.05, 0.2]):
+        edisp = EnergyDispersion2D.from_gauss(
+            energy_axis_true=etrue,
+            migra_axis=migra,
+            bias=0,
+            sigma=sigma,
+            offset_axis=offset,
+        )
+        obs = Observation.create(
+            pointing=SkyCoord(lon, 0, unit="deg"),
+            livetime="1 h",
+            irfs={"aeff": aeff, "edisp": edisp},
+        )
+        observations.append(obs)
+
+    geom = WcsGeom.create(npix=(8, 5), binsz=0.5, axes=[migra, etrue])
+    stacked = make_edisp_map_stacked(observations, geom)
+
+    for idx, obs in enumerate(observations):
+        exposure = make_map_exposure_true_energy(
+            pointing=obs.pointing_radec,
+            livetime=obs.observation_live_time_duration,
+            aeff=obs.aeff,
+            geom=geom.squash(axis_name="migra"),
+        )
+        edisp_map = make_edisp_map(
+            obs.edisp, obs.pointing_radec, geom, exposure_map=exposure
+        )
+        if idx == 0:
+            expected = edisp_map
+        else:
+            expected.stack(edisp_map)
+
+    assert_allclose(
+        stacked.edisp_map.data, expected.edisp_map.data, rtol=1e-6, atol=1e-6
+    )
+    assert_allclose(stacked.exposure_map.data, expected.exposure_map.data, rtol=1e-6)
+    assert stacked.exposure_map.unit == "m2 s"
+
+
 class TestTheta2Table:
     def setup_class(self):
         table = Table()
@@ -384,3 +532,49 @@ class TestTheta2Table:
         assert_allclose(theta2_table_two_obs["acceptance"], acceptance_two_obs)
         assert_allclose(theta2_table_two_obs["acceptance_off"], acceptance_off_two_obs)
         assert_allclose(theta2_table["alpha"], alpha_two_obs)
+
+
+@requires_data()
+def test_make_map_background_irf_time_slices(fixed_pointing_info):
+    axis = MapAxis.from_edges([0.1, 1, 10], name="energy", unit="TeV", interp="log")
+    geom = WcsGeom.create(
+        npix=(3, 3), binsz=4, axes=[axis], skydir=fixed_pointing_info.radec
+    )
+
+    kwargs = dict(
+        pointing=fixed_pointing_info, ontime="42 s", bkg=bkg_3d_custom(), geom=geom
+    )
+    m = make_map_background_irf(**kwargs)
+    m_slices = make_map_background_irf(n_time_slices=4, **kwargs)
+
+    # constant background is not affected by the FoV rotation
+    assert_allclose(m_slices.data, m.data, rtol=1e-5)
+
+    kwargs["bkg"] = bkg_3d_custom("asymmetric")
+    m = make_map_background_irf(**kwargs)
+    m_slices = make_map_background_irf(n_time_slices=4, **kwargs)
+
+    assert m_slices.data.shape == m.data.shape
+    assert_allclose(m_slices.data.sum(), m.data.sum(), rtol=1e-2)
+
+    # brute force evaluation at the center of each time slice
+    image_geom = geom.to_image()
+    sky_coord = image_geom.get_coord().skycoord
+    energy = axis.edges.reshape((-1, 1, 1))
+    pointing = fixed_pointing_info
+
+    expected = 0
+    for fraction in [0.125, 0.375, 0.625, 0.875]:
+        obstime = pointing.time_start + fraction * pointing.duration
+        frame = AltAz(obstime=obstime, location=pointing.location)
+        altaz = sky_coord.transform_to(frame)
+        altaz_pointing = pointing.radec.transform_to(frame)
+        fov_lon, fov_lat = sky_to_fov(
+            altaz.az, altaz.alt, altaz_pointing.az, altaz_pointing.alt
+        )
+        rate = kwargs["bkg"].integrate_log_log(
+            energy=energy, fov_lon=fov_lon, fov_lat=fov_lat, axis_name="energy"
+        )
+        expected += (rate * image_geom.solid_angle() * 42 * u.s / 4).to_value("")
+
+    assert_allclose(m_slices.data, expected, rtol=1e-5)
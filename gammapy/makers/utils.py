@@ -1,10 +1,10 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
-from astropy.coordinates import Angle, SkyOffsetFrame
+from astropy.coordinates import AltAz, Angle, SkyCoord, SkyOffsetFrame
 from astropy.table import Table
 from gammapy.data import FixedPointingInfo
-from gammapy.irf import EDispMap, PSFMap
-from gammapy.maps import Map, WcsNDMap
+from gammapy.irf import EDispKernelMap, EDispMap, PSFMap
+from gammapy.maps import Map, WcsGeom, WcsNDMap
 from gammapy.modeling.models import PowerLawSpectralModel
 from gammapy.stats import WStatCountsStatistic
 from gammapy.utils.coordinates import sky_to_fov
@@ -15,6 +15,9 @@ __all__ = [
     "make_edisp_kernel_map",
     "make_psf_map",
     "make_map_exposure_true_energy",
+    "make_edisp_kernel_map_stacked",
+    "make_edisp_map_stacked",
+    "make_psf_map_stacked",
     "make_theta_squared_table",
 ]
 
@@ -108,7 +111,15 @@ def _map_spectrum_weight(map, spectrum=None):
     return map * weights.reshape(shape.astype(int))
 
 
-def make_map_background_irf(pointing, ontime, bkg, geom, oversampling=None, use_region_center=True):
+def make_map_background_irf(
+    pointing,
+    ontime,
+    bkg,
+    geom,
+    oversampling=None,
+    use_region_center=True,
+    n_time_slices=None,
+):
     """Compute background map from background IRFs.
 
     Parameters
@@ -131,6 +142,13 @@ def make_map_background_irf(pointing, ontime, bkg, geom, oversampling=None, use_
         If geom is a RegionGeom, whether to just
         consider the values at the region center
         or the insted the sum over the whole region
+    n_time_slices : int
+        Number of equal time intervals between the start and stop time of the
+        observation. If a ``FixedPointingInfo`` is passed and the background
+        model is given in FOV coordinates, the background IRF is evaluated at
+        the center of each interval and the contributions are summed up,
+        which takes the rotation of the FOV into account. By default a single
+        interval is used.
 
     Returns
     -------
@@ -138,11 +156,7 @@ def make_map_background_irf(pointing, ontime, bkg, geom, oversampling=None, use_
         Background predicted counts sky cube in reco energy
     """
     # TODO:
-    #  This implementation can be improved in two ways:
-    #  1. Create equal time intervals between TSTART and TSTOP and sum up the
-    #  background IRF for each interval. This is instead of multiplying by
-    #  the total ontime. This then handles the rotation of the FoV.
-    #  2. Use the pointing table (does not currently exist in CTA files) to
+    #  Use the pointing table (does not currently exist in CTA files) to
     #  obtain the RA DEC and time for each interval. This then considers that
     #  the pointing might change slightly over the observation duration
 
@@ -166,29 +180,34 @@ def make_map_background_irf(pointing, ontime, bkg, geom, oversampling=None, use_
         sky_coord = map_coord.skycoord
         d_omega = image_geom.solid_angle()
 
+    fov_coords = [{}]
+
     if bkg.is_offset_dependent:
-        coords["offset"] = sky_coord.separation(pointing)
+        if use_region_center and isinstance(image_geom, WcsGeom):
+            coords["offset"] = image_geom.separation(pointing)
+        else:
+            coords["offset"] = sky_coord.separation(pointing)
     else:
         if isinstance(pointing, FixedPointingInfo):
-            altaz_coord = sky_coord.transform_to(pointing.altaz_frame)
-
-            # Compute FOV coordinates of map relative to pointing
-            fov_lon, fov_lat = sky_to_fov(
-                altaz_coord.az, altaz_coord.alt, pointing.altaz.az, pointing.altaz.alt
+            fov_lon, fov_lat = _get_fov_coords_time_slices(
+                pointing=pointing, sky_coord=sky_coord, n_time_slices=n_time_slices
             )
+            fov_coords = [
+                {"fov_lon": lon, "fov_lat": lat} for lon, lat in zip(fov_lon, fov_lat)
+            ]
         else:
             # Create OffsetFrame
             frame = SkyOffsetFrame(origin=pointing)
             pseudo_fov_coord = sky_coord.transform_to(frame)
-            fov_lon = pseudo_fov_coord.lon
-            fov_lat = pseudo_fov_coord.lat
+            coords["fov_lon"] = pseudo_fov_coord.lon
+            coords["fov_lat"] = pseudo_fov_coord.lat
 
-        coords["fov_lon"] = fov_lon
-        coords["fov_lat"] = fov_lat
+    # accumulate the contributions of the time slices in place
+    values = 0
 
-    bkg_de = bkg.integrate_log_log(**coords, axis_name="energy")
-
-    values = (bkg_de * d_omega * ontime).to_value("")
+    for fov_coord in fov_coords:
+        bkg_de = bkg.integrate_log_log(**coords, **fov_coord, axis_name="energy")
+        values += (bkg_de * d_omega * ontime / len(fov_coords)).to_value("")
 
     if not use_region_center:
         data = np.sum(weights*values, axis=2)
@@ -203,6 +222,46 @@ def make_map_background_irf(pointing, ontime, bkg, geom, oversampling=None, use_
     return bkg_map
 
 
+def _get_fov_coords_time_slices(pointing, sky_coord, n_time_slices=None):
+    """Compute FOV coordinates at the center of equal time intervals.
+
+    The AltAz transformations of the sky coordinates and of the pointing
+    position are vectorised over all time slices.
+
+    Parameters
+    ----------
+    pointing : `~gammapy.data.FixedPointingInfo`
+        Observation pointing.
+    sky_coord : `~astropy.coordinates.SkyCoord`
+        Sky coordinates.
+    n_time_slices : int
+        Number of time slices. By default a single time slice, centered on
+        the mean observation time, is used.
+
+    Returns
+    -------
+    fov_lon, fov_lat : `~astropy.coordinates.Angle`
+        FOV coordinates, with an additional leading time slice axis.
+    """
+    if n_time_slices is None or n_time_slices == 1:
+        altaz_frame = pointing.altaz_frame
+        altaz_pointing = pointing.altaz
+        sky_coord = sky_coord[np.newaxis]
+    else:
+        fraction = (np.arange(n_time_slices) + 0.5) / n_time_slices
+        obstime = pointing.time_start + pointing.duration * fraction
+        obstime = obstime.reshape(obstime.shape + (1,) * sky_coord.ndim)
+
+        altaz_frame = AltAz(obstime=obstime, location=pointing.location)
+        altaz_pointing = pointing.radec.transform_to(altaz_frame)
+
+    altaz_coord = sky_coord.transform_to(altaz_frame)
+
+    return sky_to_fov(
+        altaz_coord.az, altaz_coord.alt, altaz_pointing.az, altaz_pointing.alt
+    )
+
+
 def make_psf_map(psf, pointing, geom, exposure_map=None):
     """Make a psf map for a single observation
 
@@ -350,6 +409,202 @@ def make_edisp_kernel_map(edisp, pointing, geom, exposure_map=None, use_region_c
     return edisp_map.to_edisp_kernel_map(geom.axes["energy"])
 
 
+def _get_offsets_and_exposures(observations, geom):
+    """Compute offsets and true energy exposure of several observations.
+
+    The separations of the map pixels to all pointings are computed in a
+    single vectorized call.
+
+    Parameters
+    ----------
+    observations : list of `~gammapy.data.Observation`
+        Observations
+    geom : `~gammapy.maps.Geom`
+        Map geometry, must have an "energy_true" axis.
+
+    Returns
+    -------
+    offsets : `~astropy.coordinates.Angle`
+        Offsets, with shape (n_obs,) + spatial data shape of the geom.
+    exposures : `~numpy.ndarray`
+        Exposures in m2 s, with shape (n_obs, n_energy_true) + spatial data
+        shape of the geom.
+    """
+    energy_true = geom.axes["energy_true"].center
+    pointings = SkyCoord([obs.pointing_radec for obs in observations])
+    offsets = geom.separation(pointings[:, np.newaxis, np.newaxis])
+
+    exposures = []
+
+    for obs, offset in zip(observations, offsets):
+        exposure = obs.aeff.evaluate(
+            offset=offset, energy_true=energy_true[:, np.newaxis, np.newaxis]
+        )
+        livetime = obs.observation_live_time_duration
+        exposures.append((exposure * livetime).to_value("m2 s"))
+
+    return offsets, np.stack(exposures)
+
+
+def _stack_irf_values(values, exposures):
+    """Exposure weighted average of IRF values, as in `~gammapy.irf.IRFMap.stack`.
+
+    Parameters
+    ----------
+    values : iterable of `~numpy.ndarray`
+        IRF values per observation, with the IRF axis as second axis.
+    exposures : `~numpy.ndarray`
+        Exposures per observation, as returned by `_get_offsets_and_exposures`.
+
+    Returns
+    -------
+    data, exposure : `~numpy.ndarray`
+        Stacked IRF values and summed exposure.
+    """
+    data = 0
+
+    for value, exposure in zip(values, exposures):
+        data += value * exposure[:, np.newaxis]
+
+    exposure = exposures.sum(axis=0)[:, np.newaxis]
+
+    with np.errstate(invalid="ignore"):
+        data = np.nan_to_num(data / exposure)
+
+    return data, exposure
+
+
+def make_psf_map_stacked(observations, geom):
+    """Make an exposure weighted stacked psf map for a list of observations.
+
+    This is equivalent to calling `make_psf_map` for every observation and
+    stacking the resulting maps with `~gammapy.irf.PSFMap.stack`, but the
+    offsets for all pointings are computed at once and no intermediate maps
+    are created.
+
+    Parameters
+    ----------
+    observations : list of `~gammapy.data.Observation`
+        Observations, sharing the geometry.
+    geom : `~gammapy.maps.Geom`
+        the map geom to be used. It provides the target geometry.
+        rad and true energy axes should be given in this specific order.
+
+    Returns
+    -------
+    psfmap : `~gammapy.irf.PSFMap`
+        the stacked PSF map, with the summed exposure map
+    """
+    energy_true = geom.axes["energy_true"].center
+    rad = geom.axes["rad"].center
+
+    offsets, exposures = _get_offsets_and_exposures(observations, geom)
+
+    values = (
+        obs.psf.evaluate(
+            energy_true=energy_true[:, np.newaxis, np.newaxis, np.newaxis],
+            offset=offset,
+            rad=rad[:, np.newaxis, np.newaxis],
+        ).to_value("sr-1")
+        for obs, offset in zip(observations, offsets)
+    )
+    data, exposure = _stack_irf_values(values, exposures)
+
+    psfmap = Map.from_geom(geom, data=data, unit="sr-1")
+    exposure_map = Map.from_geom(
+        geom.squash(axis_name="rad"), data=exposure, unit="m2 s"
+    )
+    return PSFMap(psfmap, exposure_map)
+
+
+def _evaluate_edisp_values(observations, offsets, geom):
+    """Evaluate edisp values on a geom with migra and true energy axes."""
+    energy_true = geom.axes["energy_true"].center
+    migra = geom.axes["migra"].center
+
+    for obs, offset in zip(observations, offsets):
+        yield obs.edisp.evaluate(
+            offset=offset,
+            energy_true=energy_true[:, np.newaxis, np.newaxis, np.newaxis],
+            migra=migra[:, np.newaxis, np.newaxis],
+        ).to_value("")
+
+
+def make_edisp_map_stacked(observations, geom):
+    """Make an exposure weighted stacked edisp map for a list of observations.
+
+    This is equivalent to calling `make_edisp_map` for every observation and
+    stacking the resulting maps with `~gammapy.irf.EDispMap.stack`, but the
+    offsets for all pointings are computed at once and no intermediate maps
+    are created.
+
+    Parameters
+    ----------
+    observations : list of `~gammapy.data.Observation`
+        Observations, sharing the geometry.
+    geom : `~gammapy.maps.Geom`
+        the map geom to be used. It provides the target geometry.
+        migra and true energy axes should be given in this specific order.
+
+    Returns
+    -------
+    edispmap : `~gammapy.irf.EDispMap`
+        the stacked EDisp map, with the summed exposure map
+    """
+    offsets, exposures = _get_offsets_and_exposures(observations, geom)
+
+    values = _evaluate_edisp_values(observations, offsets, geom)
+    data, exposure = _stack_irf_values(values, exposures)
+
+    edispmap = Map.from_geom(geom, data=data, unit="")
+    exposure_map = Map.from_geom(
+        geom.squash(axis_name="migra"), data=exposure, unit="m2 s"
+    )
+    return EDispMap(edispmap, exposure_map)
+
+
+def make_edisp_kernel_map_stacked(observations, geom):
+    """Make an exposure weighted stacked edisp kernel map for a list of observations.
+
+    This is equivalent to calling `make_edisp_kernel_map` for every
+    observation and stacking the resulting maps with
+    `~gammapy.irf.EDispKernelMap.stack`, but the offsets for all pointings
+    are computed at once and no intermediate maps are created.
+
+    Parameters
+    ----------
+    observations : list of `~gammapy.data.Observation`
+        Observations, sharing the geometry and the migra axis of the
+        energy dispersion.
+    geom : `~gammapy.maps.Geom`
+        the map geom to be used. It provides the target geometry.
+        energy and true energy axes should be given in this specific order.
+
+    Returns
+    -------
+    edispmap : `~gammapy.irf.EDispKernelMap`
+        the stacked EDispKernel map, with the summed exposure map
+    """
+    energy_axis = geom.axes["energy"]
+    migra_axis = observations[0].edisp.axes["migra"]
+    edisp_geom = geom.to_image().to_cube([migra_axis, geom.axes["energy_true"]])
+
+    offsets, exposures = _get_offsets_and_exposures(observations, geom)
+
+    def kernel_values():
+        for values in _evaluate_edisp_values(observations, offsets, edisp_geom):
+            edisp_map = EDispMap(Map.from_geom(edisp_geom, data=values, unit=""))
+            yield edisp_map.to_edisp_kernel_map(energy_axis).edisp_map.data
+
+    data, exposure = _stack_irf_values(kernel_values(), exposures)
+
+    edisp_kernel_map = Map.from_geom(geom, data=data, unit="")
+    exposure_map = Map.from_geom(
+        geom.squash(axis_name="energy"), data=exposure, unit="m2 s"
+    )
+    return EDispKernelMap(edisp_kernel_map, exposure_map)
+
+
 def make_theta_squared_table(
     observations, theta_squared_axis, position, position_off=None
 ):
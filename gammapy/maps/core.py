@@ -3,6 +3,7 @@ import abc
 import copy
 import inspect
 import json
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from astropy import units as u
 from astropy.io import fits
@@ -816,9 +817,50 @@ class Map(abc.ABC):
 
         return Map.from_geom(geom, data=data, unit=self.unit)
 
-    def fill_events(self, events):
-        """Fill event coordinates (`~gammapy.data.EventList`)."""
-        self.fill_by_coord(events.map_coord(self.geom))
+    def fill_events(self, events, chunk_size=1000000, n_jobs=None):
+        """Fill event coordinates (`~gammapy.data.EventList`).
+
+        The events are processed in chunks. For every chunk, the pixel indices
+        are computed from the raw coordinate columns and the counts are
+        accumulated with `numpy.bincount`.
+
+        Parameters
+        ----------
+        events : `~gammapy.data.EventList`
+            Event list.
+        chunk_size : int
+            Maximum number of events per chunk.
+        n_jobs : int
+            Number of threads used to process the chunks. Every thread fills
+            its own copy of the map, which are summed at the end.
+        """
+        n_events = len(events.table)
+        starts = list(range(0, n_events, chunk_size))
+
+        def fill_chunks(m, starts):
+            for start in starts:
+                coords = events._map_coord_arrays(m.geom, start, start + chunk_size)
+                m.fill_by_coord(coords)
+
+        if n_jobs is None:
+            fill_chunks(self, starts)
+            return
+
+        maps = [
+            Map.from_geom(copy.deepcopy(self.geom), dtype=self.data.dtype)
+            for _ in range(n_jobs)
+        ]
+
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [
+                executor.submit(fill_chunks, m, starts[idx::n_jobs])
+                for idx, m in enumerate(maps)
+            ]
+            for future in futures:
+                future.result()
+
+        for m in maps:
+            self.data += m.data
 
     def fill_by_coord(self, coords, weights=None):
         """Fill pixels at ``coords`` with given ``weights``.
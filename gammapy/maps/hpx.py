@@ -2,8 +2,9 @@
 """Utilities for dealing with HEALPix projections and mappings."""
 import copy
 import re
+from collections import OrderedDict
 import numpy as np
-from astropy.coordinates import SkyCoord
+from astropy.coordinates import Angle, SkyCoord
 from astropy.io import fits
 from astropy.units import Quantity
 from .geom import Geom, MapAxes, MapCoord, pix_tuple_to_idx, skycoord_to_lonlat
@@ -487,6 +488,7 @@ class HpxGeom(Geom):
         self._ipix = None
         self._rmap = None
         self._region = region
+        self._pairs_cache = {}
         self._create_lookup(region)
 
         if self._ipix is not None:
@@ -988,6 +990,94 @@ class HpxGeom(Geom):
             axes=copy.deepcopy(self.axes),
         )
 
+    def cutout(self, position, width):
+        """Create a partial-sky cutout around a given position.
+
+        The cutout is a disk, with a diameter given by the largest value of
+        ``width``. Pixels of the cutout that are outside of a partial-sky
+        parent geometry are kept, the corresponding map values are zero.
+
+        Parameters
+        ----------
+        position : `~astropy.coordinates.SkyCoord`
+            Center position of the cutout region.
+        width : `~astropy.coordinates.Angle` or tuple of `~astropy.coordinates.Angle`
+            Angular sizes of the cutout region.
+
+        Returns
+        -------
+        cutout : `~gammapy.maps.HpxGeom`
+            Cutout geometry.
+        """
+        if not self.is_regular:
+            raise ValueError("Cutout only supported for regular HEALPix geometries.")
+
+        lon, lat, _ = skycoord_to_lonlat(position, frame=self.frame)
+        radius = 0.5 * np.max(Angle(width).deg)
+        region = f"DISK_INC({lon},{lat},{radius},4)"
+
+        return self.__class__(
+            np.max(self.nside),
+            self.nest,
+            frame=self.frame,
+            region=region,
+            axes=copy.deepcopy(self.axes),
+        )
+
+    @property
+    def _image_ipix(self):
+        """HEALPix pixel indices of the image plane, for regular geometries."""
+        if self._ipix is None:
+            return np.arange(self._maxpix.flat[0])
+
+        return self._ipix[: self._npix.flat[0]]
+
+    def _get_image_vec(self):
+        """Unit vectors of the pixel centers of the image plane, with shape (npix, 3)."""
+        import healpy as hp
+
+        vec = hp.pix2vec(np.max(self.nside), self._image_ipix, nest=self.nest)
+        return np.stack(vec, axis=-1)
+
+    def _get_pairs(self, max_radius):
+        """Find all pairs of pixels of the image plane within a given radius.
+
+        The pairs are found with a KD-tree on the pixel unit vectors and are
+        cached on the geometry, so that they can be re-used for repeated
+        convolutions of maps with the same geometry.
+
+        Parameters
+        ----------
+        max_radius : `~astropy.coordinates.Angle`
+            Maximum separation of the pixels.
+
+        Returns
+        -------
+        idx_out, idx_in : `~numpy.ndarray`
+            Local pixel indices of the pairs, including the pixels themselves.
+        separation : `~numpy.ndarray`
+            Separation of the pixel pairs in degree.
+        """
+        from scipy.spatial import cKDTree
+
+        max_radius = Angle(max_radius)
+        key = round(max_radius.deg, 9)
+
+        if key not in self._pairs_cache:
+            vec = self._get_image_vec()
+            chord = 2 * np.sin(0.5 * min(max_radius.rad, np.pi))
+            pairs = cKDTree(vec).query_pairs(chord, output_type="ndarray")
+
+            idx = np.arange(len(vec))
+            idx_out = np.concatenate([idx, pairs[:, 0], pairs[:, 1]])
+            idx_in = np.concatenate([idx, pairs[:, 1], pairs[:, 0]])
+
+            distance = np.linalg.norm(vec[idx_out] - vec[idx_in], axis=-1)
+            separation = np.degrees(2 * np.arcsin(np.clip(0.5 * distance, 0, 1)))
+            self._pairs_cache[key] = idx_out, idx_in, separation
+
+        return self._pairs_cache[key]
+
     def upsample(self, factor):
         if not is_power2(factor):
             raise ValueError("Upsample factor must be a power of 2.")
@@ -1490,7 +1580,7 @@ class HpxGeom(Geom):
 
         return pix
 
-    def get_coord(self, idx=None, flat=False):
+    def get_coord(self, idx=None, flat=False, frame=None):
         pix = self.get_idx(idx=idx, flat=flat)
         coords = self.pix_to_coord(pix)
         cdict = {"lon": coords[0], "lat": coords[1]}
@@ -1498,12 +1588,33 @@ class HpxGeom(Geom):
         for i, axis in enumerate(self.axes):
             cdict[axis.name] = coords[i + 2]
 
-        return MapCoord.create(cdict, frame=self.frame)
+        if frame is None:
+            frame = self.frame
+
+        return MapCoord.create(cdict, frame=self.frame).to_frame(frame)
 
     def contains(self, coords):
         idx = self.coord_to_idx(coords)
         return np.all(np.stack([t != INVALID_INDEX.int for t in idx]), axis=0)
 
+    def separation(self, center):
+        """Compute sky separation wrt a given center.
+
+        Parameters
+        ----------
+        center : `~astropy.coordinates.SkyCoord`
+            Center position
+
+        Returns
+        -------
+        separation : `~astropy.coordinates.Angle`
+            Separation angle array (1D), for regular geometries.
+        """
+        lon, lat, _ = skycoord_to_lonlat(center, frame=self.frame)
+        vec = coords_to_vec(lon, lat)[0]
+        cos_sep = np.clip(self._get_image_vec() @ vec, -1, 1)
+        return Angle(np.arccos(cos_sep), "rad").to("deg")
+
     def solid_angle(self):
         """Solid angle array (`~astropy.units.Quantity` in ``sr``).
 
@@ -1561,6 +1672,10 @@ class HpxGeom(Geom):
 class HpxToWcsMapping:
     """Stores the indices need to convert from HEALPIX to WCS.
 
+    For regular HEALPix geometries the mapping is also available as a sparse
+    matrix, see `~HpxToWcsMapping.matrix`, so that all bands of a map are
+    reprojected with a single matrix product, in both directions.
+
     Parameters
     ----------
     hpx : `~HpxGeom`
@@ -1569,6 +1684,11 @@ class HpxToWcsMapping:
         WCS geometry object.
     """
 
+    cache_size = 16
+    """Maximum number of mappings stored in the cache."""
+
+    _cache = OrderedDict()
+
     def __init__(self, hpx, wcs, ipix, mult_val, npix):
         self._hpx = hpx
         self._wcs = wcs
@@ -1577,6 +1697,7 @@ class HpxToWcsMapping:
         self._npix = npix
         self._lmap = self._hpx[self._ipix]
         self._valid = self._lmap >= 0
+        self._matrix = None
 
     @property
     def hpx(self):
@@ -1613,8 +1734,47 @@ class HpxToWcsMapping:
         """Array ``(nx, ny)`` of bool: which WCS pixel in inside the HEALPIX region."""
         return self._valid
 
+    @property
+    def matrix(self):
+        """Sparse mapping matrix (`~scipy.sparse.csr_matrix`).
+
+        The matrix has shape ``(n_wcs, n_hpx)``, with the WCS pixels ordered
+        as in `~HpxToWcsMapping.ipix` and the local HEALPix pixels as columns.
+        Every valid WCS pixel has a single entry, with the value
+        `~HpxToWcsMapping.mult_val`. Only available for regular geometries.
+        """
+        from scipy.sparse import csr_matrix
+
+        if not self.hpx.is_regular:
+            raise ValueError("Mapping matrix only available for regular geometries.")
+
+        if self._matrix is None:
+            idx_wcs = np.flatnonzero(self._valid)
+            shape = (self._valid.size, np.max(self.hpx.npix))
+            self._matrix = csr_matrix(
+                (self._mult_val[idx_wcs], (idx_wcs, self._lmap[idx_wcs])), shape=shape
+            )
+
+        return self._matrix
+
+    @staticmethod
+    def _get_cache_key(hpx, wcs):
+        if hpx.region == "explicit":
+            region = hash(hpx._ipix.tobytes())
+        else:
+            region = hpx.region
+
+        return (
+            tuple(hpx.nside.flat),
+            hpx.nest,
+            hpx.frame,
+            region,
+            wcs.wcs.to_header_string(),
+            tuple(int(_.flat[0]) for _ in wcs.npix),
+        )
+
     @classmethod
-    def create(cls, hpx, wcs):
+    def create(cls, hpx, wcs, use_cache=False):
         """Create HEALPix to WCS geometry pixel mapping.
 
         Parameters
@@ -1623,6 +1783,11 @@ class HpxToWcsMapping:
             HEALPix geometry object.
         wcs : `~gammapy.maps.WcsGeom`
             WCS geometry object.
+        use_cache : bool
+            Whether to use the mapping cache. If True the mapping is stored and
+            re-used for equivalent pairs of HEALPix and WCS geometries. The
+            least recently used mappings are evicted once more than
+            ``HpxToWcsMapping.cache_size`` mappings are stored.
 
         Returns
         -------
@@ -1630,6 +1795,23 @@ class HpxToWcsMapping:
             Mapping
 
         """
+        if not use_cache:
+            return cls._create(hpx, wcs)
+
+        key = cls._get_cache_key(hpx, wcs)
+
+        if key in cls._cache:
+            cls._cache.move_to_end(key)
+        else:
+            cls._cache[key] = cls._create(hpx, wcs)
+
+            while len(cls._cache) > cls.cache_size:
+                cls._cache.popitem(last=False)
+
+        return cls._cache[key]
+
+    @classmethod
+    def _create(cls, hpx, wcs):
         import healpy as hp
 
         npix = wcs.npix
@@ -1713,3 +1895,83 @@ class HpxToWcsMapping:
             wcs_data[~valid] = np.nan
 
         return wcs_data
+
+    def _get_wcs_shape(self):
+        nx, ny = [int(t.flat[0]) for t in self._npix]
+        return nx, ny
+
+    def reproject_to_wcs(self, hpx_data, normalize=True, fill_nan=True):
+        """Reproject HEALPix data to the WCS geometry.
+
+        All bands are reprojected with a single sparse matrix product.
+
+        Parameters
+        ----------
+        hpx_data : `~numpy.ndarray`
+            HEALPix data with shape ``(..., n_hpx)``.
+        normalize : bool
+            True -> preserve integral by splitting HEALPIX values between bins
+        fill_nan : bool
+            Fill pixels outside the HPX geometry with NaN.
+
+        Returns
+        -------
+        wcs_data : `~numpy.ndarray`
+            WCS data with shape ``(..., ny, nx)``.
+        """
+        matrix = self.matrix
+
+        if not normalize:
+            matrix = matrix.sign()
+
+        nx, ny = self._get_wcs_shape()
+        shape_axes = hpx_data.shape[:-1]
+
+        data = matrix @ hpx_data.reshape((-1, hpx_data.shape[-1])).T
+
+        if fill_nan:
+            data[~self._valid] = np.nan
+
+        data = data.reshape((nx, ny, -1)).T
+        return data.reshape(shape_axes + (ny, nx))
+
+    def reproject_to_hpx(self, wcs_data, normalize=True, fill_nan=True):
+        """Reproject WCS data to the HEALPix geometry.
+
+        This is the reverse of `~HpxToWcsMapping.reproject_to_wcs`: the values
+        of all WCS pixels whose centers fall into a HEALPix pixel are summed
+        (``normalize=True``) or averaged (``normalize=False``). The WCS
+        geometry should oversample the HEALPix pixels.
+
+        Parameters
+        ----------
+        wcs_data : `~numpy.ndarray`
+            WCS data with shape ``(..., ny, nx)``.
+        normalize : bool
+            True -> preserve the integral by summing the WCS values,
+            False -> average the WCS values.
+        fill_nan : bool
+            Fill HEALPix pixels not covered by any WCS pixel with NaN.
+
+        Returns
+        -------
+        hpx_data : `~numpy.ndarray`
+            HEALPix data with shape ``(..., n_hpx)``.
+        """
+        matrix = self.matrix.sign().T.tocsr()
+
+        nx, ny = self._get_wcs_shape()
+        shape_axes = wcs_data.shape[:-2]
+
+        data = wcs_data.reshape((-1, ny, nx)).T.reshape((nx * ny, -1))
+        data = matrix @ np.nan_to_num(data)
+        counts = np.asarray(matrix.sum(axis=1))
+
+        if not normalize:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                data = data / counts
+
+        if fill_nan:
+            data[counts[:, 0] == 0] = np.nan
+
+        return data.T.reshape(shape_axes + (-1,))
@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
+from astropy import units as u
 from astropy.io import fits
 from astropy.units import Quantity
 from gammapy.utils.units import unit_from_fits_image_hdu
@@ -144,13 +145,23 @@ class HpxNDMap(HpxMap):
                 width_pix=width_pix,
             )
 
-        # FIXME: Check whether the old mapping is still valid and reuse it
         if hpx2wcs is None:
             geom_wcs_image = self.geom.to_wcs_geom(
                 proj=proj, oversample=oversample, width_pix=width_pix, drop_axes=True
             )
 
-            hpx2wcs = HpxToWcsMapping.create(self.geom, geom_wcs_image)
+            hpx2wcs = HpxToWcsMapping.create(self.geom, geom_wcs_image, use_cache=True)
+
+        if self.geom.is_regular:
+            if sum_bands:
+                hpx_data = self.data.reshape((-1, self.data.shape[-1])).sum(axis=0)
+                wcs = hpx2wcs.wcs.to_image()
+            else:
+                hpx_data = self.data
+                wcs = hpx2wcs.wcs.to_cube(self.geom.axes)
+
+            wcs_data = hpx2wcs.reproject_to_wcs(hpx_data, normalize=normalize)
+            return WcsNDMap(wcs, wcs_data, unit=self.unit)
 
         # FIXME: Need a function to extract a valid shape from npix property
 
@@ -171,6 +182,44 @@ class HpxNDMap(HpxMap):
         hpx2wcs.fill_wcs_map_from_hpx_data(hpx_data, wcs_data, normalize)
         return WcsNDMap(wcs, wcs_data, unit=self.unit)
 
+    @classmethod
+    def from_wcs(cls, wcs_map, geom, normalize=True, hpx2wcs=None):
+        """Create a HEALPix map from a WCS map.
+
+        The values of all WCS pixels whose centers fall into a HEALPix pixel
+        are summed or averaged, see `HpxToWcsMapping.reproject_to_hpx`. The WCS
+        map should oversample the HEALPix pixels, e.g. a map created with
+        `HpxNDMap.to_wcs`.
+
+        Parameters
+        ----------
+        wcs_map : `~gammapy.maps.WcsNDMap`
+            WCS map.
+        geom : `HpxGeom`
+            Regular HEALPix geometry. If it is an image, the non-spatial axes
+            of the WCS map are added.
+        normalize : bool
+            True -> preserve the integral by summing the WCS values,
+            False -> average the WCS values.
+        hpx2wcs : `~HpxToWcsMapping`
+            HEALPix to WCS mapping. If None it is created, or taken from the
+            mapping cache.
+
+        Returns
+        -------
+        map_out : `HpxNDMap`
+            HEALPix map.
+        """
+        if geom.is_image and wcs_map.geom.axes:
+            geom = geom.to_cube(wcs_map.geom.axes)
+
+        if hpx2wcs is None:
+            geom_wcs_image = wcs_map.geom.to_image()
+            hpx2wcs = HpxToWcsMapping.create(geom, geom_wcs_image, use_cache=True)
+
+        data = hpx2wcs.reproject_to_hpx(wcs_map.data, normalize=normalize)
+        return cls(geom, data=data.reshape(geom.data_shape), unit=wcs_map.unit)
+
     def pad(self, pad_width, mode="constant", cval=0, order=1):
         geom = self.geom.pad(pad_width)
         map_out = self._init_copy(geom=geom, data=None)
@@ -220,6 +269,165 @@ class HpxNDMap(HpxMap):
 
         return map_out
 
+    def cutout(self, position, width):
+        """Create a partial-sky cutout around a given position.
+
+        Parameters
+        ----------
+        position : `~astropy.coordinates.SkyCoord`
+            Center position of the cutout region.
+        width : `~astropy.coordinates.Angle` or tuple of `~astropy.coordinates.Angle`
+            Angular sizes of the cutout region, see `HpxGeom.cutout`.
+
+        Returns
+        -------
+        cutout : `~gammapy.maps.HpxNDMap`
+            Cutout map
+        """
+        geom_cutout = self.geom.cutout(position=position, width=width)
+        idx, valid = self._get_local_image_idx(geom_cutout)
+
+        data = np.zeros(geom_cutout.data_shape, dtype=self.data.dtype)
+        data[..., valid] = self.data[..., idx[valid]]
+        return self._init_copy(geom=geom_cutout, data=data)
+
+    def _get_local_image_idx(self, geom):
+        """Local image pixel indices of the pixels of another geometry.
+
+        Returns
+        -------
+        idx : `~numpy.ndarray`
+            Local pixel index, ``INVALID_INDEX.int`` for pixels outside this map.
+        valid : `~numpy.ndarray`
+            Mask of the pixels contained in this map.
+        """
+        self._check_pixelization(geom)
+        idx = self.geom.global_to_local((geom._image_ipix,))[0]
+        return idx, idx != INVALID_INDEX.int
+
+    def _check_pixelization(self, geom):
+        if not (self.geom.is_regular and geom.is_regular):
+            raise ValueError("Only regular HEALPix geometries are supported.")
+
+        if (
+            np.max(self.geom.nside) != np.max(geom.nside)
+            or self.geom.nest != geom.nest
+            or self.geom.frame != geom.frame
+        ):
+            raise ValueError("HEALPix pixelizations are not compatible.")
+
+    def stack(self, other, weights=None):
+        """Stack cutout into map.
+
+        The pixels of ``other`` that are not contained in this map are
+        discarded.
+
+        Parameters
+        ----------
+        other : `HpxNDMap`
+            Other map to stack
+        weights : `HpxNDMap`
+            Array to be used as weights. The spatial geometry must be equivalent
+            to `other` and additional axes must be broadcastable.
+        """
+        data = other.quantity.to_value(self.unit)
+
+        if weights is not None:
+            if weights.data.shape[-1] != data.shape[-1]:
+                raise ValueError("Incompatible spatial geoms between map and weights")
+            data = data * weights.data
+
+        if self.geom.is_allsky and other.geom.is_allsky:
+            self._check_pixelization(other.geom)
+            self.data += data
+        else:
+            idx, valid = self._get_local_image_idx(other.geom)
+            self.data[..., idx[valid]] += data[..., valid]
+
+    def convolve(self, kernel):
+        """Convolve map with a PSF kernel.
+
+        The convolution is computed in pixel space: the kernel is converted to
+        a radial profile, which is evaluated for all pairs of pixels of the map
+        within the kernel radius. The convolution of every image plane is then
+        a sparse matrix product. The kernel is normalised for every input pixel,
+        so that the total flux is preserved.
+
+        Parameters
+        ----------
+        kernel : `~gammapy.irf.PSFKernel`
+            PSF kernel, the map and kernel non-spatial axes must be compatible.
+
+        Returns
+        -------
+        map : `HpxNDMap`
+            Convolved map.
+        """
+        from scipy.sparse import csr_matrix
+
+        kmap = kernel.psf_kernel_map
+        rad_nodes, profile = self._get_kernel_profile(kmap)
+
+        geom = self.geom
+        if self.geom.is_image and len(profile) > 1:
+            geom = geom.to_cube([kmap.geom.axes[0]])
+        elif len(profile) > 1 and geom.shape_axes != kmap.geom.shape_axes:
+            raise ValueError(
+                f"Incompatible shape between data {geom.shape_axes} and kernel"
+                f" {kmap.geom.shape_axes}"
+            )
+
+        idx_out, idx_in, separation = self.geom._get_pairs(rad_nodes[-1] * u.deg)
+        npix = self.data.shape[-1]
+
+        images = self.data.reshape((-1, npix))
+        convolved_data = np.empty((max(len(images), len(profile)), npix))
+
+        for idx in range(len(convolved_data)):
+            values = np.interp(
+                separation, rad_nodes, profile[min(idx, len(profile) - 1)]
+            )
+            matrix = csr_matrix((values, (idx_out, idx_in)), shape=(npix, npix))
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                norm = 1 / np.asarray(matrix.sum(axis=0)).ravel()
+
+            image = images[min(idx, len(images) - 1)] * np.nan_to_num(norm)
+            convolved_data[idx] = matrix @ image
+
+        convolved_data = convolved_data.reshape(geom.data_shape)
+        return self._init_copy(data=convolved_data.astype(np.float32), geom=geom)
+
+    @staticmethod
+    def _get_kernel_profile(kernel_map):
+        """Radial profile of a WCS kernel map, per image plane.
+
+        Returns
+        -------
+        rad : `~numpy.ndarray`
+            Radii of the profile nodes in degree.
+        profile : `~numpy.ndarray`
+            Kernel values per solid angle, with shape (n_images, n_rad).
+        """
+        geom = kernel_map.geom.to_image()
+        rad = geom.separation(geom.center_skydir).deg.ravel()
+        binsz = np.min(geom.pixel_scales.deg)
+
+        idx = np.floor(rad / binsz).astype(int)
+        counts = np.bincount(idx)
+        valid = counts > 0
+
+        rad_nodes = np.bincount(idx, weights=rad)[valid] / counts[valid]
+
+        data = kernel_map.data / geom.solid_angle().to_value("deg2")
+        data = data.reshape((-1, rad.size))
+        profile = [np.bincount(idx, weights=_)[valid] / counts[valid] for _ in data]
+
+        # restrict to the largest circle fully contained in the kernel map
+        max_radius = 0.5 * np.min(geom.width.to_value("deg"))
+        contained = rad_nodes <= max_radius
+        return rad_nodes[contained], np.array(profile)[:, contained]
+
     def interp_by_coord(self, coords, method="linear"):
         # inherited docstring
         coords = MapCoord.create(coords, frame=self.geom.frame)
@@ -248,6 +456,11 @@ class HpxNDMap(HpxMap):
 
         theta, phi = coords.theta, coords.phi
 
+        if len(idxs) > 0:
+            shape = np.broadcast(theta, *idxs).shape
+            theta = np.broadcast_to(theta, shape).copy()
+            phi = np.broadcast_to(phi, shape).copy()
+
         m = ~np.isfinite(theta)
         theta[m] = 0
         phi[m] = 0
@@ -278,41 +491,62 @@ class HpxNDMap(HpxMap):
         pix_local += [np.broadcast_to(t, pix_local[0].shape) for t in idxs]
         return pix_local, wts
 
-    def _interp_by_coord(self, coords):
-        """Linearly interpolate map values."""
-        pix, wts = self._get_interp_weights(coords)
+    def _get_axes_interp_weights(self, coords):
+        """Get corner indices and weights for the linear interpolation along the non-spatial axes.
 
-        if self.geom.is_image:
-            return np.sum(self.data.T[tuple(pix)] * wts, axis=0)
+        Returns
+        -------
+        idxs : list of `~numpy.ndarray`
+            Axis indices of the ``2 ** n_axes`` corners, for every axis. The
+            corners are along the first dimension of the arrays.
+        wts : `~numpy.ndarray`
+            Interpolation weights of the corners.
+        """
+        idxs, fracs = [], []
+
+        for ax in self.geom.axes:
+            idx = ax.coord_to_idx(coords[ax.name])
+            idx = np.clip(idx, 0, len(ax.center) - 2)
+
+            center = ax.center.value
+            c = Quantity(coords[ax.name], ax.center.unit, copy=False).value
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                fracs.append((c - center[idx]) / (center[idx + 1] - center[idx]))
+            idxs.append(idx)
+
+        ndim = np.broadcast(*idxs, *fracs).ndim
+        corners = np.arange(2 ** len(idxs)).reshape((-1,) + (1,) * ndim)
 
-        val = np.zeros(pix[0].shape[1:])
+        idxs_corner, wts = [], np.ones(corners.shape)
 
-        # Loop over function values at corners
-        for i in range(2 ** len(self.geom.axes)):
-            pix_i = []
-            wt = np.ones(pix[0].shape[1:])[np.newaxis, ...]
-            for j, ax in enumerate(self.geom.axes):
-                idx = ax.coord_to_idx(coords[ax.name])
-                idx = np.clip(idx, 0, len(ax.center) - 2)
+        for j, (idx, frac) in enumerate(zip(idxs, fracs)):
+            upper = (corners >> j) & 1
+            idxs_corner.append(idx + upper)
+            wts = wts * np.where(upper, frac, 1.0 - frac)
 
-                w = ax.center[idx + 1] - ax.center[idx]
-                c = Quantity(coords[ax.name], ax.center.unit, copy=False).value
+        wts[~np.isfinite(wts)] = 0
+        return idxs_corner, wts
 
-                if i & (1 << j):
-                    wt *= (c - ax.center[idx].value) / w.value
-                    pix_i += [idx + 1]
-                else:
-                    wt *= 1.0 - (c - ax.center[idx].value) / w.value
-                    pix_i += [idx]
+    def _interp_by_coord(self, coords):
+        """Linearly interpolate map values."""
+        if self.geom.is_image:
+            pix, wts = self._get_interp_weights(coords)
+            return np.sum(self.data.T[tuple(pix)] * wts, axis=0)
 
-            if not self.geom.is_regular:
-                pix, wts = self._get_interp_weights(coords, pix_i)
+        idxs, wts_axes = self._get_axes_interp_weights(coords)
 
-            wts[pix[0] == INVALID_INDEX.int] = 0
-            wt[~np.isfinite(wt)] = 0
-            val += np.nansum(wts * wt * self.data.T[tuple(pix[:1] + pix_i)], axis=0)
+        if self.geom.is_regular:
+            pix, wts = self._get_interp_weights(coords)
+            pix, wts = pix[0][:, np.newaxis], wts[:, np.newaxis]
+        else:
+            # the HEALPix weights depend on the nside of the corner image plane
+            pix, wts = self._get_interp_weights(coords, idxs)
+            pix = pix[0]
 
-        return val
+        wts = np.where(pix == INVALID_INDEX.int, 0, wts)
+        values = self.data.T[(pix,) + tuple(idx[np.newaxis] for idx in idxs)]
+        return np.nansum(wts * wts_axes[np.newaxis] * values, axis=(0, 1))
 
     def fill_by_idx(self, idx, weights=None):
         idx = pix_tuple_to_idx(idx)
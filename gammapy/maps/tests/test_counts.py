@@ -3,6 +3,7 @@ import pytest
 import numpy as np
 from numpy.testing import assert_allclose
 import astropy.units as u
+from astropy.coordinates import SkyCoord
 from astropy.table import Table
 from gammapy.data import EventList
 from gammapy.maps import HpxGeom, Map, MapAxis, WcsNDMap
@@ -64,3 +65,27 @@ def test_map_fill_events_uint_column(events):
     m.fill_events(events)
     assert m.data.sum() == 1
     assert_allclose(m.data[0, 0, 0], 1)
+
+
+@pytest.mark.parametrize("frame", ["icrs", "galactic"])
+def test_map_fill_events_chunks(frame):
+    rng = np.random.RandomState(0)
+    t = Table()
+    t["RA"] = rng.uniform(260, 272, 1000) * u.deg
+    t["DEC"] = rng.uniform(-35, -23, 1000) * u.deg
+    t["ENERGY"] = rng.uniform(1, 10, 1000) * u.TeV
+    events = EventList(t)
+
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    skydir = SkyCoord(266.4, -29, unit="deg", frame="icrs")
+    m_ref = Map.create(skydir=skydir, binsz=0.5, width=8, frame=frame, axes=[axis])
+    m_ref.fill_by_coord(events.map_coord(m_ref.geom))
+
+    m = Map.from_geom(m_ref.geom)
+    m.fill_events(events, chunk_size=77)
+    assert_allclose(m.data, m_ref.data)
+
+    m = Map.from_geom(m_ref.geom)
+    m.fill_events(events, chunk_size=100, n_jobs=3)
+    assert_allclose(m.data, m_ref.data)
+    assert m.data.sum() > 0
@@ -6,6 +6,7 @@ from astropy import units as u
 from astropy.coordinates import SkyCoord
 from astropy.io import fits
 from gammapy.maps import HpxGeom, HpxMap, HpxNDMap, Map, MapAxis
+from gammapy.maps.hpx import HpxToWcsMapping
 from gammapy.utils.testing import mpl_plot_check, requires_data, requires_dependency
 
 pytest.importorskip("healpy")
@@ -180,6 +181,24 @@ def test_hpxmap_interp_by_coord_quantities():
     assert_allclose(val, 42, rtol=1e-2)
 
 
+def test_hpxmap_interp_by_coord_axes():
+    axis_1 = MapAxis.from_nodes([1, 2, 4], name="axis_1")
+    axis_2 = MapAxis.from_nodes([0, 1, 2, 3], name="axis_2")
+    m = HpxNDMap(HpxGeom(nside=4, axes=[axis_1, axis_2]))
+
+    coords = m.geom.get_coord()
+    m.data = (2 * coords["axis_1"] + coords["axis_2"]).value
+
+    coords = {
+        "lon": [10, 20, 30],
+        "lat": [0, 10, -10],
+        "axis_1": [1.5, 3, 2],
+        "axis_2": [0.25, 1.5, 3],
+    }
+    values = m.interp_by_coord(coords)
+    assert_allclose(values, [3.25, 7.5, 7])
+
+
 @pytest.mark.parametrize(("nside", "nested", "frame", "region", "axes"), hpx_test_geoms)
 def test_hpxmap_fill_by_coord(nside, nested, frame, region, axes):
     m = create_map(nside, nested, frame, region, axes)
@@ -198,6 +217,41 @@ def test_hpxmap_to_wcs(nside, nested, frame, region, axes):
     m.to_wcs(sum_bands=True, oversample=2, normalize=False)
 
 
+def test_hpxmap_to_wcs_from_wcs():
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+    geom = HpxGeom(nside=16, frame="galactic", region="DISK(110.,75.,10.)", axes=[axis])
+    m = HpxNDMap(geom)
+    m.data = np.random.RandomState(0).uniform(size=m.data.shape)
+
+    m_wcs = m.to_wcs(oversample=4, normalize=True)
+    assert m_wcs.data.shape[0] == 2
+    assert_allclose(np.nansum(m_wcs.data), m.data.sum())
+
+    m_hpx = HpxNDMap.from_wcs(m_wcs, geom=geom.to_image(), normalize=True)
+    assert m_hpx.data.shape == m.data.shape
+    assert_allclose(m_hpx.data, m.data)
+
+    m_wcs = m.to_wcs(oversample=4, normalize=False)
+    m_hpx = HpxNDMap.from_wcs(m_wcs, geom=geom, normalize=False)
+    assert_allclose(m_hpx.data, m.data)
+
+    m_wcs_sum = m.to_wcs(oversample=4, normalize=False, sum_bands=True)
+    assert_allclose(m_wcs_sum.data, m_wcs.data.sum(axis=0))
+
+
+def test_hpx_to_wcs_mapping_cache():
+    geom = HpxGeom(nside=16, frame="galactic", region="DISK(110.,75.,10.)")
+    geom_wcs = geom.to_wcs_geom()
+
+    mapping = HpxToWcsMapping.create(geom, geom_wcs, use_cache=True)
+    assert HpxToWcsMapping.create(geom.copy(), geom_wcs, use_cache=True) is mapping
+    assert HpxToWcsMapping.create(geom, geom_wcs) is not mapping
+
+    npix_wcs = geom_wcs.data_shape[0] * geom_wcs.data_shape[1]
+    assert mapping.matrix.shape == (npix_wcs, geom.npix[0])
+    assert_allclose(mapping.matrix.sum(), np.unique(mapping.lmap[mapping.valid]).size)
+
+
 @pytest.mark.parametrize(("nside", "nested", "frame", "region", "axes"), hpx_test_geoms)
 def test_hpxmap_swap_scheme(nside, nested, frame, region, axes):
     m = HpxNDMap(
@@ -341,3 +395,55 @@ def test_hpxndmap_resample_axis():
     m3 = m.resample_axis(axis=new_axis)
     assert m3.data.shape == (3, 1, 3072)
     assert_allclose(m3.data, 2)
+
+
+def test_hpxndmap_cutout_stack():
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+    geom = HpxGeom.create(nside=64, frame="galactic", axes=[axis])
+    m = HpxNDMap(geom)
+    m.data += np.arange(geom.data_shape[-1])
+
+    position = SkyCoord(10, 20, unit="deg", frame="galactic")
+    cutout = m.cutout(position=position, width=10 * u.deg)
+
+    assert cutout.geom.nside == 64
+    assert cutout.data.shape[0] == 2
+    assert not cutout.geom.is_allsky
+
+    separation = cutout.geom.separation(position)
+    assert np.max(separation.deg) < 6
+
+    coords = cutout.geom.get_coord()
+    assert_allclose(m.get_by_coord(coords), cutout.data)
+
+    m_stacked = HpxNDMap(geom)
+    m_stacked.stack(cutout)
+    m_stacked.stack(cutout)
+    assert_allclose(m_stacked.data.sum(), 2 * cutout.data.sum())
+    assert_allclose(m_stacked.get_by_coord(coords), 2 * cutout.data)
+
+
+def test_hpxndmap_convolve():
+    from gammapy.irf import PSFKernel
+    from gammapy.maps import WcsGeom
+
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2, name="energy_true")
+    # the pixel size has to be small compared to the kernel width
+    geom = HpxGeom.create(nside=512, frame="galactic", axes=[axis])
+
+    position = SkyCoord(0, 0, unit="deg", frame="galactic")
+    m = HpxNDMap(geom).cutout(position=position, width=4 * u.deg)
+    m.set_by_coord({"skycoord": position, "energy_true": axis.center}, 1)
+
+    geom_kernel = WcsGeom.create(binsz=0.05, width=3, axes=[axis])
+    kernel = PSFKernel.from_gauss(
+        geom_kernel, sigma=0.3 * u.deg, max_radius=1.2 * u.deg
+    )
+    convolved = m.convolve(kernel)
+
+    assert convolved.data.shape == m.data.shape
+    assert_allclose(convolved.data.sum(axis=1), [1, 1], rtol=1e-5)
+
+    separation = convolved.geom.separation(position).deg
+    sigma = np.sqrt(np.sum(convolved.data[0] * separation ** 2) / 2)
+    assert_allclose(sigma, 0.3, rtol=0.03)
@@ -821,3 +821,28 @@ def test_mask_fit_modifications():
     mask_fit = mask_fit.binary_dilate(width=(0.3 * u.deg, 0.1 * u.deg), use_fft=False)
     assert np.sum(mask_fit_fft.data) == np.prod(mask_fit_fft.data.shape)
     assert np.sum(mask_fit.data) == np.prod(mask_fit.data.shape)
+
+
+def test_map_sampling_sampler_cache():
+    nmap = WcsNDMap.create(npix=5, binsz=1)
+    nmap.data[2, 2] = 1
+
+    sampler = nmap.get_sampler()
+    assert nmap.get_sampler() is sampler
+
+    coords = nmap.sample_coord(n_events=10, method="alias")
+    separation = coords.skycoord.separation(nmap.geom.center_skydir)
+    assert np.all(separation < 0.75 * u.deg)
+
+    nmap.data = np.ones((5, 5))
+    new_sampler = nmap.get_sampler()
+    assert new_sampler is not sampler
+    assert nmap.get_sampler() is new_sampler
+
+    nmap.data[...] = 0
+    nmap.data[0, 0] = 1
+    coords = nmap.sample_coord(n_events=10)
+    assert nmap.get_sampler() is not new_sampler
+    center = nmap.geom.pix_to_coord((0, 0))
+    center = SkyCoord(center[0], center[1], frame=nmap.geom.frame, unit="deg")
+    assert np.all(coords.skycoord.separation(center) < 0.75 * u.deg)
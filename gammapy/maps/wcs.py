@@ -3,7 +3,7 @@ import copy
 from functools import lru_cache
 import numpy as np
 import astropy.units as u
-from astropy.coordinates import Angle, SkyCoord
+from astropy.coordinates import Angle, SkyCoord, angular_separation
 from astropy.io import fits
 from astropy.nddata import Cutout2D
 from astropy.wcs import WCS
@@ -805,7 +805,16 @@ class WcsGeom(Geom):
             Separation angle array (2D)
         """
         coord = self.to_image().get_coord()
-        return center.separation(coord.skycoord)
+        center = center.transform_to(self.frame)
+
+        # avoid the SkyCoord machinery on the full pixel arrays
+        separation = angular_separation(
+            u.Quantity(coord.lon, "deg", copy=False),
+            u.Quantity(coord.lat, "deg", copy=False),
+            center.spherical.lon,
+            center.spherical.lat,
+        )
+        return Angle(separation, "deg")
 
     def cutout(self, position, width, mode="trim"):
         """
@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
+import zlib
 from collections import OrderedDict
 import warnings
 import numpy as np
@@ -86,6 +87,19 @@ class WcsNDMap(WcsMap):
 
         super().__init__(geom, data, meta, unit)
 
+    @property
+    def data(self):
+        """Data array (`~numpy.ndarray`)"""
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        WcsMap.data.fset(self, value)
+        self._samplers = {}
+
+    def _data_checksum(self):
+        return zlib.crc32(np.ascontiguousarray(self.data).view(np.uint8))
+
     @staticmethod
     def _make_default_data(geom, shape_np, dtype):
         # Check whether corners of each image plane are valid
@@ -801,7 +815,34 @@ class WcsNDMap(WcsMap):
             data = data * weights.data[cutout_slices]
         self.data[parent_slices] += data
 
-    def sample_coord(self, n_events, random_state=0):
+    def get_sampler(self, method="cdf"):
+        """Get inverse CDF sampler for the map data.
+
+        The sampler is cached on the map, so that drawing many realisations
+        from the same map requires computing the lookup tables only once.
+        The cache is keyed on a checksum of the data, so both assigning a new
+        data array and modifying the data in-place rebuild the sampler.
+
+        Parameters
+        ----------
+        method : {"cdf", "alias"}
+            Sampling method, see `~gammapy.utils.random.InverseCDFSampler`.
+
+        Returns
+        -------
+        sampler : `~gammapy.utils.random.InverseCDFSampler`
+            Inverse CDF sampler.
+        """
+        checksum = self._data_checksum()
+        cached = self._samplers.get(method)
+
+        if cached is None or cached[0] != checksum:
+            sampler = InverseCDFSampler(pdf=self.data, method=method)
+            self._samplers[method] = (checksum, sampler)
+
+        return self._samplers[method][1]
+
+    def sample_coord(self, n_events, random_state=0, method="cdf"):
         """Sample position and energy of events.
 
         Parameters
@@ -811,6 +852,8 @@ class WcsNDMap(WcsMap):
         random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
             Defines random number generator initialisation.
             Passed to `~gammapy.utils.random.get_random_state`.
+        method : {"cdf", "alias"}
+            Sampling method, see `~gammapy.utils.random.InverseCDFSampler`.
 
         Returns
         -------
@@ -819,9 +862,9 @@ class WcsNDMap(WcsMap):
         """
 
         random_state = get_random_state(random_state)
-        sampler = InverseCDFSampler(pdf=self.data, random_state=random_state)
+        sampler = self.get_sampler(method=method)
 
-        coords_pix = sampler.sample(n_events)
+        coords_pix = sampler.sample(n_events, random_state=random_state)
         coords = self.geom.pix_to_coord(coords_pix[::-1])
 
         # TODO: pix_to_coord should return a MapCoord object
@@ -1,6 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
-import itertools
+import contextlib
+import functools
 import logging
+from multiprocessing import Pool
 import numpy as np
 from astropy.utils import lazyproperty
 from gammapy.utils.table import table_from_row_data
@@ -380,12 +382,20 @@ class Fit:
             "fit_results": fit_results,
         }
 
-    def stat_surface(self, x, y, x_values, y_values, reoptimize=False, **optimize_opts):
+    def stat_surface(
+        self, x, y, x_values, y_values, reoptimize=False, n_jobs=None, **optimize_opts
+    ):
         """Compute fit statistic surface.
 
         The method used is to vary two parameters, keeping all others fixed.
         So this is taking a "slice" or "scan" of the fit statistic.
 
+        The grid cells are processed in a serpentine order, so that consecutive
+        cells are neighbours. When re-optimizing, the other parameters of each
+        cell are initialised from the nearest cell already solved. With
+        ``n_jobs`` the grid is split into blocks of rows, which are evaluated
+        in parallel on a copy of the datasets per process.
+
         Caveat: This method can be very computationally intensive and slow
 
         See also: `Fit.minos_contour`
@@ -398,6 +408,9 @@ class Fit:
             Parameter values to evaluate the fit statistic for.
         reoptimize : bool
             Re-optimize other parameters, when computing the fit statistic profile.
+        n_jobs : int
+            Number of processes used to evaluate the grid. By default the
+            grid is evaluated serially.
         **optimize_opts : dict
             Keyword arguments passed to the optimizer. See `Fit.optimize` for further details.
 
@@ -411,31 +424,48 @@ class Fit:
         x = parameters[x]
         y = parameters[y]
 
-        stats = []
-        fit_results = []
-        with parameters.restore_status():
-            for x_value, y_value in itertools.product(x_values, y_values):
-                # TODO: Remove log.info() and provide a nice progress bar
-                log.info(f"Processing: x={x_value}, y={y_value}")
-                x.value = x_value
-                y.value = y_value
-                if reoptimize:
-                    x.frozen = True
-                    y.frozen = True
-                    result = self.optimize(**optimize_opts)
-                    stat = result.total_stat
-                    fit_results.append(result)
-                else:
-                    stat = self.datasets.stat_sum()
+        shape = (np.asarray(x_values).shape[0], np.asarray(y_values).shape[0])
 
-                stats.append(stat)
+        cells = []
+        for i, x_value in enumerate(x_values):
+            idx_y = range(shape[1]) if i % 2 == 0 else reversed(range(shape[1]))
+            cells.extend(((i, j), (x_value, y_values[j])) for j in idx_y)
+
+        wrap = functools.partial(
+            _stat_surface_cells,
+            x=parameters.index(x),
+            y=parameters.index(y),
+            reoptimize=reoptimize,
+            optimize_opts=optimize_opts,
+        )
 
-        shape = (np.asarray(x_values).shape[0], np.asarray(y_values).shape[0])
-        stats = np.array(stats)
-        stats = stats.reshape(shape)
-        if reoptimize:
-            fit_results = np.array(fit_results)
-            fit_results = fit_results.reshape(shape)
+        if n_jobs is None:
+            results = wrap(cells, fit=self)
+        else:
+            blocks = np.array_split(np.arange(len(cells)), n_jobs)
+            blocks = [[cells[idx] for idx in block] for block in blocks]
+
+            with contextlib.closing(
+                Pool(
+                    processes=n_jobs,
+                    initializer=_init_stat_surface_worker,
+                    initargs=(Fit(self.datasets.copy()),),
+                )
+            ) as pool:
+                log.info(f"Using {n_jobs} jobs to compute the fit statistic surface.")
+                results = sum(pool.map(wrap, blocks), [])
+
+            pool.join()
+
+        stats = np.empty(shape)
+        fit_results = np.empty(shape, dtype=object)
+
+        for (i, j), stat, result in results:
+            stats[i, j] = stat
+            fit_results[i, j] = result
+
+        if not reoptimize:
+            fit_results = []
 
         return {
             f"{x.name}_scan": x_values,
@@ -493,6 +523,74 @@ class Fit:
         }
 
 
+# Per process fit instance used to evaluate fit statistic surfaces
+_STAT_SURFACE_FIT = None
+
+
+def _init_stat_surface_worker(fit):
+    global _STAT_SURFACE_FIT
+    _STAT_SURFACE_FIT = fit
+
+
+def _stat_surface_cells(cells, x, y, reoptimize, optimize_opts, fit=None):
+    """Evaluate the fit statistic on a list of grid cells.
+
+    Parameters
+    ----------
+    cells : list
+        List of ``((i, j), (x_value, y_value))`` tuples.
+    x, y : int
+        Index of the parameters of interest.
+    reoptimize : bool
+        Re-optimize other parameters. Each cell is initialised from the
+        nearest cell already solved.
+    optimize_opts : dict
+        Keyword arguments passed to `Fit.optimize`.
+    fit : `Fit`
+        Fit instance. By default the instance of the worker process is used.
+
+    Returns
+    -------
+    results : list
+        List of ``((i, j), stat, fit_result)`` tuples.
+    """
+    if fit is None:
+        fit = _STAT_SURFACE_FIT
+
+    parameters = fit._parameters
+    x, y = parameters[x], parameters[y]
+
+    results, solved = [], {}
+
+    with parameters.restore_status():
+        for (i, j), (x_value, y_value) in cells:
+            # TODO: Remove log.info() and provide a nice progress bar
+            log.info(f"Processing: x={x_value}, y={y_value}")
+
+            if reoptimize and solved:
+                nearest = min(
+                    solved, key=lambda idx: (idx[0] - i) ** 2 + (idx[1] - j) ** 2
+                )
+                parameters.value = solved[nearest]
+
+            x.value = x_value
+            y.value = y_value
+
+            if reoptimize:
+                x.frozen = True
+                y.frozen = True
+                result = fit.optimize(**optimize_opts)
+                stat = result.total_stat
+                solved[(i, j)] = parameters.value
+            else:
+                result = None
+                stat = fit.datasets.stat_sum()
+
+            results.append(((i, j), stat, result))
+
+    return results
+
+
 class FitResult:
     """Fit result base class"""
 
@@ -10,8 +10,8 @@ from astropy.coordinates import SkyCoord
 from regions import CircleSkyRegion
 import yaml
 from gammapy.modeling import Covariance, Parameter, Parameters
+from gammapy.utils.coordinates import SkyCoordIndex
 from gammapy.utils.scripts import make_name, make_path
-from gammapy.maps import MapCoord, RegionGeom
 
 log = logging.getLogger(__name__)
 
@@ -280,6 +280,7 @@ class DatasetModels(collections.abc.Sequence):
 
         self._models = models
         self._covar_file = None
+        self._spatial_index_cache = None
         self._covariance = Covariance(self.parameters)
 
     def _check_covariance(self):
@@ -666,11 +667,39 @@ class DatasetModels(collections.abc.Sequence):
             mask = mask.sum_over_axes()
             mask.data = mask.data.astype(bool)
 
-        models = self.select(tag="SkyModel")
-        contribute = np.array(
-            [m.contributes(mask, margin, use_evaluation_region) for m in models]
-        )
-        return models[contribute]
+        if mask.geom.is_hpx or len(mask.data.squeeze().shape) < 2:
+            models = self.select(tag="SkyModel")
+            contribute = np.array(
+                [m.contributes(mask, margin, use_evaluation_region) for m in models]
+            )
+            return models[contribute]
+
+        is_sky_model = self.selection_mask(tag="SkyModel")
+        contribute = np.zeros(len(self), dtype=bool)
+
+        if not np.any(is_sky_model) or not np.any(mask.data):
+            return self[contribute]
+
+        # dilate the mask once for all models
+        if margin is not None:
+            mask = mask.binary_dilate(width=margin, mode="full")
+
+        # check the center positions of all models at once first (faster)
+        idx, index = self._spatial_index
+        data = mask.data.squeeze()
+        x, y = index.skycoord.to_pixel(mask.geom.wcs)
+        x, y = np.round(x).astype(int), np.round(y).astype(int)
+        inside = (x >= 0) & (x < data.shape[1]) & (y >= 0) & (y < data.shape[0])
+        contribute[idx[inside]] = data[y[inside], x[inside]]
+        contribute &= is_sky_model
+
+        if use_evaluation_region:
+            for k in np.nonzero(is_sky_model & ~contribute)[0]:
+                contribute[k] = self._models[k].contributes(
+                    mask, margin=None, use_evaluation_region=True
+                )
+
+        return self[contribute]
 
     def select_region(self, regions):
         """Select skymodels with center position contained within a given region
@@ -686,17 +715,77 @@ class DatasetModels(collections.abc.Sequence):
             Selected models 
         """
 
-        models = self.select(tag="SkyModel")
+        if not isinstance(regions, list):
+            regions = [regions]
+
+        idx, index = self._spatial_index
+
+        inside = np.zeros(len(self), dtype=bool)
+        for region in regions:
+            inside[idx[index.query_region(region)]] = True
+
+        return self[inside & self.selection_mask(tag="SkyModel")]
+
+    def select_cone(self, position, radius):
+        """Select skymodels with center position within a cone
+
+        Parameters
+        ----------
+        position : `~astropy.coordinates.SkyCoord`
+            Center position of the cone
+        radius : `~astropy.coordinates.Angle`
+            Radius of the cone
+
+        Returns
+        -------
+        models : `DatasetModels`
+            Selected models
+        """
+        idx, index = self._spatial_index
+
+        inside = np.zeros(len(self), dtype=bool)
+        inside[idx[index.query_cone(position, radius)]] = True
+
+        return self[inside & self.selection_mask(tag="SkyModel")]
+
+    @property
+    def _spatial_index(self):
+        """Spatial index over the model positions.
+
+        The index is cached and only rebuilt when the model positions change.
+
+        Returns
+        -------
+        idx : `~numpy.ndarray`
+            Indices of the models with a defined position.
+        index : `~gammapy.utils.coordinates.SkyCoordIndex`
+            Spatial index over the positions of these models.
+        """
+        idx, coords = [], {}
+        for k, model in enumerate(self._models):
+            position = getattr(model, "position", None)
+            if position is not None:
+                idx.append(k)
+                coords.setdefault(position.frame.name, []).append(
+                    [k, position.spherical.lon.deg, position.spherical.lat.deg]
+                )
+
+        idx = np.array(idx, dtype=int)
+        key = tuple((frame, np.array(_).tobytes()) for frame, _ in coords.items())
+
+        if self._spatial_index_cache is None or self._spatial_index_cache[0] != key:
+            # transform the positions frame by frame and restore the model order
+            lon, lat = np.zeros(len(self._models)), np.zeros(len(self._models))
+            for frame, values in coords.items():
+                k, lon_frame, lat_frame = np.array(values).T
+                k = k.astype(int)
+                positions = SkyCoord(lon_frame, lat_frame, unit="deg", frame=frame)
+                lon[k], lat[k] = positions.icrs.ra.deg, positions.icrs.dec.deg
 
-        if isinstance(regions, list):
-            region = [regions]
+            positions = SkyCoord(lon[idx], lat[idx], unit="deg", frame="icrs")
+            self._spatial_index_cache = key, SkyCoordIndex(positions)
 
-        inside = np.zeros(len(models), dtype=bool)
-        for k, m in enumerate(models):
-            pos = MapCoord.create(m.position)
-            for region in regions:
-                inside[k] |= np.all(RegionGeom(region).contains(pos))
-        return models[inside]
+        return idx, self._spatial_index_cache[1]
 
     def restore_status(self, restore_values=True):
         """Context manager to restore status.
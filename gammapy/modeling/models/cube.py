@@ -85,6 +85,10 @@ class SkyModel(Model):
     def _check_unit(self):
         from gammapy.data.gti import GTI
 
+        # do not trigger reading of lazily loaded templates
+        if getattr(self.spatial_model, "_map", True) is None:
+            return
+
         # evaluate over a test geom to check output unit
         # TODO simpler way to test this ?
         axis = MapAxis.from_energy_bounds(
@@ -236,6 +240,8 @@ class SkyModel(Model):
         models : `DatasetModels`
             Selected models contributing inside the region where mask==True
         """
+        if mask.geom.is_hpx:
+            return self._contributes_hpx(mask, margin, use_evaluation_region)
 
         mask_shape = len(mask.data.squeeze().shape)
         if mask_shape > 2:
@@ -267,6 +273,19 @@ class SkyModel(Model):
             )
         return contributes
 
+    def _contributes_hpx(self, mask, margin=None, use_evaluation_region=True):
+        """Check if a skymodel contributes within a HEALPix mask map"""
+        if mask.geom.axes:
+            mask = mask.reduce_over_axes(func=np.logical_or)
+
+        radius = u.Quantity(0, "deg") if margin is None else u.Quantity(margin, "deg")
+
+        if use_evaluation_region and self.evaluation_radius is not None:
+            radius = radius + self.evaluation_radius
+
+        separation = mask.geom.separation(self.position)
+        return bool(np.any(separation[mask.data.astype(bool)] <= radius))
+
     def evaluate(self, lon, lat, energy, time=None):
         """Evaluate the model at given points.
 
@@ -307,7 +326,8 @@ class SkyModel(Model):
 
     def evaluate_geom(self, geom, gti=None):
         """Evaluate model on `~gammapy.maps.Geom`."""
-        energy = geom.axes["energy_true"].center[:, np.newaxis, np.newaxis]
+        shape = (-1, 1) if geom.is_hpx else (-1, 1, 1)
+        energy = geom.axes["energy_true"].center.reshape(shape)
         value = self.spectral_model(energy)
 
         if self.spatial_model:
@@ -335,9 +355,8 @@ class SkyModel(Model):
             Predicted flux map
         """
         energy = geom.axes["energy_true"].edges
-        value = self.spectral_model.integral(energy[:-1], energy[1:],).reshape(
-            (-1, 1, 1)
-        )
+        shape = (-1, 1) if geom.is_hpx else (-1, 1, 1)
+        value = self.spectral_model.integral(energy[:-1], energy[1:]).reshape(shape)
 
         if self.spatial_model:
             value = value * self.spatial_model.integrate_geom(geom).quantity
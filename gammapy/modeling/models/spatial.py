@@ -1,6 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Spatial models."""
 import logging
+import warnings
+import weakref
 import numpy as np
 import scipy.integrate
 import scipy.special
@@ -8,6 +10,7 @@ import astropy.units as u
 from astropy.coordinates import Angle, SkyCoord
 from astropy.coordinates.angle_utilities import angular_separation, position_angle
 from astropy.utils import lazyproperty
+from astropy.wcs import FITSFixedWarning
 from regions import (
     CircleAnnulusSkyRegion,
     CircleSkyRegion,
@@ -129,19 +132,23 @@ class SpatialModel(Model):
 
     def evaluate_geom(self, geom):
         coords = geom.to_image().get_coord(frame=self.frame)
+        # HEALPix coordinates are returned as plain arrays in deg
+        lon = u.Quantity(coords.lon, "deg", copy=False)
+        lat = u.Quantity(coords.lat, "deg", copy=False)
 
         if self.is_energy_dependent:
-            energy = geom.axes["energy_true"].center
-            return self(coords.lon, coords.lat, energy[:, np.newaxis, np.newaxis])
+            shape = (-1, 1) if geom.is_hpx else (-1, 1, 1)
+            energy = geom.axes["energy_true"].center.reshape(shape)
+            return self(lon, lat, energy)
         else:
-            return self(coords.lon, coords.lat)
+            return self(lon, lat)
 
     def integrate_geom(self, geom):
         """Integrate model on `~gammapy.maps.Geom` or `~gammapy.maps.RegionGeom`.
         
         Parameters
         ----------
-        geom : `~gammapy.maps.WcsGeom` or `~gammapy.maps.RegionGeom`
+        geom : `~gammapy.maps.WcsGeom`, `~gammapy.maps.HpxGeom` or `~gammapy.maps.RegionGeom`
 
         Returns
         ---------
@@ -153,6 +160,10 @@ class SpatialModel(Model):
             mask = geom.contains(wcs_geom.get_coord())
             values = self.evaluate_geom(wcs_geom)
             data = ((values * wcs_geom.solid_angle())[mask]).sum()
+        elif geom.is_hpx:
+            # the HEALPix solid angle is not broadcast to the non-spatial axes
+            values = self.evaluate_geom(geom)
+            data = values * geom.solid_angle() * np.ones(geom.data_shape)
         else:
             values = self.evaluate_geom(geom)
             data = values * geom.solid_angle()
@@ -765,7 +776,11 @@ class TemplateSpatialModel(SpatialModel):
     Parameters
     ----------
     map : `~gammapy.maps.Map`
-        Map template.
+        Map template. If None, the map is read from ``filename`` on first
+        use. Lazily read templates are shared between all models created
+        from the same file, so that modifying the map of one of these models
+        in place also modifies it for the others. A shared map is released
+        once it is no longer used by any model.
     meta : dict, optional
         Meta information, meta['filename'] will be used for serialization
     normalize : bool
@@ -773,21 +788,43 @@ class TemplateSpatialModel(SpatialModel):
     interp_kwargs : dict
         Interpolation keyword arguments passed to `gammapy.maps.Map.interp_by_coord`.
         Default arguments are {'interp': 'linear', 'fill_value': 0}.
+    filename : str
+        Filename of the template.
     """
 
     tag = ["TemplateSpatialModel", "template"]
 
+    _map_cache = weakref.WeakValueDictionary()
+
     def __init__(
-        self, map, meta=None, normalize=True, interp_kwargs=None, filename=None,
+        self, map=None, meta=None, normalize=True, interp_kwargs=None, filename=None,
     ):
-        if (map.data < 0).any():
-            log.warning("Diffuse map has negative values. Check and fix this!")
+        if map is None and filename is None:
+            raise ValueError("Either a map or a filename is required.")
 
         if filename is not None:
             filename = str(make_path(filename))
 
         self.normalize = normalize
 
+        if map is not None:
+            map = self._prepare_map(map, normalize)
+
+        self._map = map
+
+        self.meta = dict() if meta is None else meta
+        interp_kwargs = {} if interp_kwargs is None else interp_kwargs
+        interp_kwargs.setdefault("method", "linear")
+        interp_kwargs.setdefault("fill_value", 0)
+        self._interp_kwargs = interp_kwargs
+        self.filename = filename
+        super().__init__()
+
+    @staticmethod
+    def _prepare_map(map, normalize):
+        if (map.data < 0).any():
+            log.warning("Diffuse map has negative values. Check and fix this!")
+
         if normalize:
             # Normalize the diffuse map model so that it integrates to unity
             if map.geom.is_image:
@@ -804,15 +841,33 @@ class TemplateSpatialModel(SpatialModel):
             map = map.copy(unit="sr-1")
             log.warning("Missing spatial template unit, assuming sr^-1")
 
-        self.map = map
+        return map
 
-        self.meta = dict() if meta is None else meta
-        interp_kwargs = {} if interp_kwargs is None else interp_kwargs
-        interp_kwargs.setdefault("method", "linear")
-        interp_kwargs.setdefault("fill_value", 0)
-        self._interp_kwargs = interp_kwargs
-        self.filename = filename
-        super().__init__()
+    @classmethod
+    def _read_map_cached(cls, filename, normalize):
+        """Read and prepare a template map, shared for the same file"""
+        key = (filename, normalize)
+        m = cls._map_cache.get(key)
+
+        if m is None:
+            with warnings.catch_warnings():  # ignore FITS units warnings
+                warnings.simplefilter("ignore", FITSFixedWarning)
+                m = cls._prepare_map(Map.read(filename), normalize)
+
+            cls._map_cache[key] = m
+
+        return m
+
+    @property
+    def map(self):
+        """Map template (`~gammapy.maps.Map`)"""
+        if self._map is None:
+            self._map = self._read_map_cached(self.filename, self.normalize)
+        return self._map
+
+    @map.setter
+    def map(self, value):
+        self._map = value
 
     @property
     def is_energy_dependent(self):
@@ -827,7 +882,7 @@ class TemplateSpatialModel(SpatialModel):
         return np.max(self.map.geom.width) / 2.0
 
     @classmethod
-    def read(cls, filename, normalize=True, **kwargs):
+    def read(cls, filename, normalize=True, lazy=False, **kwargs):
         """Read spatial template model from FITS image.
         If unit is not given in the FITS header the default is ``sr-1``.
 
@@ -837,9 +892,17 @@ class TemplateSpatialModel(SpatialModel):
             FITS image filename.
         normalize : bool
             Normalize the input map so that it integrates to unity.
+        lazy : bool
+            Defer reading the map until it is first used. The map is then
+            shared between all models lazily reading the same file.
         kwargs : dict
-            Keyword arguments passed to `Map.read()`.
+            Keyword arguments passed to `Map.read()`. Not supported with ``lazy=True``.
         """
+        if lazy:
+            if kwargs:
+                raise ValueError("Map.read() arguments not supported with lazy=True")
+            return cls(normalize=normalize, filename=filename)
+
         m = Map.read(filename, **kwargs)
         return cls(m, normalize=normalize, filename=filename)
 
@@ -7,7 +7,7 @@ from astropy.table import Table
 from astropy.time import Time
 from astropy.utils import lazyproperty
 from gammapy.modeling import Parameter
-from gammapy.utils.random import InverseCDFSampler, get_random_state
+from gammapy.utils.random import get_random_state
 from gammapy.utils.scripts import make_path
 from gammapy.utils.time import time_ref_from_dict
 from .core import Model
@@ -333,6 +333,10 @@ class LightCurveTemplateTemporalModel(TemporalModel):
         y = self.table["NORM"].data
         return scipy.interpolate.InterpolatedUnivariateSpline(x, y, k=1, ext=ext)
 
+    @lazyproperty
+    def _antiderivative(self):
+        return self._interpolator.antiderivative()
+
     @lazyproperty
     def _time_ref(self):
         return time_ref_from_dict(self.table.meta)
@@ -380,54 +384,68 @@ class LightCurveTemplateTemporalModel(TemporalModel):
         norm: The model integrated flux
         """
 
-        n1 = self._interpolator.antiderivative()(t_max.mjd)
-        n2 = self._interpolator.antiderivative()(t_min.mjd)
+        n1 = self._antiderivative(t_max.mjd)
+        n2 = self._antiderivative(t_min.mjd)
         return u.Quantity(n1 - n2, "day") / self.time_sum(t_min, t_max)
 
     def sample_time(self, n_events, t_min, t_max, t_delta="1 s", random_state=0):
         """Sample arrival times of events.
 
+        The times are drawn by inverting the cumulative integral of the
+        template, which is piecewise quadratic for the linearly interpolated
+        norm. The cost only depends on the number of template points and
+        sampled events, not on the length of the time intervals.
+
         Parameters
         ----------
         n_events : int
             Number of events to sample.
         t_min : `~astropy.time.Time`
-            Start time of the sampling.
+            Start time(s) of the sampling.
         t_max : `~astropy.time.Time`
-            Stop time of the sampling.
+            Stop time(s) of the sampling.
         t_delta : `~astropy.units.Quantity`
-            Time step used for sampling of the temporal model.
+            Not used, the template is sampled exactly. Kept for backwards
+            compatibility.
         random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
             Defines random number generator initialisation.
             Passed to `~gammapy.utils.random.get_random_state`.
 
         Returns
         -------
-        time : `~astropy.units.Quantity`
+        time : `~astropy.time.Time`
             Array with times of the sampled events.
         """
-        time_unit = getattr(u, self.table.meta["TIMEUNIT"])
-
-        t_min = Time(t_min)
-        t_max = Time(t_max)
-        t_delta = u.Quantity(t_delta)
+        t_min = Time(t_min).reshape(-1)
+        t_max = Time(t_max).reshape(-1)
         random_state = get_random_state(random_state)
 
-        ontime = u.Quantity((t_max - t_min).sec, "s")
-        t_stop = ontime.to_value(time_unit)
-
-        # TODO: the separate time unit handling is unfortunate, but the quantity support for np.arange and np.interp
-        #  is still incomplete, refactor once we change to recent numpy and astropy versions
-        t_step = t_delta.to_value(time_unit)
-        t = np.arange(0, t_stop, t_step)
-
-        pdf = self.evaluate(t)
-
-        sampler = InverseCDFSampler(pdf=pdf, random_state=random_state)
-        time_pix = sampler.sample(n_events)[0]
-        time = np.interp(time_pix, np.arange(len(t)), t) * time_unit
-
-        return t_min + time
+        x_min, x_max = t_min.mjd, t_max.mjd
+        x = np.unique(np.concatenate([self._time.value, x_min, x_max]))
+        cdf = self._antiderivative(x)
+
+        # pick the time interval according to its integrated norm and
+        # the target value of the cumulative integral within it
+        cdf_min = self._antiderivative(x_min)
+        weights = np.cumsum(self._antiderivative(x_max) - cdf_min)
+        choice = random_state.uniform(high=weights[-1], size=n_events)
+        idx = np.searchsorted(weights, choice, side="right")
+        idx = np.clip(idx, 0, len(weights) - 1)
+        offset = choice - np.where(idx > 0, weights[idx - 1], 0)
+
+        # invert the quadratic cumulative integral on the segment
+        target = cdf_min[idx] + offset
+        k = np.clip(np.searchsorted(cdf, target, side="right") - 1, 0, len(x) - 2)
+        norm_lo, norm_hi = self.evaluate(x[k]), self.evaluate(x[k + 1])
+        slope = (norm_hi - norm_lo) / (x[k + 1] - x[k])
+        delta = target - cdf[k]
+
+        root = np.sqrt(np.clip(norm_lo ** 2 + 2 * slope * delta, 0, None))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            dx = np.nan_to_num(2 * delta / (norm_lo + root))
+
+        time = np.clip(x[k] + dx, x_min[idx], x_max[idx])
+        return t_min[idx] + u.Quantity(time - x_min[idx], "day")
 
     @classmethod
     def from_dict(cls, data):
@@ -96,6 +96,21 @@ def test_select_region(models):
     assert model4.contributes(mask, margin=None, use_evaluation_region=True)
 
 
+def test_select_cone(models):
+    center_sky = SkyCoord(3, 4, unit="deg", frame="galactic")
+    selected = models.select_cone(center_sky, 1 * u.deg)
+    assert selected.names == ["source-1", "source-2"]
+
+    selected = models.select_cone(center_sky.icrs, 6 * u.deg)
+    assert selected.names == ["source-1", "source-2", "source-3"]
+
+    # the index is rebuilt when a model moves
+    models_copy = models.copy()
+    models_copy["source-2"].spatial_model.lon_0.value = 10
+    selected = models_copy.select_cone(center_sky, 1 * u.deg)
+    assert selected.names == ["source-1"]
+
+
 def test_select(models):
     conditions = [
         {"datasets_names": "dataset-1"},
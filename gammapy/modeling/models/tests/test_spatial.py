@@ -1,4 +1,5 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import gc
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
@@ -266,6 +267,43 @@ def test_sky_diffuse_map():
         model.plot_grid()
 
 
+@requires_data()
+def test_sky_diffuse_map_lazy():
+    filename = "$GAMMAPY_DATA/catalogs/fermi/Extended_archive_v18/Templates/RXJ1713_2016_250GeV.fits"
+    model = TemplateSpatialModel.read(filename, normalize=False, lazy=True)
+    assert model._map is None
+
+    lon = [258.5, 0] * u.deg
+    lat = -39.8 * u.deg
+    val = model(lon, lat)
+    assert_allclose(val.value, [3269.178107, 0])
+
+    other = TemplateSpatialModel.read(filename, normalize=False, lazy=True)
+    assert other.map is model.map
+
+    with pytest.raises(ValueError):
+        TemplateSpatialModel()
+
+
+def test_sky_diffuse_map_lazy_shared(tmp_path):
+    filename = str(tmp_path / "template.fits")
+    m = Map.create(npix=10, binsz=0.1, unit="sr-1")
+    m.data += 1
+    m.write(filename)
+
+    model = TemplateSpatialModel.read(filename, normalize=False, lazy=True)
+    other = TemplateSpatialModel.read(filename, normalize=False, lazy=True)
+    assert other.map is model.map
+
+    key = (filename, False)
+    assert key in TemplateSpatialModel._map_cache
+
+    # the shared map is released with the models
+    del model, other
+    gc.collect()
+    assert key not in TemplateSpatialModel._map_cache
+
+
 @requires_data()
 def test_sky_diffuse_map_3d():
     filename = "$GAMMAPY_DATA/fermi-3fhl-gc/gll_iem_v06_gc.fits.gz"
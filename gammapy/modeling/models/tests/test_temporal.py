@@ -78,7 +78,7 @@ def test_time_sampling(tmp_path):
 
     sampler = u.Quantity((sampler - Time(t_ref)).sec, "s")
     assert len(sampler) == 2
-    assert_allclose(sampler.value, [12661.65802564, 7826.92991], rtol=1e-5)
+    assert_allclose(sampler.value, [7298.235042, 11240.605297], rtol=1e-5)
 
     table = Table()
     table["TIME"] = time
@@ -92,7 +92,35 @@ def test_time_sampling(tmp_path):
     sampler_uniform = u.Quantity((sampler_uniform - Time(t_ref)).sec, "s")
 
     assert len(sampler_uniform) == 2
-    assert_allclose(sampler_uniform.value, [1261.65802564, 6026.9299098], rtol=1e-5)
+    assert_allclose(sampler_uniform.value, [15805.828913, 20597.453752], rtol=1e-5)
+
+
+def test_time_sampling_gti():
+    time = np.arange(0, 10, 0.06) * u.hour
+
+    table = Table()
+    table["TIME"] = time
+    table["NORM"] = rate(time)
+    table.meta = dict(MJDREFI=55197.0, MJDREFF=0, TIMEUNIT="hour")
+    temporal_model = LightCurveTemplateTemporalModel(table)
+
+    start = [1, 5] * u.hour
+    stop = [2, 8] * u.hour
+    gti = GTI.create(start, stop, reference_time=Time("2010-01-01T00:00:00"))
+
+    sampler = temporal_model.sample_time(
+        n_events=1000, t_min=gti.time_start, t_max=gti.time_stop, random_state=0
+    )
+    sampler = (sampler - Time("2010-01-01T00:00:00")).to_value("hour")
+
+    assert len(sampler) == 1000
+    in_gti = ((sampler >= 1) & (sampler <= 2)) | ((sampler >= 5) & (sampler <= 8))
+    assert np.all(in_gti)
+
+    # fraction of events in the first interval follows the integrated norm
+    val = temporal_model.integral(gti.time_start, gti.time_stop)
+    fraction = np.mean(sampler < 2)
+    assert_allclose(fraction, val[0] / np.sum(val), atol=0.03)
 
 
 def test_lightcurve_temporal_model_integral():
@@ -5,6 +5,7 @@ from numpy.testing import assert_allclose
 from astropy.table import Table
 from gammapy.datasets import Dataset
 from gammapy.modeling import Fit, Parameter
+from gammapy.modeling import fit as fit_module
 from gammapy.modeling.models import Model, Models
 from gammapy.utils.testing import requires_dependency
 
@@ -184,6 +185,9 @@ def test_stat_surface():
     assert_allclose(dataset.models.parameters["x"].value, 2)
     assert_allclose(dataset.models.parameters["y"].value, 3e2)
 
+    # Check that no reference to the fit is kept
+    assert fit_module._STAT_SURFACE_FIT is None
+
 
 def test_stat_surface_reoptimize():
     dataset = MyDataset()
@@ -211,6 +215,31 @@ def test_stat_surface_reoptimize():
     )
 
 
+def test_stat_surface_reoptimize_n_jobs():
+    dataset = MyDataset()
+    fit = Fit([dataset])
+    fit.run()
+
+    dataset.models.parameters["z"].value = 0
+    x_values = [1, 2, 3]
+    y_values = [2e2, 3e2, 4e2]
+    result = fit.stat_surface(
+        "x", "y", x_values=x_values, y_values=y_values, reoptimize=True, n_jobs=2
+    )
+
+    expected_stat = [
+        [1.0001e04, 1.0000e00, 1.0001e04],
+        [1.0000e04, 0.0000e00, 1.0000e04],
+        [1.0001e04, 1.0000e00, 1.0001e04],
+    ]
+
+    assert_allclose(list(result["stat_scan"]), expected_stat, atol=1e-7)
+    assert_allclose(
+        result["fit_results"][2][1].total_stat, result["stat_scan"][2][1], atol=1e-7
+    )
+    assert_allclose(dataset.models.parameters["z"].value, 0)
+
+
 def test_minos_contour():
     dataset = MyDataset()
     dataset.models.parameters["x"].frozen = True
@@ -1,13 +1,89 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import abc
 import numpy as np
-from scipy.optimize import brentq, newton
 from scipy.stats import chi2
-from .fit_statistics import cash, get_wstat_mu_bkg, wstat
+from .fit_statistics import cash, wstat
 
 __all__ = ["WStatCountsStatistic", "CashCountsStatistic"]
 
 
+def _root_bracketed(
+    func, lower, upper, xtol=2e-12, rtol=4 * np.finfo(float).eps, maxiter=200
+):
+    """Find roots of a function on many brackets at once.
+
+    Uses the Illinois variant of the regula falsi method, with a bisection step
+    whenever an iteration does not at least halve the bracket, so that the
+    convergence is guaranteed also for discontinuous functions.
+
+    Parameters
+    ----------
+    func : callable
+        Function ``func(x, index)``, evaluated on the elements ``index`` of
+        the flattened brackets.
+    lower, upper : `~numpy.ndarray`
+        Lower and upper bounds of the brackets.
+    xtol, rtol : float
+        Absolute and relative tolerance on the root.
+    maxiter : int
+        Maximum number of iterations.
+
+    Returns
+    -------
+    roots : `~numpy.ndarray`
+        Roots, with the flattened shape of the brackets. NaN where the function
+        does not change sign within the bracket.
+    """
+    a, b = np.broadcast_arrays(lower, upper)
+    a, b = a.astype(float).ravel(), b.astype(float).ravel()
+    index = np.arange(a.size)
+
+    fa, fb = func(a, index), func(b, index)
+    roots = np.full(a.size, np.nan)
+    roots[fa == 0] = a[fa == 0]
+    roots[fb == 0] = b[fb == 0]
+
+    active = np.sign(fa) * np.sign(fb) < 0
+    a, b, fa, fb, index = a[active], b[active], fa[active], fb[active], index[active]
+    side = np.zeros(a.size, dtype=int)
+    bisect = np.zeros(a.size, dtype=bool)
+
+    for _ in range(maxiter):
+        if index.size == 0:
+            break
+
+        width = np.abs(b - a)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            x = (a * fb - b * fa) / (fb - fa)
+
+        invalid = ~np.isfinite(x) | (x <= np.minimum(a, b)) | (x >= np.maximum(a, b))
+        bisect |= invalid
+        x = np.where(bisect, 0.5 * (a + b), x)
+        fx = func(x, index)
+
+        # replace the bound with the same sign, and apply the Illinois
+        # correction if the same bound was replaced in the last step
+        is_lower = np.sign(fx) == np.sign(fa)
+        fb = np.where(is_lower & (side == 1), 0.5 * fb, fb)
+        fa = np.where(~is_lower & (side == -1), 0.5 * fa, fa)
+        a, fa = np.where(is_lower, x, a), np.where(is_lower, fx, fa)
+        b, fb = np.where(is_lower, b, x), np.where(is_lower, fb, fx)
+        side = np.where(is_lower, 1, -1)
+
+        bisect = ~bisect & (np.abs(b - a) > 0.5 * width)
+
+        converged = (fx == 0) | (np.abs(b - a) < xtol + rtol * np.abs(x))
+        roots[index[converged]] = x[converged]
+
+        keep = ~converged
+        a, b, fa, fb = a[keep], b[keep], fa[keep], fb[keep]
+        index, side, bisect = index[keep], side[keep], bisect[keep]
+
+    roots[index] = 0.5 * (a + b)
+    return roots
+
+
 class CountsStatistic(abc.ABC):
     @property
     def ts(self):
@@ -35,25 +111,22 @@ class CountsStatistic(abc.ABC):
         ----------
         n_sigma : float
             Confidence level of the uncertainty expressed in number of sigma. Default is 1.
+
+        Returns
+        -------
+        errn : `numpy.ndarray`
+            Downward excess uncertainties. Where the root is not bracketed,
+            i.e. the statistic does not rise by n_sigma**2 down to the lower
+            search bound, ``-n_on`` is returned.
         """
-        errn = np.zeros_like(self.n_on, dtype="float")
         min_range = self.n_sig - 2 * n_sigma * (self.error + 1)
+        stat_ref = (self.stat_max + n_sigma ** 2).ravel()
+
+        roots = _root_bracketed(self._stat_fcn_ref(stat_ref), min_range, self.n_sig)
+        roots = roots.reshape(self.n_on.shape)
 
-        it = np.nditer(errn, flags=["multi_index"])
-        while not it.finished:
-            try:
-                res = brentq(
-                    self._stat_fcn,
-                    min_range[it.multi_index],
-                    self.n_sig[it.multi_index],
-                    args=(self.stat_max[it.multi_index] + n_sigma ** 2, it.multi_index),
-                )
-                errn[it.multi_index] = res - self.n_sig[it.multi_index]
-            except ValueError:
-                errn[it.multi_index] = -self.n_on[it.multi_index]
-            it.iternext()
-
-        return errn
+        errn = roots - self.n_sig
+        return np.where(np.isnan(roots), -self.n_on, errn)
 
     def compute_errp(self, n_sigma=1):
         """Compute upward excess uncertainties.
@@ -64,21 +137,18 @@ class CountsStatistic(abc.ABC):
         ----------
         n_sigma : float
             Confidence level of the uncertainty expressed in number of sigma. Default is 1.
+
+        Returns
+        -------
+        errp : `numpy.ndarray`
+            Upward excess uncertainties. NaN where the root is not bracketed,
+            i.e. the statistic does not rise by n_sigma**2 within the search range.
         """
-        errp = np.zeros_like(self.n_on, dtype="float")
         max_range = self.n_sig + 2 * n_sigma * (self.error + 1)
+        stat_ref = (self.stat_max + n_sigma ** 2).ravel()
 
-        it = np.nditer(errp, flags=["multi_index"])
-        while not it.finished:
-            errp[it.multi_index] = brentq(
-                self._stat_fcn,
-                self.n_sig[it.multi_index],
-                max_range[it.multi_index],
-                args=(self.stat_max[it.multi_index] + n_sigma ** 2, it.multi_index),
-            )
-            it.iternext()
-
-        return errp - self.n_sig
+        roots = _root_bracketed(self._stat_fcn_ref(stat_ref), self.n_sig, max_range)
+        return roots.reshape(self.n_on.shape) - self.n_sig
 
     def compute_upper_limit(self, n_sigma=3):
         """Compute upper limit on the signal.
@@ -90,25 +160,29 @@ class CountsStatistic(abc.ABC):
         ----------
         n_sigma : float
             Confidence level of the upper limit expressed in number of sigma. Default is 3.
-        """
-        ul = np.zeros_like(self.n_on, dtype="float")
 
+        Returns
+        -------
+        ul : `numpy.ndarray`
+            Upper limits on the signal. NaN where the root is not bracketed,
+            i.e. the statistic does not rise by n_sigma**2 within the search range.
+        """
         min_range = np.maximum(0, self.n_sig)
         max_range = min_range + 2 * n_sigma * (self.error + 1)
-        it = np.nditer(ul, flags=["multi_index"])
 
-        while not it.finished:
-            TS_ref = self._stat_fcn(min_range[it.multi_index], 0.0, it.multi_index)
+        index = np.arange(self.n_on.size)
+        stat_ref = self._stat_fcn(min_range.ravel(), 0.0, index) + n_sigma ** 2
 
-            ul[it.multi_index] = brentq(
-                self._stat_fcn,
-                min_range[it.multi_index],
-                max_range[it.multi_index],
-                args=(TS_ref + n_sigma ** 2, it.multi_index),
-            )
-            it.iternext()
+        roots = _root_bracketed(self._stat_fcn_ref(stat_ref), min_range, max_range)
+        return roots.reshape(self.n_on.shape)
+
+    def _stat_fcn_ref(self, stat_ref):
+        """Stat function relative to a reference stat value per element"""
 
-        return ul
+        def fcn(mu, index):
+            return self._stat_fcn(mu, stat_ref[index], index)
+
+        return fcn
 
     def n_sig_matching_significance(self, significance):
         """Compute excess matching a given significance.
@@ -123,23 +197,30 @@ class CountsStatistic(abc.ABC):
         Returns
         -------
         n_sig : `numpy.ndarray`
-            Excess
+            Excess. NaN where the root is not bracketed, i.e. the given
+            significance cannot be reached within the search range.
         """
-        n_sig = np.zeros_like(self.n_bkg, dtype="float")
-        it = np.nditer(n_sig, flags=["multi_index"])
-
-        while not it.finished:
-            try:
-                n_sig[it.multi_index] = newton(
-                    self._n_sig_matching_significance_fcn,
-                    np.sqrt(self.n_bkg[it.multi_index]) * significance,
-                    args=(significance, it.multi_index),
-                )
-            except:
-                n_sig[it.multi_index] = np.nan
+        n_bkg = self.n_bkg.astype(float).ravel()
+        index = np.arange(n_bkg.size)
+
+        def fcn(n_sig, idx):
+            return self._n_sig_matching_significance_fcn(n_sig, significance, idx)
+
+        if significance >= 0:
+            lower = np.zeros_like(n_bkg)
+            upper = np.sqrt(n_bkg) * significance + significance ** 2 + 1
+
+            # expand the upper bound until the root is bracketed
+            for _ in range(50):
+                expand = fcn(upper, index) <= 0
+                if not expand.any():
+                    break
+                upper[expand] *= 2
+        else:
+            lower, upper = -n_bkg, np.zeros_like(n_bkg)
 
-            it.iternext()
-        return n_sig
+        n_sig = _root_bracketed(fcn, lower, upper)
+        return n_sig.reshape(self.n_bkg.shape)
 
 
 class CashCountsStatistic(CountsStatistic):
@@ -155,8 +236,7 @@ class CashCountsStatistic(CountsStatistic):
     """
 
     def __init__(self, n_on, mu_bkg):
-        self.n_on = np.asanyarray(n_on)
-        self.mu_bkg = np.asanyarray(mu_bkg)
+        self.n_on, self.mu_bkg = np.broadcast_arrays(n_on, mu_bkg)
 
     @property
     def n_bkg(self):
@@ -184,11 +264,13 @@ class CashCountsStatistic(CountsStatistic):
         return cash(self.n_on, self.n_on)
 
     def _stat_fcn(self, mu, delta=0, index=None):
-        return cash(self.n_on[index], self.mu_bkg[index] + mu) - delta
+        n_on, mu_bkg = self.n_on.flat[index], self.mu_bkg.flat[index]
+        return cash(n_on, mu_bkg + mu) - delta
 
     def _n_sig_matching_significance_fcn(self, n_sig, significance, index):
-        TS0 = cash(n_sig + self.mu_bkg[index], self.mu_bkg[index])
-        TS1 = cash(n_sig + self.mu_bkg[index], self.mu_bkg[index] + n_sig)
+        mu_bkg = self.mu_bkg.flat[index]
+        TS0 = cash(n_sig + mu_bkg, mu_bkg)
+        TS1 = cash(n_sig + mu_bkg, mu_bkg + n_sig)
         return np.sign(n_sig) * np.sqrt(np.clip(TS0 - TS1, 0, None)) - significance
 
 
@@ -209,13 +291,12 @@ class WStatCountsStatistic(CountsStatistic):
     """
 
     def __init__(self, n_on, n_off, alpha, mu_sig=None):
-        self.n_on = np.asanyarray(n_on)
-        self.n_off = np.asanyarray(n_off)
-        self.alpha = np.asanyarray(alpha)
         if mu_sig is None:
-            self.mu_sig = np.zeros_like(self.n_on)
-        else:
-            self.mu_sig = np.asanyarray(mu_sig)
+            mu_sig = np.zeros_like(n_on)
+
+        self.n_on, self.n_off, self.alpha, self.mu_sig = np.broadcast_arrays(
+            n_on, n_off, alpha, mu_sig
+        )
 
     @property
     def n_bkg(self):
@@ -245,19 +326,20 @@ class WStatCountsStatistic(CountsStatistic):
     def _stat_fcn(self, mu, delta=0, index=None):
         return (
             wstat(
-                self.n_on[index],
-                self.n_off[index],
-                self.alpha[index],
-                (mu + self.mu_sig[index]),
+                self.n_on.flat[index],
+                self.n_off.flat[index],
+                self.alpha.flat[index],
+                (mu + self.mu_sig.flat[index]),
             )
             - delta
         )
 
     def _n_sig_matching_significance_fcn(self, n_sig, significance, index):
-        stat0 = wstat(
-            n_sig + self.n_bkg[index], self.n_off[index], self.alpha[index], 0
-        )
-        stat1 = wstat(
-            n_sig + self.n_bkg[index], self.n_off[index], self.alpha[index], n_sig,
+        n_bkg, n_off, alpha = (
+            self.n_bkg.flat[index],
+            self.n_off.flat[index],
+            self.alpha.flat[index],
         )
+        stat0 = wstat(n_sig + n_bkg, n_off, alpha, 0)
+        stat1 = wstat(n_sig + n_bkg, n_off, alpha, n_sig)
         return np.sign(n_sig) * np.sqrt(np.clip(stat0 - stat1, 0, None)) - significance
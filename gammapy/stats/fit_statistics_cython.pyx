@@ -3,6 +3,9 @@
 import numpy as np
 cimport numpy as np
 cimport cython
+from libc.float cimport DBL_MAX
+from libc.math cimport isinf, isnan, sqrt
+from libc.math cimport log as dlog
 
 cdef extern from "math.h":
     float log(float x)
@@ -11,7 +14,8 @@ cdef extern from "math.h":
 @cython.cdivision(True)
 @cython.boundscheck(False)
 def cash_sum_cython(np.ndarray[np.float_t, ndim=1] counts,
-                    np.ndarray[np.float_t, ndim=1] npred):
+                    np.ndarray[np.float_t, ndim=1] npred,
+                    np.ndarray[np.uint8_t, ndim=1, cast=True] mask=None):
     """Summed cash fit statistics.
 
     Parameters
@@ -20,11 +24,16 @@ def cash_sum_cython(np.ndarray[np.float_t, ndim=1] counts,
         Counts array.
     npred : `~numpy.ndarray`
         Predicted counts array.
+    mask : `~numpy.ndarray`
+        Boolean mask, only bins where the mask is True are summed.
     """
     cdef np.float_t sum = 0
     cdef unsigned int i, ni
+    cdef bint use_mask = mask is not None
     ni = counts.shape[0]
     for i in range(ni):
+        if use_mask and not mask[i]:
+            continue
         if npred[i] > 0:
             sum += npred[i]
             if counts[i] > 0:
@@ -32,6 +41,106 @@ def cash_sum_cython(np.ndarray[np.float_t, ndim=1] counts,
     return 2 * sum
 
 
+@cython.cdivision(True)
+@cython.boundscheck(False)
+def cstat_sum_cython(np.ndarray[np.float_t, ndim=1] counts,
+                     np.ndarray[np.float_t, ndim=1] npred,
+                     np.ndarray[np.uint8_t, ndim=1, cast=True] mask=None,
+                     np.float_t n_on_min=1e-25):
+    """Summed C fit statistics.
+
+    Equivalent to ``cstat(counts, npred, n_on_min)[mask].sum()``,
+    without temporary arrays.
+
+    Parameters
+    ----------
+    counts : `~numpy.ndarray`
+        Counts array.
+    npred : `~numpy.ndarray`
+        Predicted counts array.
+    mask : `~numpy.ndarray`
+        Boolean mask, only bins where the mask is True are summed.
+    n_on_min : float
+        Counts are set to ``n_on_min`` where they are smaller.
+    """
+    cdef np.float_t sum = 0, n_on
+    cdef unsigned int i, ni
+    cdef bint use_mask = mask is not None
+    ni = counts.shape[0]
+    for i in range(ni):
+        if use_mask and not mask[i]:
+            continue
+        if npred[i] > 0:
+            n_on = counts[i] if counts[i] > n_on_min else n_on_min
+            sum += npred[i] - n_on + n_on * (dlog(n_on) - dlog(npred[i]))
+    return 2 * sum
+
+
+@cython.cdivision(True)
+@cython.boundscheck(False)
+def wstat_sum_cython(np.ndarray[np.float_t, ndim=1] n_on,
+                     np.ndarray[np.float_t, ndim=1] n_off,
+                     np.ndarray[np.float_t, ndim=1] alpha,
+                     np.ndarray[np.float_t, ndim=1] mu_sig,
+                     np.ndarray[np.uint8_t, ndim=1, cast=True] mask=None,
+                     bint extra_terms=True):
+    """Summed W fit statistics, with the profiled background.
+
+    Equivalent to ``np.nan_to_num(wstat(n_on, n_off, alpha, mu_sig))[mask].sum()``,
+    without temporary arrays.
+
+    Parameters
+    ----------
+    n_on : `~numpy.ndarray`
+        Total observed counts
+    n_off : `~numpy.ndarray`
+        Total observed background counts
+    alpha : `~numpy.ndarray`
+        Exposure ratio between on and off region
+    mu_sig : `~numpy.ndarray`
+        Signal expected counts
+    mask : `~numpy.ndarray`
+        Boolean mask, only bins where the mask is True are summed.
+    extra_terms : bool
+        Add model independent terms to convert stat into goodness-of-fit
+        parameter.
+    """
+    cdef np.float_t sum = 0, stat, a, c, d, mu_bkg
+    cdef unsigned int i, ni
+    cdef bint use_mask = mask is not None
+    ni = n_on.shape[0]
+    for i in range(ni):
+        if use_mask and not mask[i]:
+            continue
+
+        a = alpha[i]
+        c = a * (n_on[i] + n_off[i]) - (1 + a) * mu_sig[i]
+        d = sqrt(c * c + 4 * a * (a + 1) * n_off[i] * mu_sig[i])
+        mu_bkg = (c + d) / (2 * a * (a + 1))
+
+        stat = mu_sig[i] + (1 + a) * mu_bkg
+        if n_on[i] != 0:
+            stat -= n_on[i] * dlog(mu_sig[i] + a * mu_bkg)
+        if n_off[i] != 0:
+            stat -= n_off[i] * dlog(mu_bkg)
+
+        if extra_terms:
+            if n_on[i] != 0:
+                stat -= n_on[i] * (1 - dlog(n_on[i]))
+            if n_off[i] != 0:
+                stat -= n_off[i] * (1 - dlog(n_off[i]))
+
+        stat = 2 * stat
+
+        if isnan(stat):
+            continue
+        elif isinf(stat):
+            stat = DBL_MAX if stat > 0 else -DBL_MAX
+
+        sum += stat
+    return sum
+
+
 @cython.cdivision(True)
 @cython.boundscheck(False)
 def f_cash_root_cython(np.float_t x, np.ndarray[np.float_t, ndim=1] counts,
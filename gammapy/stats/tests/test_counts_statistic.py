@@ -188,3 +188,19 @@ def test_wstat_excess_matching_significance(n_off, alpha, significance, result):
     excess = stat.n_sig_matching_significance(significance)
 
     assert_allclose(excess, result, rtol=1e-2)
+
+
+def test_wstat_errors_ul_array():
+    n_on = np.array([[1, 5], [10, 10]])
+    n_off = np.array([[2, 1], [5, 23]])
+    alpha = np.array([[1, 1], [0.3, 0.1]])
+    stat = WStatCountsStatistic(n_on, n_off, alpha)
+
+    errn = stat.compute_errn()
+    errp = stat.compute_errp()
+    ul = stat.compute_upper_limit()
+
+    assert errn.shape == (2, 2)
+    assert_allclose(errn, [[-1.942465, -2.310459], [-2.932472, -2.884366]], atol=1e-5)
+    assert_allclose(errp, [[1.762589, 2.718807], [3.55926, 3.533279]], atol=1e-5)
+    assert_allclose(ul, [[6.272627, 14.222831], [21.309229, 20.45803]], rtol=1e-5)
@@ -118,6 +118,62 @@ def test_cash_sum_cython(test_data):
     assert_allclose(stat, ref)
 
 
+def test_cash_sum_cython_mask(test_data):
+    counts = np.array(test_data["n_on"], dtype=float)
+    npred = np.array(test_data["mu_sig"], dtype=float)
+    mask = counts > 4
+    stat = stats.cash_sum_cython(counts=counts, npred=npred, mask=mask)
+    ref = stats.cash(counts, npred)[mask].sum()
+    assert_allclose(stat, ref)
+
+
+def test_cstat_sum_cython(test_data):
+    counts = np.array(test_data["n_on"], dtype=float)
+    npred = np.array(test_data["mu_sig"], dtype=float)
+    mask = counts > 4
+
+    stat = stats.cstat_sum_cython(counts=counts, npred=npred)
+    assert_allclose(stat, stats.cstat(counts, npred).sum())
+
+    stat = stats.cstat_sum_cython(counts=counts, npred=npred, mask=mask)
+    assert_allclose(stat, stats.cstat(counts, npred)[mask].sum())
+
+
+@pytest.mark.parametrize("extra_terms", [True, False])
+def test_wstat_sum_cython(test_data, extra_terms):
+    data = {key: np.array(test_data[key], dtype=float) for key in test_data}
+    data["alpha"][2] = 0
+    mask = data["n_on"] > 4
+
+    ref = stats.wstat(
+        n_on=data["n_on"],
+        n_off=data["n_off"],
+        alpha=data["alpha"],
+        mu_sig=data["mu_sig"],
+        extra_terms=extra_terms,
+    )
+    ref = np.nan_to_num(ref)
+
+    stat = stats.wstat_sum_cython(
+        n_on=data["n_on"],
+        n_off=data["n_off"],
+        alpha=data["alpha"],
+        mu_sig=data["mu_sig"],
+        extra_terms=extra_terms,
+    )
+    assert_allclose(stat, ref.sum())
+
+    stat = stats.wstat_sum_cython(
+        n_on=data["n_on"],
+        n_off=data["n_off"],
+        alpha=data["alpha"],
+        mu_sig=data["mu_sig"],
+        mask=mask,
+        extra_terms=extra_terms,
+    )
+    assert_allclose(stat, ref[mask].sum())
+
+
 def test_wstat_corner_cases():
     """test WSTAT formulae for corner cases"""
     n_on = 0
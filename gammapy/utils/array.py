@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Utility functions to deal with arrays and quantities."""
 import numpy as np
+import scipy.fftpack
 import scipy.ndimage
 import scipy.signal
 from astropy.convolution import Gaussian2DKernel
@@ -126,6 +127,59 @@ def _fftconvolve_wrap(kernel, data):
         )
 
 
+def iter_scale_space(data, kernels):
+    """Iterate over the scale space of a set of images.
+
+    Every input image is Fourier transformed once, on a grid large enough
+    to hold the linear convolution with the largest kernel. The spectrum of
+    every kernel is computed once and shared by all the input images, and
+    the convolved images are returned one kernel after the other, so that
+    the scale space can be reduced without storing the full cubes. Gaussian
+    kernels are applied with `~scipy.ndimage.gaussian_filter`, as in
+    `scale_cube`.
+
+    Parameters
+    ----------
+    data : dict of `~numpy.ndarray`
+        Input images, all with the same shape.
+    kernels: list of `~astropy.convolution.Kernel`
+        List of convolution kernels.
+
+    Yields
+    ------
+    images : dict of `~numpy.ndarray`
+        Images convolved with the current kernel, with the same keys as
+        ``data``.
+    """
+    shape = np.array(next(iter(data.values())).shape)
+    kernel_shape = np.max([kernel.shape for kernel in kernels], axis=0)
+    fshape = [scipy.fftpack.next_fast_len(int(_)) for _ in shape + kernel_shape - 1]
+
+    spectra = None
+
+    for kernel in kernels:
+        if isinstance(kernel, Gaussian2DKernel):
+            yield {key: _fftconvolve_wrap(kernel, value) for key, value in data.items()}
+            continue
+
+        if spectra is None:
+            spectra = {}
+            for key, value in data.items():
+                spectra[key] = np.fft.rfft2(value.astype(float), fshape)
+
+        kernel_spectrum = np.fft.rfft2(kernel.array, fshape)
+
+        # same output size and centering as `scipy.signal.fftconvolve`
+        start = (np.array(kernel.shape) - 1) // 2
+        slices = tuple(slice(idx, idx + size) for idx, size in zip(start, shape))
+
+        images = {}
+        for key, spectrum in spectra.items():
+            images[key] = np.fft.irfft2(spectrum * kernel_spectrum, fshape)[slices]
+
+        yield images
+
+
 def scale_cube(data, kernels):
     """
     Compute scale space cube.
@@ -145,4 +199,5 @@ def scale_cube(data, kernels):
     cube : `~numpy.ndarray`
         Array of the shape (len(kernels), data.shape)
     """
-    return np.dstack(list([_fftconvolve_wrap(kernel, data) for kernel in kernels]))
+    images = iter_scale_space({"data": data}, kernels)
+    return np.dstack([_["data"] for _ in images])
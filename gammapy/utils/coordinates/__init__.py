@@ -1,4 +1,5 @@
 """Astronomical coordinate calculation utility functions.
 """
 from .fov import *
+from .index import *
 from .other import *
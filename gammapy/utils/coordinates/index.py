@@ -0,0 +1,118 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Spatial index for sky positions"""
+import numpy as np
+from astropy import units as u
+from astropy.coordinates import Angle, SkyCoord
+
+__all__ = ["SkyCoordIndex"]
+
+
+class SkyCoordIndex:
+    """Spatial index over a set of sky positions.
+
+    The positions are converted to unit vectors and stored in a KD-tree,
+    so that cone and region queries only need to look at the positions
+    close to the query region, instead of computing the separation to
+    all positions.
+
+    Parameters
+    ----------
+    skycoord : `~astropy.coordinates.SkyCoord`
+        Indexed sky positions.
+    """
+
+    def __init__(self, skycoord):
+        from scipy.spatial import cKDTree
+
+        self.skycoord = SkyCoord(skycoord).reshape(-1)
+        self._tree = cKDTree(self._to_unit_vector(self.skycoord))
+
+    def __len__(self):
+        return len(self.skycoord)
+
+    @staticmethod
+    def _to_unit_vector(skycoord):
+        # the KD-tree works in a fixed frame, the chord distance
+        # does not depend on it
+        return skycoord.icrs.cartesian.xyz.value.reshape(3, -1).T
+
+    def query_cone(self, position, radius):
+        """Indices of the positions within a cone.
+
+        Parameters
+        ----------
+        position : `~astropy.coordinates.SkyCoord`
+            Center position of the cone.
+        radius : `~astropy.coordinates.Angle`
+            Radius of the cone.
+
+        Returns
+        -------
+        idx : `~numpy.ndarray`
+            Sorted indices of the positions within the cone.
+        """
+        radius = Angle(radius, "deg")
+
+        if len(self) == 0:
+            return np.array([], dtype=int)
+
+        # the chord length is monotonic in the angular distance, add a tiny
+        # margin to be robust against round-off on the boundary
+        angle = np.clip(radius.to_value("rad"), 0, np.pi)
+        chord = 2 * np.sin(angle / 2) * (1 + 1e-12) + 1e-15
+
+        vec = self._to_unit_vector(position)[0]
+        idx = np.array(self._tree.query_ball_point(vec, chord), dtype=int)
+
+        if len(idx):
+            separation = self.skycoord[idx].separation(position)
+            idx = idx[separation <= radius]
+
+        return np.sort(idx)
+
+    def query_region(self, region):
+        """Indices of the positions within a sky region.
+
+        The positions are first pre-selected with a cone enclosing the
+        bounding box of the region, the exact containment is only tested
+        for these.
+
+        Parameters
+        ----------
+        region : `~regions.SkyRegion`
+            Sky region.
+
+        Returns
+        -------
+        idx : `~numpy.ndarray`
+            Sorted indices of the positions within the region.
+        """
+        from gammapy.maps import RegionGeom
+
+        geom = RegionGeom(region)
+        center, radius = self._get_bounding_cone(geom)
+        idx = self.query_cone(center, radius)
+
+        if len(idx):
+            idx = idx[geom.contains(self.skycoord[idx])]
+
+        return idx
+
+    @staticmethod
+    def _get_bounding_cone(geom):
+        """Center and radius of a cone enclosing the bounding box of a region"""
+        from gammapy.utils.regions import compound_region_to_list
+
+        regions = compound_region_to_list(geom.region)
+        bbox = regions[0].to_pixel(geom.wcs).bounding_box
+
+        for region in regions[1:]:
+            bbox = bbox.union(region.to_pixel(geom.wcs).bounding_box)
+
+        xp = np.array([bbox.ixmin, bbox.ixmax, bbox.ixmin, bbox.ixmax]) - 0.5
+        yp = np.array([bbox.iymin, bbox.iymin, bbox.iymax, bbox.iymax]) - 0.5
+        corners = SkyCoord.from_pixel(xp=xp, yp=yp, wcs=geom.wcs)
+
+        center = geom.center_skydir
+        radius = np.max(center.separation(corners)) + geom.binsz * u.deg
+        return center, radius
@@ -0,0 +1,32 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import numpy as np
+from numpy.testing import assert_equal
+from astropy import units as u
+from astropy.coordinates import SkyCoord
+from gammapy.utils.coordinates import SkyCoordIndex
+
+
+def test_sky_coord_index_query_cone():
+    rng = np.random.RandomState(0)
+    lon = rng.uniform(0, 360, 1000)
+    lat = np.rad2deg(np.arcsin(rng.uniform(-1, 1, 1000)))
+    positions = SkyCoord(lon, lat, unit="deg", frame="icrs")
+
+    index = SkyCoordIndex(positions)
+    assert len(index) == 1000
+
+    center = SkyCoord(10, 20, unit="deg", frame="galactic")
+
+    for radius in [0 * u.deg, 5 * u.deg, 30 * u.deg, 200 * u.deg]:
+        idx = index.query_cone(center, radius)
+        expected = np.nonzero(positions.separation(center) <= radius)[0]
+        assert_equal(idx, expected)
+
+    idx = index.query_cone(positions[42], 0 * u.deg)
+    assert_equal(idx, [42])
+
+
+def test_sky_coord_index_empty():
+    index = SkyCoordIndex(SkyCoord([], [], unit="deg"))
+    idx = index.query_cone(SkyCoord(0, 0, unit="deg"), 10 * u.deg)
+    assert len(idx) == 0
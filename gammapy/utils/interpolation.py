@@ -104,10 +104,19 @@ class ScaledRegularGridInterpolator:
         )
 
         if self.axis is None:
-            points = np.broadcast_arrays(*points)
-            points_interp = np.stack([_.flat for _ in points]).T
-            values = self._interpolate(points_interp, method, **kwargs)
-            values = self.scale.inverse(values.reshape(points[0].shape))
+            separable = None
+
+            if not kwargs and method in [None, "linear", "nearest"]:
+                separable = self._get_separable_dims(points)
+
+            if separable is not None:
+                values = self._interpolate_separable(points, *separable, method)
+                values = self.scale.inverse(values)
+            else:
+                points = np.broadcast_arrays(*points)
+                points_interp = np.stack([_.flat for _ in points]).T
+                values = self._interpolate(points_interp, method, **kwargs)
+                values = self.scale.inverse(values.reshape(points[0].shape))
         else:
             values = self._interpolate(points[0])
             values = self.scale.inverse(values)
@@ -117,6 +126,88 @@ class ScaledRegularGridInterpolator:
 
         return values
 
+    def _get_separable_dims(self, points):
+        """Check whether the points form an outer product grid.
+
+        This is the case if each coordinate array varies along a set of
+        dimensions, which is disjoint from the ones of all other arrays,
+        e.g. ``(energy[:, None, None], offset[None, :, :])``.
+
+        Returns
+        -------
+        separable : tuple or None
+            Varying dimensions per coordinate array and broadcast shape,
+            None if the points are not separable.
+        """
+        if self._interpolate.bounds_error or len(points) == 0:
+            return None
+
+        points = [np.asarray(p) for p in points]
+        shape = np.broadcast(*points).shape
+
+        if len(shape) == 0 or np.prod(shape) == 0:
+            return None
+
+        dims, used = [], set()
+
+        for p in points:
+            shape_p = (1,) * (len(shape) - p.ndim) + p.shape
+            dims_p = tuple([idx for idx, n in enumerate(shape_p) if n > 1])
+
+            if used.intersection(dims_p):
+                return None
+
+            used.update(dims_p)
+            dims.append(dims_p)
+
+        return dims, shape
+
+    def _interpolate_separable(self, points, dims, shape, method):
+        """Interpolate on an outer product grid, axis by axis.
+
+        This avoids to broadcast the coordinates to the full shape and to
+        evaluate the interpolator on the full ``(N, ndim)`` array of points.
+        The result is identical to the one of `RegularGridInterpolator`.
+        """
+        interp = self._interpolate
+        method = interp.method if method is None else method
+
+        values, pos = interp.values, 0
+        is_nan = is_out = np.zeros((1,) * len(shape), dtype=bool)
+
+        for p, dims_p, grid in zip(points, dims, interp.grid):
+            shape_p = (1,) * (len(shape) - np.ndim(p)) + np.shape(p)
+            x = np.reshape(p, [shape_p[idx] for idx in dims_p])
+
+            idx = np.searchsorted(grid, x) - 1
+            idx = np.clip(idx, 0, len(grid) - 2)
+            weight = (x - grid[idx]) / (grid[idx + 1] - grid[idx])
+
+            if method == "nearest":
+                idx = np.where(weight <= 0.5, idx, idx + 1)
+                values = np.take(values, idx, axis=pos)
+            else:
+                lo = np.take(values, idx, axis=pos)
+                hi = np.take(values, idx + 1, axis=pos)
+                weight = weight.reshape(weight.shape + (1,) * (lo.ndim - pos - x.ndim))
+                values = (1 - weight) * lo + weight * hi
+
+            is_nan = is_nan | np.reshape(np.isnan(x), shape_p)
+            is_out = is_out | np.reshape((x < grid[0]) | (x > grid[-1]), shape_p)
+            pos += len(dims_p)
+
+        # move the axes of the result to the order of the broadcast shape
+        order = np.argsort(np.concatenate([np.array(_, dtype=int) for _ in dims]))
+        values = np.transpose(values, order).reshape(shape)
+
+        if interp.fill_value is not None and is_out.any():
+            values = np.where(is_out, interp.fill_value, values)
+
+        if is_nan.any():
+            values = np.where(is_nan, np.nan, values)
+
+        return values
+
 
 def interpolation_scale(scale="lin"):
     """Interpolation scaling.
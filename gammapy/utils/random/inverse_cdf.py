@@ -11,6 +11,10 @@ class InverseCDFSampler:
     It determines a set of random numbers and calculate the cumulative
     distribution function.
 
+    The lookup tables are computed once on construction, so the same sampler
+    instance can be re-used to draw many realisations from the same PDF,
+    passing a different ``random_state`` to `~InverseCDFSampler.sample`.
+
     Parameters
     ----------
     pdf : `~gammapy.maps.Map`
@@ -20,69 +24,183 @@ class InverseCDFSampler:
     random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
         Defines random number generator initialisation.
         Passed to `~gammapy.utils.random.get_random_state`.
+    method : {"cdf", "alias"}
+        Sampling method used when ``axis=None``. With "cdf" the samples are
+        drawn by binary search in the sorted cumulative distribution, with
+        "alias" the Walker / Vose alias table is used, which allows to draw
+        samples in constant time per sample, independent of the pdf size.
     """
 
-    def __init__(self, pdf, axis=None, random_state=0):
+    def __init__(self, pdf, axis=None, random_state=0, method="cdf"):
         self.random_state = get_random_state(random_state)
         self.axis = axis
 
+        if method not in ["cdf", "alias"]:
+            raise ValueError(f"Not a valid sampling method: '{method}'")
+
+        self.method = method
+
         if axis is not None:
+            if method == "alias":
+                raise ValueError("Alias method not supported for sampling along axis")
+
             self.cdf = np.cumsum(pdf, axis=self.axis)
             self.cdf /= self.cdf[:, [-1]]
         else:
             self.pdf_shape = pdf.shape
 
             pdf = pdf.ravel() / pdf.sum()
-            self.sortindex = np.argsort(pdf, axis=None)
 
-            self.pdf = pdf[self.sortindex]
-            self.cdf = np.cumsum(self.pdf)
+            if method == "alias":
+                self.alias_prob, self.alias_index = self._make_alias_table(pdf)
+            else:
+                self.sortindex = np.argsort(pdf, axis=None)
+
+                self.pdf = pdf[self.sortindex]
+                self.cdf = np.cumsum(self.pdf)
+
+    @staticmethod
+    def _make_alias_table(pdf):
+        """Compute alias table for a normalised, flat pdf.
+
+        This is a vectorised version of Vose's algorithm: the deficits of the
+        bins with probability below the mean are laid out on a cumulative
+        tape and assigned to the bins with an excess, which in turn are
+        aliased to the next excess bin once their own excess is exhausted.
+
+        Parameters
+        ----------
+        pdf : `~numpy.ndarray`
+            Normalised, flat pdf.
+
+        Returns
+        -------
+        prob, alias : `~numpy.ndarray`
+            Acceptance probability and alias index per bin.
+        """
+        prob = pdf * pdf.size
+        alias = np.arange(pdf.size)
+
+        is_small = prob < 1
+        idx_small, idx_large = np.nonzero(is_small)[0], np.nonzero(~is_small)[0]
+
+        if len(idx_small) == 0 or len(idx_large) == 0:
+            return np.ones(pdf.size), alias
+
+        deficit_end = np.cumsum(1 - prob[idx_small])
+        deficit_start = deficit_end - (1 - prob[idx_small])
+        excess_end = np.cumsum(prob[idx_large] - 1)
 
-    def sample_axis(self):
+        # each small bin is aliased to the large bin where its deficit starts
+        idx = np.searchsorted(excess_end, deficit_start, side="right")
+        alias[idx_small] = idx_large[np.clip(idx, 0, len(idx_large) - 1)]
+
+        # large bins give away more than their excess and are aliased to the next one
+        idx = np.searchsorted(deficit_start, excess_end, side="left") - 1
+        overshoot = np.where(idx >= 0, deficit_end[idx], 0) - excess_end
+        prob[idx_large] = 1 - np.clip(overshoot, 0, 1)
+        alias[idx_large[:-1]] = idx_large[1:]
+        prob[idx_large[-1]] = 1
+        return prob, alias
+
+    def sample_axis(self, random_state=None):
         """Sample along a given axis.
 
+        Parameters
+        ----------
+        random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
+            Random state used for this draw. By default the random state
+            of the sampler is used.
+
         Returns
         -------
         index : tuple of `~numpy.ndarray`
             Coordinates of the drawn sample.
         """
-        choices = self.random_state.uniform(high=1, size=len(self.cdf))
-        shape_cdf = self.cdf.shape
+        random_state = self._get_random_state(random_state)
+        choices = random_state.uniform(high=1, size=len(self.cdf))
+        n_bins = self.cdf.shape[1]
 
-        cdf_all = np.insert(self.cdf, 0, 0, axis=1)
-        edges = np.arange(shape_cdf[1] + 1) - 0.5
+        # vectorised equivalent of np.interp(choice, [0, *cdf], edges) per row
+        idx = np.sum(self.cdf <= choices[:, np.newaxis], axis=1)
+        idx = np.clip(idx, 0, n_bins - 1)
 
-        pix_coords = []
+        rows = np.arange(len(self.cdf))
+        cdf_hi = self.cdf[rows, idx]
+        cdf_lo = np.where(idx > 0, self.cdf[rows, idx - 1], 0)
 
-        for cdf, choice in zip(cdf_all, choices):
-            pix = np.interp(choice, cdf, edges)
-            pix_coords.append(pix)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frac = (choices - cdf_lo) / (cdf_hi - cdf_lo)
 
-        return np.array(pix_coords)
+        frac = np.clip(np.nan_to_num(frac), 0, 1)
+        return idx - 0.5 + frac
 
-    def sample(self, size):
+    def sample(self, size, random_state=None):
         """Draw sample from the given PDF.
 
         Parameters
         ----------
         size : int
             Number of samples to draw.
+        random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
+            Random state used for this draw. By default the random state
+            of the sampler is used.
 
         Returns
         -------
         index : tuple of `~numpy.ndarray`
             Coordinates of the drawn sample.
         """
-        # pick numbers which are uniformly random over the cumulative distribution function
-        choice = self.random_state.uniform(high=1, size=size)
+        random_state = self._get_random_state(random_state)
 
-        # find the indices corresponding to this point on the CDF
-        index = np.searchsorted(self.cdf, choice)
-        index = self.sortindex[index]
+        if self.method == "alias":
+            index = random_state.randint(len(self.alias_prob), size=size)
+            choice = random_state.uniform(high=1, size=size)
+            reject = choice >= self.alias_prob[index]
+            index[reject] = self.alias_index[index[reject]]
+        else:
+            # pick numbers which are uniformly random over the cumulative distribution function
+            choice = random_state.uniform(high=1, size=size)
+
+            # find the indices corresponding to this point on the CDF
+            index = np.searchsorted(self.cdf, choice)
+            index = self.sortindex[index]
 
         # map back to multi-dimensional indexing
         index = np.unravel_index(index, self.pdf_shape)
         index = np.vstack(index)
 
-        index = index + self.random_state.uniform(low=-0.5, high=0.5, size=index.shape)
+        index = index + random_state.uniform(low=-0.5, high=0.5, size=index.shape)
         return index
+
+    def sample_chunks(self, size, chunk_size=1000000, random_state=None):
+        """Draw sample from the given PDF in chunks.
+
+        This allows to process a large number of samples while keeping the
+        memory usage bounded by the chunk size.
+
+        Parameters
+        ----------
+        size : int
+            Total number of samples to draw.
+        chunk_size : int
+            Maximum number of samples per chunk.
+        random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
+            Random state used for this draw. By default the random state
+            of the sampler is used.
+
+        Yields
+        ------
+        index : `~numpy.ndarray`
+            Coordinates of the drawn sample for each chunk.
+        """
+        random_state = self._get_random_state(random_state)
+
+        for start in range(0, size, chunk_size):
+            yield self.sample(min(chunk_size, size - start), random_state=random_state)
+
+    def _get_random_state(self, random_state):
+        if random_state is None:
+            return self.random_state
+
+        return get_random_state(random_state)
@@ -62,3 +62,40 @@ def test_axis_sampling():
     x_sampled = np.interp(idx, np.arange(n_sampled), x)
 
     assert_allclose(x_sampled, [0.012266, 0.43081], rtol=1e-4)
+
+
+def test_norm_dist_sampling_alias():
+    n_sampled = 1000
+    x = np.linspace(-2, 2, n_sampled)
+
+    mu, sigma = 0, 0.1
+    pdf = gauss_dist(x=x, mu=mu, sigma=sigma)
+    sampler = InverseCDFSampler(pdf=pdf, random_state=0, method="alias")
+
+    idx = sampler.sample(int(1e5))
+    x_sampled = np.interp(idx, np.arange(n_sampled), x)
+
+    assert_allclose(np.mean(x_sampled), mu, atol=0.01)
+    assert_allclose(np.std(x_sampled), sigma, atol=0.005)
+
+
+def test_alias_table():
+    pdf = np.array([1.0, 0, 3, 0.5, 6, 0.5])
+    prob, alias = InverseCDFSampler._make_alias_table(pdf / pdf.sum())
+
+    mass = prob / len(pdf)
+    np.add.at(mass, alias, (1 - prob) / len(pdf))
+    assert_allclose(mass, pdf / pdf.sum())
+
+
+def test_sample_random_state_and_chunks():
+    pdf = uniform_dist(np.linspace(-2, 2, 100), a=-1, b=1)
+    sampler = InverseCDFSampler(pdf=pdf)
+
+    idx_1 = sampler.sample(10, random_state=1)
+    idx_2 = sampler.sample(10, random_state=1)
+    assert_allclose(idx_1, idx_2)
+
+    chunks = list(sampler.sample_chunks(25, chunk_size=10, random_state=1))
+    assert [chunk.shape[1] for chunk in chunks] == [10, 10, 5]
+    assert_allclose(chunks[0], idx_1)
@@ -1,6 +1,14 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
-from gammapy.utils.array import array_stats_str, shape_2N
+from numpy.testing import assert_allclose
+import scipy.signal
+from astropy.convolution import Gaussian2DKernel, Ring2DKernel, Tophat2DKernel
+from gammapy.utils.array import (
+    array_stats_str,
+    iter_scale_space,
+    scale_cube,
+    shape_2N,
+)
 
 
 def test_array_stats_str():
@@ -15,3 +23,22 @@ def test_shape_2N():
     shape = (34, 89, 120, 444)
     expected_shape = (40, 96, 128, 448)
     assert expected_shape == shape_2N(shape=shape, N=3)
+
+
+def test_iter_scale_space():
+    rng = np.random.RandomState(0)
+    data = {"a": rng.poisson(5, (40, 31)), "b": rng.uniform(size=(40, 31))}
+    kernels = [Tophat2DKernel(2), Ring2DKernel(3, 2), Gaussian2DKernel(1.5)]
+
+    images = list(iter_scale_space(data, kernels))
+    assert len(images) == 3
+
+    for kernel, image in zip(kernels[:2], images[:2]):
+        for key, value in data.items():
+            expected = scipy.signal.fftconvolve(value, kernel.array, mode="same")
+            assert image[key].shape == (40, 31)
+            assert_allclose(image[key], expected, rtol=1e-10, atol=1e-12)
+
+    cube = scale_cube(data["b"], kernels)
+    assert cube.shape == (40, 31, 3)
+    assert_allclose(cube[:, :, 2], images[2]["b"])
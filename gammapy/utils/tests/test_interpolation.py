@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pytest
 import numpy as np
-from gammapy.utils.interpolation import LogScale
+from gammapy.utils.interpolation import LogScale, ScaledRegularGridInterpolator
 from gammapy.utils.testing import assert_allclose
 
 
@@ -12,3 +13,29 @@ def test_LogScale_inverse():
     assert_allclose(log_values, np.array([0, np.log(1e-5), np.log(tiny)]))
     inv_values = log_scale.inverse(log_values)
     assert_allclose(inv_values, np.array([1, 1e-5, 0]))
+
+
+@pytest.mark.parametrize("method", ["linear", "nearest"])
+@pytest.mark.parametrize("fill_value", [None, np.nan])
+def test_scaled_regular_grid_interpolator_separable(method, fill_value):
+    x, y = np.logspace(0, 2, 10), np.linspace(0, 5, 7)
+    values = np.random.RandomState(0).uniform(1, 2, (10, 7))
+
+    interp = ScaledRegularGridInterpolator(
+        points=(x, y),
+        values=values,
+        points_scale=("log", "lin"),
+        values_scale="log",
+        fill_value=fill_value,
+    )
+
+    x_eval = np.logspace(-0.5, 2.5, 13)[:, np.newaxis, np.newaxis]
+    y_eval = np.linspace(-1, 6, 20).reshape((1, 4, 5))
+
+    actual = interp((x_eval, y_eval), method=method)
+    assert actual.shape == (13, 4, 5)
+
+    # points not forming an outer product grid use the generic evaluation
+    x_eval, y_eval = np.broadcast_arrays(x_eval, y_eval)
+    desired = interp((x_eval, y_eval), method=method)
+    assert_allclose(actual, desired)